@@ -0,0 +1,95 @@
+import json
+from typing import Any, Dict, List, Sequence, cast
+
+from eth_typing import URI, HexStr
+from eth_utils import to_bytes, to_text
+from eth_utils.toolz import partition_all
+from web3 import Web3
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3._utils.request import make_post_request
+from web3.contract import ContractFunction
+from web3.providers.base import BaseProvider
+from web3.providers.rpc import HTTPProvider
+
+# Most eth_calls sent in a single JSON-RPC batch request
+MAX_BATCH_SIZE = 100
+
+
+def batch_call(w3: Web3, contract_functions: Sequence[ContractFunction]) -> List[Any]:
+    """
+    Returns the result of every contract function call, as ContractFunction.call()
+    would, in as few round trips as the provider allows.
+    - Over HTTP, calls are sent as JSON-RPC batch requests of up to MAX_BATCH_SIZE
+    - Otherwise, each call is sent in a separate request
+    """
+    if not supports_batch_requests(w3.provider):
+        return [contract_function.call() for contract_function in contract_functions]
+
+    results = []
+    for batch in partition_all(MAX_BATCH_SIZE, contract_functions):
+        requests = [
+            build_call_request(request_id, contract_function)
+            for request_id, contract_function in enumerate(batch)
+        ]
+        responses = send_batch_request(cast(HTTPProvider, w3.provider), requests)
+        if len(responses) != len(requests):
+            raise ValueError(
+                f"Expected {len(requests)} responses to batch request, "
+                f"got {len(responses)}."
+            )
+        # Nodes may respond to the requests in a batch in any order
+        sorted_responses = sorted(responses, key=lambda response: response["id"])
+        for contract_function, response in zip(batch, sorted_responses):
+            if "error" in response:
+                raise ValueError(response["error"])
+            results.append(decode_call_result(contract_function, response["result"]))
+    return results
+
+
+def supports_batch_requests(provider: BaseProvider) -> bool:
+    return isinstance(provider, HTTPProvider)
+
+
+def build_call_request(
+    request_id: int, contract_function: ContractFunction
+) -> Dict[str, Any]:
+    call_transaction = {
+        "to": contract_function.address,
+        "data": contract_function._encode_transaction_data(),
+    }
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "eth_call",
+        "params": [call_transaction, "latest"],
+    }
+
+
+def send_batch_request(
+    provider: HTTPProvider, requests: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Sends a JSON-RPC batch request, and returns its responses.
+    """
+    raw_response = make_post_request(
+        cast(URI, provider.endpoint_uri),
+        to_bytes(text=json.dumps(requests)),
+        **dict(provider.get_request_kwargs()),
+    )
+    responses = json.loads(to_text(raw_response))
+    if not isinstance(responses, list):
+        # A node that rejects the whole batch responds with a single error
+        raise ValueError(responses.get("error", responses))
+    return responses
+
+
+def decode_call_result(contract_function: ContractFunction, result: HexStr) -> Any:
+    output_types = get_abi_output_types(contract_function.abi)
+    output_data = contract_function.web3.codec.decode_abi(
+        output_types, to_bytes(hexstr=result)
+    )
+    normalized_data = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, output_data)
+    if len(normalized_data) == 1:
+        return normalized_data[0]
+    return normalized_data
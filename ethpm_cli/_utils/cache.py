@@ -0,0 +1,194 @@
+import os
+from pathlib import Path
+import tempfile
+import threading
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from eth_utils import to_list
+from ethpm._utils.ipfs import extract_ipfs_path_from_uri, generate_file_hash
+from ethpm.backends.ipfs import BaseIPFSBackend
+
+from ethpm_cli._utils.xdg import get_xdg_ethpmcli_root
+from ethpm_cli.constants import (
+    BLOB_CACHE_DIR,
+    BLOB_CACHE_SIZE_ENV_VAR,
+    DEFAULT_BLOB_CACHE_SIZE,
+    IPFS_CHUNK_SIZE,
+)
+from ethpm_cli.exceptions import ValidationError
+
+
+class CacheStats(NamedTuple):
+    path: Path
+    blob_count: int
+    total_size: int
+    max_size: int
+
+
+def is_valid_ipfs_blob(ipfs_hash: str, contents: bytes) -> bool:
+    """
+    Returns whether contents match their IPFS hash. generate_file_hash only
+    reproduces the hash of blobs IPFS stores unchunked, so (like ethpm's IPFS
+    backends) larger blobs are assumed valid.
+    """
+    if len(contents) > IPFS_CHUNK_SIZE:
+        return True
+    return generate_file_hash(contents) == ipfs_hash
+
+
+class BlobCache:
+    """
+    Persistent, content-addressed store for fetched IPFS blobs.
+    - Blobs are keyed by their IPFS hash and re-hashed on every read
+    - Total size is bounded, least recently used blobs are evicted first
+    - The total size is read from disk once, then tracked as blobs are written
+    """
+
+    def __init__(self, cache_dir: Path, max_size: int) -> None:
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self._total_size: Optional[int] = None
+        self._size_lock = threading.Lock()
+
+    def blob_path(self, ipfs_hash: str) -> Path:
+        return self.cache_dir / ipfs_hash[:4] / ipfs_hash
+
+    def get(self, ipfs_hash: str) -> Optional[bytes]:
+        blob_path = self.blob_path(ipfs_hash)
+        try:
+            contents = blob_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+        if not is_valid_ipfs_blob(ipfs_hash, contents):
+            # Corrupted or truncated blob, drop it and treat as a miss.
+            blob_path.unlink()
+            return None
+
+        # Bump mtime to mark this blob as the most recently used.
+        os.utime(blob_path)
+        return contents
+
+    def put(self, ipfs_hash: str, contents: bytes) -> None:
+        if len(contents) > self.max_size:
+            return
+
+        blob_path = self.blob_path(ipfs_hash)
+        blob_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            replaced_size = blob_path.stat().st_size
+        except FileNotFoundError:
+            replaced_size = 0
+        # Write to a sibling tmp file and rename, so readers never see partial blobs.
+        fd, tmp_path = tempfile.mkstemp(dir=blob_path.parent)
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(contents)
+        Path(tmp_path).replace(blob_path)
+
+        with self._size_lock:
+            if self._total_size is None:
+                # Read once from disk, which already includes this blob
+                self._total_size = self.stats().total_size
+            else:
+                self._total_size += len(contents) - replaced_size
+            over_limit = self._total_size > self.max_size
+        if over_limit:
+            self.prune()
+
+    def prune(self, max_size: int = None) -> Tuple[int, int]:
+        """
+        Evicts least recently used blobs until the cache fits within max_size.
+        Returns the number of blobs evicted and the number of bytes freed.
+        """
+        if max_size is None:
+            max_size = self.max_size
+
+        with self._size_lock:
+            blobs = self.get_blobs()
+            total_size = sum(size for _, size, _ in blobs)
+            evicted_count = 0
+            freed_size = 0
+            for blob_path, size, _ in sorted(blobs, key=lambda blob: blob[2]):
+                if total_size - freed_size <= max_size:
+                    break
+                try:
+                    blob_path.unlink()
+                except FileNotFoundError:
+                    # Already evicted by a concurrent writer.
+                    pass
+                evicted_count += 1
+                freed_size += size
+            self._total_size = total_size - freed_size
+        return evicted_count, freed_size
+
+    def stats(self) -> CacheStats:
+        blobs = self.get_blobs()
+        total_size = sum(size for _, size, _ in blobs)
+        return CacheStats(self.cache_dir, len(blobs), total_size, self.max_size)
+
+    @to_list
+    def get_blobs(self) -> Iterable[Tuple[Path, int, float]]:
+        if not self.cache_dir.is_dir():
+            return
+        for shard_dir in self.cache_dir.iterdir():
+            if not shard_dir.is_dir():
+                continue
+            for blob_path in shard_dir.iterdir():
+                if not blob_path.name.startswith(shard_dir.name):
+                    continue
+                try:
+                    blob_stat = blob_path.stat()
+                except FileNotFoundError:
+                    continue
+                yield blob_path, blob_stat.st_size, blob_stat.st_mtime
+
+
+class CachedIPFSBackend(BaseIPFSBackend):
+    """
+    IPFS backend that serves reads from a local BlobCache before falling
+    back to the upstream backend. The upstream backend is only built on a miss.
+    """
+
+    def __init__(
+        self, upstream_factory: Callable[[], BaseIPFSBackend], cache: BlobCache
+    ) -> None:
+        self.upstream_factory = upstream_factory
+        self.cache = cache
+        self._upstream: Optional[BaseIPFSBackend] = None
+        self._upstream_lock = threading.Lock()
+
+    @property
+    def upstream(self) -> BaseIPFSBackend:
+        # Locked, since assets may be fetched from several threads at once.
+        with self._upstream_lock:
+            if self._upstream is None:
+                self._upstream = self.upstream_factory()
+        return self._upstream
+
+    def fetch_uri_contents(self, uri: str) -> bytes:
+        ipfs_hash = extract_ipfs_path_from_uri(uri)
+        cached_contents = self.cache.get(ipfs_hash)
+        if cached_contents is not None:
+            return cached_contents
+
+        contents = self.upstream.fetch_uri_contents(uri)
+        self.cache.put(ipfs_hash, contents)
+        return contents
+
+    def pin_assets(self, file_or_dir_path: Path) -> List[Dict[str, str]]:
+        return self.upstream.pin_assets(file_or_dir_path)
+
+
+def get_blob_cache() -> BlobCache:
+    cache_dir = get_xdg_ethpmcli_root() / BLOB_CACHE_DIR
+    if BLOB_CACHE_SIZE_ENV_VAR in os.environ:
+        try:
+            max_size = int(os.environ[BLOB_CACHE_SIZE_ENV_VAR])
+        except ValueError:
+            raise ValidationError(
+                f"{BLOB_CACHE_SIZE_ENV_VAR} must be set to a size in bytes, "
+                f"not: {os.environ[BLOB_CACHE_SIZE_ENV_VAR]}."
+            )
+    else:
+        max_size = DEFAULT_BLOB_CACHE_SIZE
+    return BlobCache(cache_dir, max_size)
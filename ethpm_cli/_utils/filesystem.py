@@ -2,7 +2,7 @@ import contextlib
 import filecmp
 import os
 from pathlib import Path
-import shutil
+import stat
 import tempfile
 from typing import IO, TYPE_CHECKING, Any, Generator
 
@@ -54,13 +54,23 @@ def atomic_replace(path: Path) -> Generator[IO[Any], None, None]:
 
     with atomic_replace(original: Path) as file:
         file.write("new text")
+
+    The new contents are written to a tmp file next to the original,
+    which is then renamed over it, so readers never see a partial write.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_file_path = Path(tmpdir) / path.name
-        tmp_file_path.touch()
-        with tmp_file_path.open(mode="w+") as tmpfile:
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    tmp_file_path = Path(tmp_path)
+    try:
+        with os.fdopen(fd, mode="w+") as tmpfile:
             yield tmpfile
-        shutil.copyfile(tmp_file_path, path)
+        if path.is_file():
+            tmp_file_path.chmod(stat.S_IMODE(path.stat().st_mode))
+        else:
+            tmp_file_path.chmod(0o644)
+        tmp_file_path.replace(path)
+    except BaseException:
+        tmp_file_path.unlink()
+        raise
 
 
 def is_package_installed(package_name: str, config: "Config") -> bool:
@@ -1,11 +1,25 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 import json
+import logging
+import os
 from pathlib import Path
-from typing import Tuple
+import tempfile
+import threading
+from types import TracebackType
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type
 
 from eth_typing import URI
+from ethpm._utils.ipfs import extract_ipfs_path_from_uri
 from ethpm.backends.ipfs import BaseIPFSBackend, InfuraIPFSBackend, LocalIPFSBackend
+from ethpm.uri import resolve_uri_contents
 from ethpm.validation.manifest import validate_manifest_against_schema
 
+from ethpm_cli._utils.cache import CachedIPFSBackend, get_blob_cache, is_valid_ipfs_blob
+from ethpm_cli._utils.xdg import get_xdg_ethpmcli_root
+from ethpm_cli.exceptions import OfflineError
+
+logger = logging.getLogger("ethpm_cli.scraper.IPFSMirror")
+
 
 def pin_local_manifest(manifest_path: Path) -> Tuple[str, str, URI]:
     manifest_output = json.loads(manifest_path.read_text())
@@ -20,7 +34,146 @@ def pin_local_manifest(manifest_path: Path) -> Tuple[str, str, URI]:
     return (package_name, package_version, manifest_uri)
 
 
-def get_ipfs_backend(ipfs: bool = False) -> BaseIPFSBackend:
-    if ipfs:
-        return LocalIPFSBackend()
-    return InfuraIPFSBackend()
+def get_ipfs_backend(ipfs: bool = False, offline: bool = False) -> BaseIPFSBackend:
+    """
+    Returns an IPFS backend that reads assets mirrored by `ethpm scrape`, then
+    the local blob cache. The upstream node is only connected to if an asset is
+    in neither. If offline, an asset in neither raises an OfflineError instead.
+    """
+    if offline:
+        upstream_factory: Callable[[], BaseIPFSBackend] = OfflineIPFSBackend
+    elif ipfs:
+        upstream_factory = LocalIPFSBackend
+    else:
+        upstream_factory = InfuraIPFSBackend
+    return ScrapedIPFSBackend(
+        get_xdg_ethpmcli_root(), CachedIPFSBackend(upstream_factory, get_blob_cache())
+    )
+
+
+class ScrapedIPFSBackend(BaseIPFSBackend):
+    """
+    IPFS backend that serves assets from the sharded store written by
+    `ethpm scrape` (see get_ipfs_asset_path). Assets missing from the store, or
+    that don't match their IPFS hash (see is_valid_ipfs_blob), are read from
+    the fallback backend.
+    """
+
+    def __init__(self, ipfs_dir: Path, fallback: BaseIPFSBackend) -> None:
+        self.ipfs_dir = ipfs_dir
+        self.fallback = fallback
+
+    def fetch_uri_contents(self, uri: str) -> bytes:
+        ipfs_hash = extract_ipfs_path_from_uri(uri)
+        asset_path = get_ipfs_asset_path(self.ipfs_dir, ipfs_hash)
+        try:
+            contents = asset_path.read_bytes()
+        except FileNotFoundError:
+            return self.fallback.fetch_uri_contents(uri)
+
+        if not is_valid_ipfs_blob(ipfs_hash, contents):
+            return self.fallback.fetch_uri_contents(uri)
+        return contents
+
+    def pin_assets(self, file_or_dir_path: Path) -> List[Dict[str, str]]:
+        return self.fallback.pin_assets(file_or_dir_path)
+
+
+class OfflineIPFSBackend(BaseIPFSBackend):
+    """
+    IPFS backend for offline mode, which fails on any attempt to use the network.
+    """
+
+    def fetch_uri_contents(self, uri: str) -> bytes:
+        raise OfflineError(
+            f"{uri} isn't available locally, and can't be fetched in offline mode. "
+            "Run `ethpm scrape`, or drop --offline, to fetch it."
+        )
+
+    def pin_assets(self, file_or_dir_path: Path) -> List[Dict[str, str]]:
+        raise OfflineError(f"Can't pin {file_or_dir_path} to IPFS in offline mode.")
+
+
+class PrefetchedIPFSBackend(BaseIPFSBackend):
+    """
+    IPFS backend that serves assets fetched ahead of time, keyed by IPFS hash.
+    Anything that wasn't prefetched is read from the fallback backend.
+    """
+
+    def __init__(self, assets: Dict[str, bytes], fallback: BaseIPFSBackend) -> None:
+        self.assets = assets
+        self.fallback = fallback
+
+    def fetch_uri_contents(self, uri: str) -> bytes:
+        ipfs_hash = extract_ipfs_path_from_uri(uri)
+        if ipfs_hash in self.assets:
+            return self.assets[ipfs_hash]
+        return self.fallback.fetch_uri_contents(uri)
+
+    def pin_assets(self, file_or_dir_path: Path) -> List[Dict[str, str]]:
+        return self.fallback.pin_assets(file_or_dir_path)
+
+
+def get_ipfs_asset_path(ipfs_dir: Path, ipfs_hash: str) -> Path:
+    """
+    ipfs uri: QmdvZEW3AaUntDfFkcbdnYzeLAAeD4YFeixQsdmHF88T6Q
+    dir store: ipfs_dir/Qm/dv/ZE/QmdvZEW3AaUntDfFkcbdnYzeLAAeD4YFeixQsdmHF88T6Q
+    """
+    return ipfs_dir / ipfs_hash[0:2] / ipfs_hash[2:4] / ipfs_hash[4:6] / ipfs_hash
+
+
+class IPFSMirror:
+    """
+    Mirrors IPFS assets into the sharded store under ipfs_dir.
+    - Each CID is fetched at most once per mirror, however many workers request it
+    - Downloads run on a bounded pool of workers
+    """
+
+    def __init__(self, ipfs_dir: Path, jobs: int) -> None:
+        self.ipfs_dir = ipfs_dir
+        self.executor = ThreadPoolExecutor(max_workers=jobs)
+        self._mirrored: Dict[str, "Future[Path]"] = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "IPFSMirror":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.executor.shutdown()
+
+    def submit(self, uri: URI) -> "Future[Path]":
+        ipfs_hash = extract_ipfs_path_from_uri(uri)
+        with self._lock:
+            if ipfs_hash not in self._mirrored:
+                self._mirrored[ipfs_hash] = self.executor.submit(
+                    self._write_asset, uri, ipfs_hash
+                )
+            return self._mirrored[ipfs_hash]
+
+    def mirror(self, uris: Iterable[URI]) -> None:
+        for asset_future in [self.submit(uri) for uri in uris]:
+            asset_future.result()
+
+    def fetch(self, uri: URI) -> bytes:
+        return self.submit(uri).result().read_bytes()
+
+    def _write_asset(self, uri: URI, ipfs_hash: str) -> Path:
+        asset_dest_path = get_ipfs_asset_path(self.ipfs_dir, ipfs_hash)
+        if asset_dest_path.is_file():
+            return asset_dest_path
+
+        contents = resolve_uri_contents(uri)
+        asset_dest_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a sibling tmp file and rename, so an interrupted scrape never
+        # leaves a partial asset in the store.
+        fd, tmp_path = tempfile.mkstemp(dir=asset_dest_path.parent)
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(contents)
+        Path(tmp_path).replace(asset_dest_path)
+        logger.info("%s written to\n %s.\n", uri, asset_dest_path)
+        return asset_dest_path
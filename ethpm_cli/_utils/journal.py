@@ -0,0 +1,29 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from ethpm_cli._utils.filesystem import atomic_replace
+from ethpm_cli.constants import JOURNAL_NAME
+
+
+def write_journal(ethpm_dir: Path, entry: Dict[str, Any]) -> None:
+    """
+    Records an in-flight operation on an ethPM directory, so that it can be
+    recovered if the operation is interrupted before it clears the journal.
+    """
+    with atomic_replace(ethpm_dir / JOURNAL_NAME) as journal_file:
+        journal_file.write(json.dumps(entry, sort_keys=True, indent=4))
+        journal_file.write("\n")
+
+
+def read_journal(ethpm_dir: Path) -> Optional[Dict[str, Any]]:
+    journal_path = ethpm_dir / JOURNAL_NAME
+    if not journal_path.is_file():
+        return None
+    return json.loads(journal_path.read_text())
+
+
+def clear_journal(ethpm_dir: Path) -> None:
+    journal_path = ethpm_dir / JOURNAL_NAME
+    if journal_path.is_file():
+        journal_path.unlink()
@@ -0,0 +1,62 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from eth_utils import to_list
+
+from ethpm_cli.exceptions import ValidationError
+
+
+class BlockRangeSet:
+    """
+    Sorted set of non-overlapping, inclusive block ranges.
+    - Coverage queries are a binary search over the range boundaries
+    - Overlapping and adjacent ranges are merged on insert
+    """
+
+    def __init__(self, ranges: Iterable[Tuple[int, int]] = ()) -> None:
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+        for start, end in ranges:
+            self.add(start, end)
+
+    @classmethod
+    def from_chain_data(cls, scraped_blocks: List[Dict[str, str]]) -> "BlockRangeSet":
+        """
+        :scraped_blocks: [{"min": "0", "max": "2"}, {"min": "4", "max": "4"}]
+        """
+        return cls(
+            (int(blocks["min"]), int(blocks["max"])) for blocks in scraped_blocks
+        )
+
+    @to_list
+    def to_chain_data(self) -> Iterable[Dict[str, str]]:
+        for start, end in self:
+            yield {"min": str(start), "max": str(end)}
+
+    def add(self, start: int, end: int) -> None:
+        if start > end:
+            raise ValidationError(f"Invalid block range: {start} - {end}.")
+        # Ranges within [lo, hi) overlap or touch the new range, and are merged into it
+        lo = bisect_left(self.ends, start - 1)
+        hi = bisect_right(self.starts, end + 1)
+        if lo < hi:
+            start = min(start, self.starts[lo])
+            end = max(end, self.ends[hi - 1])
+        self.starts[lo:hi] = [start]
+        self.ends[lo:hi] = [end]
+
+    def covers(self, start: int, end: int) -> bool:
+        """
+        Returns True if every block from start to end (inclusive) is in the set.
+        """
+        index = bisect_right(self.starts, start) - 1
+        return index >= 0 and self.ends[index] >= end
+
+    def __contains__(self, block: object) -> bool:
+        return isinstance(block, int) and self.covers(block, block)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(zip(self.starts, self.ends))
+
+    def __len__(self) -> int:
+        return len(self.starts)
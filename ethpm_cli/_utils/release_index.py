@@ -0,0 +1,125 @@
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Dict, List, NamedTuple, Tuple
+
+from eth_typing import URI, ChecksumAddress
+
+
+class Release(NamedTuple):
+    package_name: str
+    version: str
+    manifest_uri: URI
+    block_number: int
+    transaction_hash: str
+    log_index: int
+
+
+class IndexedRelease(NamedTuple):
+    chain_id: int
+    registry_address: ChecksumAddress
+    release: Release
+
+    @property
+    def registry_uri(self) -> URI:
+        return URI(f"erc1319://{self.registry_address}:{self.chain_id}")
+
+
+RELEASE_INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS releases (
+    chain_id INTEGER NOT NULL,
+    registry_address TEXT NOT NULL,
+    package_name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    manifest_uri TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    transaction_hash TEXT NOT NULL,
+    log_index INTEGER NOT NULL,
+    PRIMARY KEY (chain_id, transaction_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS releases_by_package ON releases (package_name, version);
+CREATE INDEX IF NOT EXISTS releases_by_registry
+    ON releases (chain_id, registry_address, package_name);
+"""
+
+
+class ReleaseIndex:
+    """
+    Local SQLite index of every VersionRelease event found by the scraper.
+    - Releases are keyed by the log that emitted them, so re-scraping is idempotent
+    - Queryable by package name, version, registry and chain
+    - Safe to share between threads scraping different chains
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        self.connection = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.connection.executescript(RELEASE_INDEX_SCHEMA)
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add_releases(
+        self, chain_id: int, releases_by_registry: Dict[ChecksumAddress, List[Release]]
+    ) -> None:
+        rows = [
+            (chain_id, registry_address) + tuple(release)
+            for registry_address, releases in releases_by_registry.items()
+            for release in releases
+        ]
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO releases (chain_id, registry_address, "
+                "package_name, version, manifest_uri, block_number, transaction_hash, "
+                "log_index) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+    def remove_releases(self, chain_id: int, from_block: int) -> None:
+        """
+        Removes every release on chain_id from from_block onwards, e.g. after
+        those blocks were orphaned by a reorg.
+        """
+        with self._lock, self.connection:
+            self.connection.execute(
+                "DELETE FROM releases WHERE chain_id = ? AND block_number >= ?",
+                (chain_id, from_block),
+            )
+
+    def search(
+        self,
+        package_name: str = None,
+        version: str = None,
+        registry_address: ChecksumAddress = None,
+        chain_id: int = None,
+    ) -> Tuple[IndexedRelease, ...]:
+        """
+        Returns all indexed releases matching the given filters, in the order
+        they were released. package_name matches any name that contains it.
+        """
+        filters: List[Tuple[str, object]] = []
+        if package_name:
+            filters.append(("package_name LIKE ?", f"%{package_name}%"))
+        if version:
+            filters.append(("version = ?", version))
+        if registry_address:
+            filters.append(("registry_address = ?", registry_address))
+        if chain_id:
+            filters.append(("chain_id = ?", chain_id))
+        return self._select(filters)
+
+    def _select(self, filters: List[Tuple[str, object]]) -> Tuple[IndexedRelease, ...]:
+        clauses, params = zip(*filters) if filters else ((), ())
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        with self._lock:
+            rows = self.connection.execute(
+                "SELECT chain_id, registry_address, package_name, version, "
+                "manifest_uri, block_number, transaction_hash, log_index "
+                f"FROM releases {where}ORDER BY chain_id, block_number, log_index",
+                params,
+            ).fetchall()
+        return tuple(
+            IndexedRelease(chain_id, registry_address, Release(*release))
+            for chain_id, registry_address, *release in rows
+        )
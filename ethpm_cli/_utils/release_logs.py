@@ -0,0 +1,167 @@
+import functools
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Tuple
+
+from eth_typing import ChecksumAddress, HexStr
+from eth_utils import encode_hex, event_abi_to_log_topic
+import requests
+from web3 import Web3
+from web3._utils.events import get_event_data
+from web3.types import FilterParams
+
+from ethpm_cli.constants import MAX_BATCH_SIZE, MIN_BATCH_SIZE, VERSION_RELEASE_ABI
+
+logger = logging.getLogger("ethpm_cli.release_logs")
+
+# Initial size (in blocks) of the adaptive eth_getLogs window
+BATCH_SIZE = 5000
+# Responses faster than this (in seconds) grow the eth_getLogs window
+FAST_RESPONSE_TIME = 1.0
+# Error messages returned by providers that reject a block range as too large
+LOG_RANGE_ERROR_MESSAGES = (
+    "query returned more than",
+    "block range",
+    "response size exceeded",
+    "query timeout exceeded",
+)
+# Error messages returned by providers that rate limit requests
+RATE_LIMIT_ERROR_MESSAGES = ("rate limit", "too many requests")
+# Retries of a rate limited eth_getLogs request, and the first delay (in seconds)
+# between them, which doubles on every retry
+RATE_LIMIT_RETRIES = 5
+RATE_LIMIT_BACKOFF = 1.0
+
+
+class AdaptiveBatchSize:
+    """
+    Size of the block window used to request logs, shared by all log workers.
+    - Grows while responses come back empty or fast
+    - Shrinks when a provider rejects a window as too large or times out
+    - After a rejection, fast responses only grow the window up to half of the
+      rejected size, until an empty response shows the blocks are sparse again
+    """
+
+    def __init__(
+        self, min_size: int, max_size: int, initial_size: int = BATCH_SIZE
+    ) -> None:
+        self.min_size = min_size
+        self.max_size = max_size
+        self.size = min(max(initial_size, min_size), max_size)
+        self.ceiling = max_size
+        self._lock = threading.Lock()
+
+    def record_success(self, log_count: int, response_time: float) -> None:
+        with self._lock:
+            if log_count == 0:
+                self.ceiling = self.max_size
+                self.size = min(self.size * 2, self.max_size)
+            elif response_time < FAST_RESPONSE_TIME:
+                self.size = max(min(self.size * 2, self.ceiling), self.size)
+
+    def record_failure(self, failed_size: int) -> None:
+        with self._lock:
+            self.ceiling = max(min(self.ceiling, failed_size // 2), self.min_size)
+            self.size = max(min(self.size, failed_size // 2), self.min_size)
+
+
+def get_block_version_release_logs(
+    w3: Web3,
+    from_block: int,
+    to_block: int,
+    batch_size: AdaptiveBatchSize = None,
+    address: ChecksumAddress = None,
+) -> List[Dict[str, Any]]:
+    """
+    Returns all VersionRelease logs from from_block to to_block (inclusive),
+    requested in windows sized by batch_size. Windows rejected by the provider
+    are split in half and retried, down to a single block. Rate limited windows
+    are retried after a backoff, without being split. If an address is given,
+    only logs emitted by that contract are requested.
+    """
+    if batch_size is None:
+        batch_size = AdaptiveBatchSize(MIN_BATCH_SIZE, MAX_BATCH_SIZE)
+
+    all_logs: List[Dict[str, Any]] = []
+    window_size = batch_size.size
+    window_start = from_block
+    rate_limit_retries = 0
+    while window_start <= to_block:
+        window_end = min(window_start + window_size - 1, to_block)
+        request_time = time.monotonic()
+        try:
+            logs = get_version_release_logs_in_window(
+                w3, window_start, window_end, address
+            )
+        except (
+            ValueError,
+            requests.exceptions.HTTPError,
+            requests.exceptions.Timeout,
+        ) as exc:
+            if is_rate_limit_error(exc) and rate_limit_retries < RATE_LIMIT_RETRIES:
+                backoff = RATE_LIMIT_BACKOFF * 2 ** rate_limit_retries
+                logger.debug("Rate limited by provider, retrying in %.1fs.", backoff)
+                time.sleep(backoff)
+                rate_limit_retries += 1
+                continue
+
+            failed_size = window_end - window_start + 1
+            if failed_size == 1 or not is_log_range_error(exc):
+                raise
+            logger.debug(
+                "Block range: %d - %d rejected by provider, splitting range.",
+                window_start,
+                window_end,
+            )
+            batch_size.record_failure(failed_size)
+            window_size = failed_size // 2
+            continue
+
+        batch_size.record_success(len(logs), time.monotonic() - request_time)
+        rate_limit_retries = 0
+        all_logs.extend(logs)
+        window_size = batch_size.size
+        window_start = window_end + 1
+    return all_logs
+
+
+def is_log_range_error(exc: Exception) -> bool:
+    if isinstance(exc, requests.exceptions.Timeout):
+        return True
+    return any(message in str(exc).lower() for message in LOG_RANGE_ERROR_MESSAGES)
+
+
+def is_rate_limit_error(exc: Exception) -> bool:
+    if isinstance(exc, requests.exceptions.HTTPError):
+        return exc.response is not None and exc.response.status_code == 429
+    return any(message in str(exc).lower() for message in RATE_LIMIT_ERROR_MESSAGES)
+
+
+def get_version_release_logs_in_window(
+    w3: Web3, from_block: int, to_block: int, address: ChecksumAddress = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetches VersionRelease logs with a single, stateless eth_getLogs request,
+    rather than installing a filter on the node.
+    """
+    event_abi, event_topic = get_version_release_event()
+    filter_params: FilterParams = {
+        "fromBlock": from_block,
+        "toBlock": to_block,
+        "topics": [event_topic],
+    }
+    if address is not None:
+        filter_params["address"] = address
+    logs = w3.eth.getLogs(filter_params)
+    return [get_event_data(w3.codec, event_abi, log) for log in logs]
+
+
+@functools.lru_cache(maxsize=None)
+def get_version_release_event() -> Tuple[Dict[str, Any], HexStr]:
+    event_abi = next(
+        abi
+        for abi in VERSION_RELEASE_ABI
+        if abi["type"] == "event" and abi["name"] == "VersionRelease"
+    )
+    return event_abi, encode_hex(event_abi_to_log_topic(event_abi))
@@ -0,0 +1,64 @@
+from bisect import bisect_left, insort
+import json
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from web3 import Web3
+
+from ethpm_cli._utils.filesystem import atomic_replace
+
+
+class BlockTimestampIndex:
+    """
+    Sparse block number -> timestamp index for a single chain.
+    - Every block timestamp looked up is recorded, and seeds later searches
+    - Anchors cache the block found for a target timestamp
+    - If index_path is set, the index is loaded from and saved to disk
+    """
+
+    def __init__(self, index_path: Optional[Path] = None) -> None:
+        self.index_path = index_path
+        self.timestamps: Dict[int, int] = {}
+        self.anchors: Dict[int, int] = {}
+        if index_path is not None and index_path.is_file():
+            index_data = json.loads(index_path.read_text())
+            self.timestamps = {
+                int(block): timestamp
+                for block, timestamp in index_data["timestamps"].items()
+            }
+            self.anchors = {
+                int(timestamp): block
+                for timestamp, block in index_data["anchors"].items()
+            }
+        self.blocks: List[int] = sorted(self.timestamps)
+
+    def get_timestamp(self, w3: Web3, block_number: int) -> int:
+        if block_number not in self.timestamps:
+            self.timestamps[block_number] = w3.eth.getBlock(block_number)["timestamp"]
+            insort(self.blocks, block_number)
+        return self.timestamps[block_number]
+
+    def get_known_timestamp(self, block_number: int) -> Optional[int]:
+        return self.timestamps.get(block_number)
+
+    def get_indexed_blocks(self, from_block: int, to_block: int) -> List[int]:
+        """
+        Returns all indexed block numbers from from_block up to (not including) to_block.
+        """
+        start_index = bisect_left(self.blocks, from_block)
+        end_index = bisect_left(self.blocks, to_block)
+        return self.blocks[start_index:end_index]
+
+    def save(self) -> None:
+        if self.index_path is None:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_data = {
+            "anchors": {
+                str(timestamp): block for timestamp, block in self.anchors.items()
+            },
+            "timestamps": {str(block): self.timestamps[block] for block in self.blocks},
+        }
+        with atomic_replace(self.index_path) as index_file:
+            index_file.write(json.dumps(index_data, sort_keys=True, indent=4))
+            index_file.write("\n")
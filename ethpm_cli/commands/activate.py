@@ -17,7 +17,7 @@ from ethpm_cli._utils.logger import cli_logger
 from ethpm_cli._utils.shellart import bold_blue, bold_green, bold_white
 from ethpm_cli.commands.package import Package
 from ethpm_cli.config import Config, setup_w3
-from ethpm_cli.exceptions import InstallError, UriNotSupportedError
+from ethpm_cli.exceptions import InstallError, UriNotSupportedError, ValidationError
 
 SUPPORTED_SCHEMES = ["http", "https", "ipfs", "etherscan", "erc1319", "ethpm"]
 
@@ -101,6 +101,9 @@ def activate_package(args: Namespace, config: Config) -> None:
     else:
         num_deployments = 0
 
+    # Web3 instances are shared by deployments and the console, and set up lazily
+    w3_cache = Web3Cache(config.private_key)
+
     if num_contract_types > 0:
         available_factories = generate_contract_factories(pkg)
         if len(available_factories) > 0:
@@ -121,7 +124,7 @@ def activate_package(args: Namespace, config: Config) -> None:
         factories_banner = "No detected contract types.\n"
 
     if num_deployments > 0:
-        available_instances = generate_deployments(pkg, config)
+        available_instances = generate_deployments(pkg, w3_cache)
         formatted_instances = list_keys_for_display(available_instances)
         deployments_banner = (
             f"Successfully generated {len(available_instances)} contract "
@@ -143,9 +146,13 @@ def activate_package(args: Namespace, config: Config) -> None:
             "Use the --keyfile-password flag to enable automatic signing.\n"
         )
 
-    available_w3s = get_w3s(config)
-    formatted_w3s = list_keys_for_display(available_w3s)
-    web3_banner = "Available Web3 Instances\n" f"{''.join(formatted_w3s)}\n"
+    formatted_w3s = list_keys_for_display(get_w3_chain_ids())
+    web3_banner = (
+        "Available Web3 Instances\n"
+        f"{''.join(formatted_w3s)}\n"
+        "Each Web3 instance is set up the first time it's used. To get one by "
+        f"chain name, call `{bold_white('get_w3(chain_name)')}`.\n\n"
+    )
 
     banner = (
         f"{factories_banner}{deployments_banner}{web3_banner}{auth_banner}\n"
@@ -153,15 +160,17 @@ def activate_package(args: Namespace, config: Config) -> None:
         f"{bold_white('https://web3py.readthedocs.io/en/stable/contracts.html')}\n\n"
         "Starting IPython console... "
     )
-    helper_fns = {"get_factory": get_factory}
+    helper_fns = {"get_factory": get_factory, "get_w3": w3_cache.get_by_name}
     embed(
-        user_ns={
-            **available_factories,
-            **available_instances,
-            # ignore b/c conflicting types w/in dict values
-            **available_w3s,  # type: ignore
-            **helper_fns,  # type: ignore
-        },
+        user_ns=ConsoleNamespace(
+            w3_cache,
+            {
+                **available_factories,
+                **available_instances,
+                # ignore b/c conflicting types w/in dict values
+                **helper_fns,  # type: ignore
+            },
+        ),
         banner1=banner,
         colors="neutral",
     )
@@ -173,12 +182,53 @@ def get_factory(target_factory: Contract, target_w3: Web3) -> Type[Contract]:
     )
 
 
+class Web3Cache:
+    """
+    Web3 instances for the supported chains, keyed by chain id. Each instance
+    is only set up the first time it's needed.
+    """
+
+    def __init__(self, private_key: str = None) -> None:
+        self.private_key = private_key
+        self._w3s: Dict[int, Web3] = {}
+
+    def get(self, chain_id: int) -> Web3:
+        if chain_id not in self._w3s:
+            self._w3s[chain_id] = setup_w3(chain_id, self.private_key)
+        return self._w3s[chain_id]
+
+    def get_by_name(self, chain_name: str) -> Web3:
+        chain_ids = dict(SUPPORTED_GENESIS_HASHES.values())
+        if chain_name not in chain_ids:
+            raise ValidationError(
+                f"Chain: {chain_name} is not supported. Supported chains include: "
+                f"{list(chain_ids)}."
+            )
+        return self.get(chain_ids[chain_name])
+
+
+class ConsoleNamespace(Dict[str, Any]):
+    """
+    Namespace of the activated package's console, in which each `<chain>_w3`
+    Web3 instance is set up from the Web3Cache the first time it's used.
+    """
+
+    def __init__(self, w3_cache: Web3Cache, namespace: Dict[str, Any]) -> None:
+        super().__init__(namespace)
+        self.w3_cache = w3_cache
+
+    def __missing__(self, key: str) -> Web3:
+        w3_chain_ids = get_w3_chain_ids()
+        if key not in w3_chain_ids:
+            raise KeyError(key)
+        self[key] = self.w3_cache.get(w3_chain_ids[key])
+        return self[key]
+
+
 @to_dict
-def get_w3s(config: Config) -> Iterable[Tuple[str, Web3]]:
-    all_chain_data = [data for data in SUPPORTED_GENESIS_HASHES.values()]
-    for name, chain_id in all_chain_data:
-        w3 = setup_w3(chain_id, config.private_key)
-        yield f"{name}_w3", w3
+def get_w3_chain_ids() -> Iterable[Tuple[str, int]]:
+    for name, chain_id in SUPPORTED_GENESIS_HASHES.values():
+        yield f"{name}_w3", chain_id
 
 
 @to_tuple
@@ -202,17 +252,17 @@ def generate_contract_factories(pkg: ethpmPackage) -> Iterable[Tuple[str, Contra
 
 @to_dict
 def generate_deployments(
-    pkg: ethpmPackage, config: Config
+    pkg: ethpmPackage, w3_cache: Web3Cache
 ) -> Iterable[Tuple[str, Contract]]:
     for chain in pkg.manifest["deployments"]:
-        w3, chain_name = get_matching_w3(chain, config)
+        w3, chain_name = get_matching_w3(chain, w3_cache)
         new_pkg = pkg.update_w3(w3)
         for dep in pkg.manifest["deployments"][chain].keys():
             yield f"{chain_name}_{dep}", new_pkg.deployments.get_instance(dep)
 
 
-def get_matching_w3(chain_uri: URI, config: Config) -> Tuple[Web3, str]:
+def get_matching_w3(chain_uri: URI, w3_cache: Web3Cache) -> Tuple[Web3, str]:
     genesis_hash = parse_BIP122_uri(chain_uri)[0]
     chain_data = SUPPORTED_GENESIS_HASHES[genesis_hash]
-    web3 = setup_w3(chain_data[1], config.private_key)
+    web3 = w3_cache.get(chain_data[1])
     return web3, chain_data[0]
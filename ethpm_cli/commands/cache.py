@@ -0,0 +1,33 @@
+from ethpm_cli._utils.cache import get_blob_cache
+from ethpm_cli._utils.logger import cli_logger
+from ethpm_cli._utils.shellart import bold_blue, bold_green, bold_white
+
+
+def display_cache_stats() -> None:
+    stats = get_blob_cache().stats()
+    cli_logger.info(f"Blob cache @ {bold_white(str(stats.path))}")
+    cli_logger.info(f"Cached blobs: {bold_blue(str(stats.blob_count))}")
+    cli_logger.info(
+        f"Total size: {bold_green(format_size(stats.total_size))} "
+        f"(limit: {format_size(stats.max_size)})"
+    )
+
+
+def prune_cache(max_size: int = None) -> None:
+    cache = get_blob_cache()
+    evicted_count, freed_size = cache.prune(max_size)
+    cli_logger.info(
+        f"Evicted {bold_blue(str(evicted_count))} blobs from the cache, "
+        f"freeing {bold_green(format_size(freed_size))}."
+    )
+
+
+def format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    scaled_size = float(size)
+    for unit in ("KiB", "MiB", "GiB"):
+        scaled_size /= 1024
+        if scaled_size < 1024:
+            break
+    return f"{scaled_size:.1f} {unit}"
@@ -11,7 +11,8 @@ from ethpm.uri import create_latest_block_uri
 import requests
 
 from ethpm_cli._utils.etherscan import get_etherscan_network, is_etherscan_uri
-from ethpm_cli.config import get_ipfs_backend, setup_w3
+from ethpm_cli._utils.ipfs import get_ipfs_backend
+from ethpm_cli.config import setup_w3
 from ethpm_cli.constants import ETHERSCAN_KEY_ENV_VAR
 from ethpm_cli.exceptions import ContractNotVerified
 from ethpm_cli.validation import validate_etherscan_key_available
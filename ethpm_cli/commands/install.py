@@ -1,38 +1,66 @@
 from argparse import Namespace
-import copy
+from concurrent.futures import ThreadPoolExecutor
 import json
 import logging
+import os
 from pathlib import Path
 import shutil
 import tempfile
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
 
 from eth_typing import URI
 from eth_utils import to_dict, to_int, to_text, to_tuple
 from eth_utils.toolz import assoc, dissoc
+from ethpm._utils.ipfs import extract_ipfs_path_from_uri
 from ethpm.backends.ipfs import BaseIPFSBackend
 from ethpm.backends.registry import is_valid_registry_uri, parse_registry_uri
 from ethpm.uri import is_ipfs_uri
 
 from ethpm_cli._utils.filesystem import atomic_replace, is_package_installed
+from ethpm_cli._utils.ipfs import PrefetchedIPFSBackend
+from ethpm_cli._utils.journal import clear_journal, read_journal, write_journal
 from ethpm_cli._utils.logger import cli_logger
 from ethpm_cli._utils.shellart import bold_blue, bold_green, bold_white
-from ethpm_cli.commands.package import InstalledPackage, Package
-from ethpm_cli.commands.registry import get_active_registry
+from ethpm_cli.commands.package import (
+    InstalledPackage,
+    Package,
+    process_and_validate_raw_manifest,
+)
+from ethpm_cli.commands.registry import StoredRegistry, get_active_registry
+from ethpm_cli.commands.registry_cache import RegistryCache, get_registry_cache
 from ethpm_cli.config import Config
 from ethpm_cli.constants import (
+    DEFAULT_FETCH_JOBS,
+    DEPENDENCY_STORE_DIR,
     ETHPM_PACKAGES_DIR,
+    LATEST_VERSION,
     LOCKFILE_NAME,
     REGISTRY_STORE,
     SRC_DIR_NAME,
+    STAGING_DIR,
+)
+from ethpm_cli.exceptions import InstallError, ValidationError
+from ethpm_cli.validation import (
+    validate_fetch_jobs,
+    validate_parent_directory,
+    validate_same_registry,
 )
-from ethpm_cli.exceptions import InstallError
-from ethpm_cli.validation import validate_parent_directory, validate_same_registry
 
 logger = logging.getLogger("ethpm_cli.install")
 
+# Names used for the two sides of an update inside the staging dir
+UPDATED_PACKAGE_DIR = "updated"
+REPLACED_PACKAGE_DIR = "replaced"
 
-def install_package(package: Package, config: Config) -> None:
+
+def install_package(
+    package: Package,
+    config: Config,
+    jobs: int = DEFAULT_FETCH_JOBS,
+    dedupe: bool = False,
+) -> None:
+    validate_fetch_jobs(jobs)
+    recover_interrupted_operation(config)
     if is_package_installed(package.alias, config):
         raise InstallError(
             f"Installation conflict: Package: '{package.manifest['name']}' "
@@ -41,15 +69,25 @@ def install_package(package: Package, config: Config) -> None:
             "a different alias."
         )
 
+    # Fetch every asset in the package's dependency graph up front
+    ipfs_backend = prefetch_package_assets(package, config.ipfs_backend, jobs)
+
+    if dedupe:
+        store: Optional[DependencyStore] = DependencyStore(
+            config.ethpm_dir / DEPENDENCY_STORE_DIR, ipfs_backend
+        )
+    else:
+        store = None
+
     # Create temporary package directory
     tmp_package_dir = Path(tempfile.mkdtemp())
-    write_package_installation_files(package, tmp_package_dir, config.ipfs_backend)
+    write_package_installation_files(package, tmp_package_dir, ipfs_backend, store)
 
     # Copy temp package directory to ethpm dir namespace
     dest_package_dir = config.ethpm_dir / package.alias
     validate_parent_directory(config.ethpm_dir, dest_package_dir)
-    shutil.copytree(tmp_package_dir, dest_package_dir)
-    install_to_ethpm_lock(package, (config.ethpm_dir / LOCKFILE_NAME))
+    shutil.copytree(tmp_package_dir, dest_package_dir, symlinks=True)
+    install_to_ethpm_lock(package, (config.ethpm_dir / LOCKFILE_NAME), dedupe)
 
 
 class InstalledPackageTree(NamedTuple):
@@ -92,7 +130,7 @@ def list_installed_packages(config: Config) -> None:
     installed_packages = [
         get_installed_package_tree(base_dir)
         for base_dir in config.ethpm_dir.iterdir()
-        if base_dir.is_dir()
+        if is_package_installed(base_dir.name, config)
     ]
     for package in sorted(installed_packages):
         logger.info(package.format_for_display)
@@ -142,15 +180,94 @@ def resolve_installed_package_by_id(
 
 
 def update_package(args: Namespace, config: Config) -> None:
+    validate_fetch_jobs(args.jobs)
+    recover_interrupted_operation(config)
     if not is_package_installed(args.package, config):
         check_for_aliased_package(args.package, config)
         return
 
     installed_package = resolve_installed_package_by_id(args.package, config)
-    active_registry = get_active_registry(config.xdg_ethpmcli_root / REGISTRY_STORE)
-    if is_valid_registry_uri(installed_package.install_uri):
-        validate_same_registry(installed_package.install_uri, active_registry.uri)
+    active_registry = connect_to_active_registry(config)
+    registry_cache = get_registry_cache()
+    all_release_data = get_installed_package_releases(
+        installed_package, active_registry, registry_cache, config
+    )
+    all_versions = [version for version, _ in all_release_data]
+
+    if args.target_version:
+        target_version = resolve_target_version(
+            args.target_version, installed_package, all_release_data
+        )
+        if target_version == installed_package.resolved_version:
+            cli_logger.info(f"Version already installed: {target_version}. ")
+            return
+    else:
+        cli_logger.info(
+            f"{len(all_versions)} versions of {installed_package.resolved_package_name} "
+            f"found: {all_versions} \n"
+            f"On the active registry: {active_registry.uri}"
+        )
+        target_version = prompt_for_target_version(installed_package, all_versions)
+
+    apply_update(
+        args.package, all_release_data, target_version, config, args.jobs,
+    )
+
+
+def update_all_packages(args: Namespace, config: Config) -> None:
+    """
+    Updates every package found in the lockfile to the target version. Release
+    data for all packages is read from the active registry together. Packages
+    that can't be updated to the target version are skipped, and checked for
+    before any package is updated.
+    """
+    validate_fetch_jobs(args.jobs)
+    recover_interrupted_operation(config)
+    lockfile_path = config.ethpm_dir / LOCKFILE_NAME
+    if not lockfile_path.is_file():
+        raise InstallError(f"No packages found installed under {config.ethpm_dir}.")
+
+    package_ids = sorted(json.loads(lockfile_path.read_text()))
+    installed_packages = [
+        resolve_installed_package_by_id(package_id, config)
+        for package_id in package_ids
+    ]
+    active_registry = connect_to_active_registry(config)
+    registry_cache = get_registry_cache()
+    prefetch_installed_package_releases(
+        installed_packages, active_registry, registry_cache, config
+    )
+    all_release_data = [
+        get_updatable_package_releases(
+            installed_package, active_registry, registry_cache, config
+        )
+        for installed_package in installed_packages
+    ]
+
+    pending_updates = []
+    for package_id, installed_package, release_data in zip(
+        package_ids, installed_packages, all_release_data
+    ):
+        if release_data is None:
+            continue
+        try:
+            target_version = resolve_target_version(
+                args.target_version, installed_package, release_data
+            )
+        except InstallError as exc:
+            cli_logger.info(f"Skipping {package_id}: {exc}")
+            continue
+        if target_version == installed_package.resolved_version:
+            cli_logger.info(f"{package_id} already at version: {target_version}. ")
+        else:
+            pending_updates.append((package_id, release_data, target_version))
+
+    for package_id, release_data, target_version in pending_updates:
+        apply_update(package_id, release_data, target_version, config, args.jobs)
 
+
+def connect_to_active_registry(config: Config) -> StoredRegistry:
+    active_registry = get_active_registry(config.xdg_ethpmcli_root / REGISTRY_STORE)
     connected_chain_id = config.w3.eth.chainId
     active_registry_uri = parse_registry_uri(active_registry.uri)
     if not to_int(text=active_registry_uri.chain_id) == connected_chain_id:
@@ -160,15 +277,86 @@ def update_package(args: Namespace, config: Config) -> None:
         )
 
     config.w3.pm.set_registry(active_registry_uri.address)
-    all_package_names = config.w3.pm.get_all_package_names()
+    return active_registry
+
+
+def prefetch_installed_package_releases(
+    installed_packages: Sequence[InstalledPackage],
+    active_registry: StoredRegistry,
+    registry_cache: RegistryCache,
+    config: Config,
+) -> None:
+    """
+    Reads the releases of every installed package available on the active
+    registry into the registry cache together, rather than package by package.
+    """
+    active_registry_uri = parse_registry_uri(active_registry.uri)
+    registry_address = active_registry_uri.address
+    chain_id = to_int(text=active_registry_uri.chain_id)
+    all_package_names = registry_cache.get_package_names(
+        config.w3, registry_address, chain_id
+    )
+    registry_cache.get_all_package_releases(
+        config.w3,
+        registry_address,
+        chain_id,
+        [
+            installed_package.resolved_package_name
+            for installed_package in installed_packages
+            if installed_package.resolved_package_name in all_package_names
+        ],
+    )
+
+
+def get_updatable_package_releases(
+    installed_package: InstalledPackage,
+    active_registry: StoredRegistry,
+    registry_cache: RegistryCache,
+    config: Config,
+) -> Optional[Tuple[Tuple[str, URI], ...]]:
+    """
+    Returns all releases of an installed package on the active registry, or None
+    if the package can't be updated from the active registry (e.g. it was
+    installed from IPFS, Github or another registry).
+    """
+    try:
+        return get_installed_package_releases(
+            installed_package, active_registry, registry_cache, config
+        )
+    except (InstallError, ValidationError) as exc:
+        cli_logger.info(f"Skipping {installed_package.alias}: {exc}")
+        return None
+
+
+def get_installed_package_releases(
+    installed_package: InstalledPackage,
+    active_registry: StoredRegistry,
+    registry_cache: RegistryCache,
+    config: Config,
+) -> Tuple[Tuple[str, URI], ...]:
+    """
+    Returns all releases of an installed package on the active registry, after
+    validating that the installed release matches its on-chain counterpart.
+    Release data is read through the registry cache.
+    """
+    if is_valid_registry_uri(installed_package.install_uri):
+        validate_same_registry(installed_package.install_uri, active_registry.uri)
+
+    active_registry_uri = parse_registry_uri(active_registry.uri)
+    registry_address = active_registry_uri.address
+    chain_id = to_int(text=active_registry_uri.chain_id)
+    all_package_names = registry_cache.get_package_names(
+        config.w3, registry_address, chain_id
+    )
+
     if installed_package.resolved_package_name not in all_package_names:
         raise InstallError(
             f"{installed_package.resolved_package_name} is not available on the active registry "
             f"{active_registry.uri}. Available packages include: {all_package_names}."
         )
 
-    all_release_data = config.w3.pm.get_all_package_releases(
-        installed_package.resolved_package_name
+    all_release_data = registry_cache.get_package_releases(
+        config.w3, registry_address, chain_id, installed_package.resolved_package_name
     )
     all_versions = [version for version, _ in all_release_data]
 
@@ -187,12 +375,29 @@ def update_package(args: Namespace, config: Config) -> None:
             f"{installed_package.resolved_version}: {on_chain_install_uri} does not match the "
             f"install URI found in local lockfile: {installed_package.resolved_uri}."
         )
+    return all_release_data
 
-    cli_logger.info(
-        f"{len(all_versions)} versions of {installed_package.resolved_package_name} "
-        f"found: {all_versions} \n"
-        f"On the active registry: {active_registry.uri}"
-    )
+
+def resolve_target_version(
+    target_version: str,
+    installed_package: InstalledPackage,
+    all_release_data: Tuple[Tuple[str, str], ...],
+) -> str:
+    all_versions = [version for version, _ in all_release_data]
+    if target_version == LATEST_VERSION:
+        # Releases are returned in the order they were published on the registry
+        return all_versions[-1]
+    if target_version not in all_versions:
+        raise InstallError(
+            f"Version unavailable: {installed_package.resolved_package_name}@"
+            f"{target_version}. Available versions include: {all_versions}."
+        )
+    return target_version
+
+
+def prompt_for_target_version(
+    installed_package: InstalledPackage, all_versions: List[str]
+) -> str:
     count = 0
     while True:
         count += 1
@@ -204,31 +409,77 @@ def update_package(args: Namespace, config: Config) -> None:
         elif target_version not in all_versions:
             cli_logger.info(f"Version unavailable: {target_version}. ")
         else:
-            break
-
-    # Create an updated args/Package for new install
-    updated_args = copy.deepcopy(args)
-    if installed_package.resolved_package_name != args.package:
-        updated_args.alias = args.package
-    updated_args.uri = pluck_release_data(all_release_data, target_version)
-    updated_args.package_version = target_version
+            return target_version
+
+
+def apply_update(
+    package_id: str,
+    all_release_data: Tuple[Tuple[str, str], ...],
+    target_version: str,
+    config: Config,
+    jobs: int,
+) -> None:
+    updated_args = Namespace(
+        uri=pluck_release_data(all_release_data, target_version), alias=package_id
+    )
     updated_package = Package(updated_args, config.ipfs_backend)
+    replace_installed_package(package_id, updated_package, config, jobs)
+    cli_logger.info(f"{package_id} successfully updated to version {target_version}.")
+
+
+def replace_installed_package(
+    package_id: str, updated_package: Package, config: Config, jobs: int
+) -> None:
+    """
+    Writes the updated package to a staging dir inside the ethpm dir, then swaps
+    it in for the installed package and patches the lockfile. Only the updated
+    package is written, regardless of how many other packages are installed.
+    Packages installed in dedupe mode are updated in dedupe mode.
+    """
+    ipfs_backend = prefetch_package_assets(updated_package, config.ipfs_backend, jobs)
+    lockfile_path = config.ethpm_dir / LOCKFILE_NAME
+    installed_lock_entry = json.loads(lockfile_path.read_text())[package_id]
+    dedupe = installed_lock_entry.get("dedupe", False)
+    if dedupe:
+        store: Optional[DependencyStore] = DependencyStore(
+            config.ethpm_dir / DEPENDENCY_STORE_DIR, ipfs_backend
+        )
+    else:
+        store = None
+    write_journal(
+        config.ethpm_dir,
+        {"operation": "update", "package": package_id, "lock": installed_lock_entry},
+    )
 
-    # atomic replace
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_ethpm_dir = Path(tmpdir) / ETHPM_PACKAGES_DIR
-        shutil.copytree(config.ethpm_dir, tmp_ethpm_dir)
-        tmp_config = copy.copy(config)
-        tmp_config.ethpm_dir = tmp_ethpm_dir
-        uninstall_package(args.package, tmp_config)
-        install_package(updated_package, tmp_config)
-        shutil.rmtree(config.ethpm_dir)
-        tmp_ethpm_dir.replace(config.ethpm_dir)
-
-    cli_logger.info(
-        f"{updated_args.package} successfully updated to version "
-        f"{updated_args.package_version}."
+    staging_dir = config.ethpm_dir / STAGING_DIR
+    staging_dir.mkdir(exist_ok=True)
+    (staging_dir / UPDATED_PACKAGE_DIR).mkdir()
+    write_package_installation_files(
+        updated_package, staging_dir / UPDATED_PACKAGE_DIR, ipfs_backend, store
     )
+    (config.ethpm_dir / package_id).replace(staging_dir / REPLACED_PACKAGE_DIR)
+    (staging_dir / UPDATED_PACKAGE_DIR).replace(config.ethpm_dir / package_id)
+    install_to_ethpm_lock(updated_package, lockfile_path, dedupe)
+    shutil.rmtree(staging_dir)
+    remove_unreferenced_store_entries(config.ethpm_dir)
+    clear_journal(config.ethpm_dir)
+
+
+def rollback_update(
+    package_id: str, installed_lock_entry: Dict[str, Any], config: Config
+) -> None:
+    replaced_package_dir = config.ethpm_dir / STAGING_DIR / REPLACED_PACKAGE_DIR
+    if not replaced_package_dir.is_dir():
+        # Installed package was never moved, nothing to restore
+        return
+
+    package_dir = config.ethpm_dir / package_id
+    if package_dir.is_dir():
+        shutil.rmtree(package_dir)
+    replaced_package_dir.replace(package_dir)
+    lockfile_path = config.ethpm_dir / LOCKFILE_NAME
+    old_lock = json.loads(lockfile_path.read_text())
+    write_ethpm_lock(assoc(old_lock, package_id, installed_lock_entry), lockfile_path)
 
 
 def pluck_release_data(
@@ -241,17 +492,56 @@ def pluck_release_data(
 
 
 def uninstall_package(package_name: str, config: Config) -> None:
+    recover_interrupted_operation(config)
     if not is_package_installed(package_name, config):
         check_for_aliased_package(package_name, config)
         return
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_package_dir = Path(tmpdir) / ETHPM_PACKAGES_DIR
-        shutil.copytree(config.ethpm_dir, tmp_package_dir)
-        shutil.rmtree(tmp_package_dir / package_name)
-        uninstall_from_ethpm_lock(package_name, (tmp_package_dir / LOCKFILE_NAME))
-        shutil.rmtree(config.ethpm_dir)
-        tmp_package_dir.replace(config.ethpm_dir)
+    # Journal the uninstall, then stage the package dir out of the ethpm dir namespace
+    write_journal(config.ethpm_dir, {"operation": "uninstall", "package": package_name})
+    staging_dir = config.ethpm_dir / STAGING_DIR
+    staging_dir.mkdir(exist_ok=True)
+    (config.ethpm_dir / package_name).replace(staging_dir / package_name)
+    complete_uninstall(package_name, config)
+
+
+def complete_uninstall(package_name: str, config: Config) -> None:
+    uninstall_from_ethpm_lock(package_name, (config.ethpm_dir / LOCKFILE_NAME))
+    shutil.rmtree(config.ethpm_dir / STAGING_DIR)
+    remove_unreferenced_store_entries(config.ethpm_dir)
+    clear_journal(config.ethpm_dir)
+
+
+def recover_interrupted_operation(config: Config) -> None:
+    """
+    Completes or rolls back an operation on the ethpm dir that was interrupted
+    before it could clear its journal.
+    """
+    journal = read_journal(config.ethpm_dir)
+    if journal is None:
+        return
+
+    staging_dir = config.ethpm_dir / STAGING_DIR
+    package_id = journal["package"]
+    if journal["operation"] == "uninstall":
+        if (staging_dir / package_id).is_dir():
+            # Package was already staged for removal, so roll forward
+            complete_uninstall(package_id, config)
+            cli_logger.info(f"Completed interrupted uninstall of {package_id}.")
+            return
+    elif journal["operation"] == "update":
+        rollback_update(package_id, journal["lock"], config)
+    else:
+        raise InstallError(
+            f"Unable to recover unknown operation: {journal['operation']} "
+            f"found in {config.ethpm_dir}."
+        )
+
+    if staging_dir.is_dir():
+        shutil.rmtree(staging_dir)
+    remove_unreferenced_store_entries(config.ethpm_dir)
+    clear_journal(config.ethpm_dir)
+    cli_logger.info(f"Rolled back interrupted {journal['operation']} of {package_id}.")
 
 
 def check_for_aliased_package(package_name: str, config: Config) -> None:
@@ -267,17 +557,164 @@ def check_for_aliased_package(package_name: str, config: Config) -> None:
         )
 
 
+def prefetch_package_assets(
+    package: Package, ipfs_backend: BaseIPFSBackend, jobs: int
+) -> PrefetchedIPFSBackend:
+    """
+    Walks the manifest graph of a package one level of build dependencies at
+    a time, and concurrently fetches all IPFS assets found on each level.
+    """
+    assets: Dict[str, bytes] = {}
+    manifests = [package.manifest]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        while manifests:
+            dependency_uris = unique_ipfs_uris(
+                uri
+                for manifest in manifests
+                for uri in get_build_dependency_uris(manifest)
+            )
+            asset_uris = unique_ipfs_uris(
+                uri for manifest in manifests for uri in get_asset_uris(manifest)
+            )
+            uris_to_fetch = [
+                uri
+                for uri in unique_ipfs_uris(dependency_uris + asset_uris)
+                if extract_ipfs_path_from_uri(uri) not in assets
+            ]
+            fetched_contents = executor.map(
+                ipfs_backend.fetch_uri_contents, uris_to_fetch
+            )
+            for uri, contents in zip(uris_to_fetch, fetched_contents):
+                assets[extract_ipfs_path_from_uri(uri)] = contents
+
+            # Only walk the dependencies seen for the first time on this level
+            manifests = [
+                process_and_validate_raw_manifest(
+                    assets[extract_ipfs_path_from_uri(uri)]
+                )
+                for uri in dependency_uris
+                if uri in uris_to_fetch
+            ]
+    return PrefetchedIPFSBackend(assets, ipfs_backend)
+
+
+def unique_ipfs_uris(uris: Iterable[URI]) -> List[URI]:
+    # Preserves order of first appearance, so fetches are issued deterministically.
+    return list(dict.fromkeys(uri for uri in uris if is_ipfs_uri(uri)))
+
+
+@to_tuple
+def get_build_dependency_uris(manifest: Dict[str, Any]) -> Iterable[URI]:
+    if "buildDependencies" in manifest:
+        yield from manifest["buildDependencies"].values()
+
+
+@to_tuple
+def get_asset_uris(manifest: Dict[str, Any]) -> Iterable[URI]:
+    if "sources" in manifest:
+        for source_object in manifest["sources"].values():
+            if "content" not in source_object:
+                ipfs_uri = next(
+                    (uri for uri in source_object["urls"] if is_ipfs_uri(uri)), None
+                )
+                if ipfs_uri:
+                    yield ipfs_uri
+
+    try:
+        yield manifest["meta"]["links"]["documentation"]
+    except KeyError:
+        pass
+
+
+class DependencyStore:
+    """
+    Shared store for build dependencies installed in dedupe mode.
+    - Each unique content hash is resolved, validated and written only once
+    - Nested ``_ethpm_packages`` entries are relative symlinks into the store
+    """
+
+    def __init__(self, store_dir: Path, ipfs_backend: BaseIPFSBackend) -> None:
+        self.store_dir = store_dir
+        self.ipfs_backend = ipfs_backend
+        self.packages: Dict[URI, Package] = {}
+
+    def resolve(self, uri: URI) -> Package:
+        if uri not in self.packages:
+            self.packages[uri] = Package(
+                Namespace(uri=uri, alias=""), self.ipfs_backend
+            )
+        return self.packages[uri]
+
+    def add(self, package: Package) -> Path:
+        store_entry = self.store_dir / package.resolved_content_hash
+        validate_parent_directory(self.store_dir, store_entry)
+        if not store_entry.is_dir():
+            self.store_dir.mkdir(exist_ok=True)
+            tmp_store_entry = Path(tempfile.mkdtemp(dir=self.store_dir))
+            write_package_installation_files(
+                package, tmp_store_entry, self.ipfs_backend, self
+            )
+            tmp_store_entry.replace(store_entry)
+        return store_entry
+
+    def link(self, package: Package, link_path: Path) -> None:
+        store_entry = self.add(package)
+        # Links live two levels below either a store entry or a top level package,
+        # so they can be made relative regardless of where the tree is moved to.
+        if self.store_dir in link_path.parents:
+            link_target = Path("..", "..", store_entry.name)
+        else:
+            link_target = Path("..", "..", self.store_dir.name, store_entry.name)
+        link_path.symlink_to(link_target, target_is_directory=True)
+
+
+def remove_unreferenced_store_entries(ethpm_dir: Path) -> None:
+    """
+    Removes every dependency store entry that isn't linked to by an installed
+    package, either directly or through other store entries.
+    """
+    store_dir = ethpm_dir / DEPENDENCY_STORE_DIR
+    if not store_dir.is_dir():
+        return
+
+    referenced_entries: Set[str] = set()
+    package_dirs = [
+        path
+        for path in ethpm_dir.iterdir()
+        if path.is_dir() and path.name not in (DEPENDENCY_STORE_DIR, STAGING_DIR)
+    ]
+    while package_dirs:
+        dependency_dir = package_dirs.pop() / ETHPM_PACKAGES_DIR
+        if not dependency_dir.is_dir():
+            continue
+        for path in dependency_dir.iterdir():
+            if path.is_symlink():
+                store_entry_name = Path(os.readlink(path)).name
+                if store_entry_name not in referenced_entries:
+                    referenced_entries.add(store_entry_name)
+                    package_dirs.append(store_dir / store_entry_name)
+            elif path.is_dir():
+                package_dirs.append(path)
+
+    for store_entry in store_dir.iterdir():
+        if store_entry.name not in referenced_entries:
+            shutil.rmtree(store_entry)
+    if not any(store_dir.iterdir()):
+        store_dir.rmdir()
+
+
 def write_package_installation_files(
-    package: Package, tmp_package_dir: Path, ipfs_backend: BaseIPFSBackend
+    package: Package,
+    tmp_package_dir: Path,
+    ipfs_backend: BaseIPFSBackend,
+    store: Optional[DependencyStore] = None,
 ) -> None:
     (tmp_package_dir / "manifest.json").touch()
     (tmp_package_dir / "manifest.json").write_bytes(package.raw_manifest)
 
     write_sources_to_disk(package, tmp_package_dir, ipfs_backend)
     write_docs_to_disk(package, tmp_package_dir, ipfs_backend)
-    write_build_deps_to_disk(package, tmp_package_dir, ipfs_backend)
-    tmp_ethpm_lock = tmp_package_dir.parent / LOCKFILE_NAME
-    install_to_ethpm_lock(package, tmp_ethpm_lock)
+    write_build_deps_to_disk(package, tmp_package_dir, ipfs_backend, store)
 
 
 def write_sources_to_disk(
@@ -332,33 +769,48 @@ def write_docs_to_disk(
 
 
 def write_build_deps_to_disk(
-    package: Package, package_dir: Path, ipfs_backend: BaseIPFSBackend
+    package: Package,
+    package_dir: Path,
+    ipfs_backend: BaseIPFSBackend,
+    store: Optional[DependencyStore] = None,
 ) -> None:
     if "buildDependencies" in package.manifest:
         child_ethpm_dir = package_dir / ETHPM_PACKAGES_DIR
         child_ethpm_dir.mkdir()
         for name, uri in package.manifest["buildDependencies"].items():
-            dep_package = Package(Namespace(uri=uri, alias=""), ipfs_backend)
             tmp_dep_dir = child_ethpm_dir / name
-            tmp_dep_dir.mkdir()
             validate_parent_directory(package_dir, tmp_dep_dir)
-            write_package_installation_files(dep_package, tmp_dep_dir, ipfs_backend)
-
-
-def install_to_ethpm_lock(package: Package, ethpm_lock: Path) -> None:
+            if store:
+                dep_package = store.resolve(uri)
+                store.link(dep_package, tmp_dep_dir)
+            else:
+                dep_package = Package(Namespace(uri=uri, alias=""), ipfs_backend)
+                tmp_dep_dir.mkdir()
+                write_package_installation_files(dep_package, tmp_dep_dir, ipfs_backend)
+            install_to_ethpm_lock(dep_package, child_ethpm_dir / LOCKFILE_NAME)
+
+
+def install_to_ethpm_lock(
+    package: Package, ethpm_lock: Path, dedupe: bool = False
+) -> None:
     if ethpm_lock.is_file():
         old_lock = json.loads(ethpm_lock.read_text())
     else:
         old_lock = {}
-        ethpm_lock.touch()
     new_package_data = package.generate_ethpm_lock()
+    if dedupe:
+        new_package_data = assoc(new_package_data, "dedupe", True)
     new_lock = assoc(old_lock, package.alias, new_package_data)
-    ethpm_lock.write_text(f"{json.dumps(new_lock, sort_keys=True, indent=4)}\n")
+    write_ethpm_lock(new_lock, ethpm_lock)
 
 
 def uninstall_from_ethpm_lock(package_name: str, ethpm_lock: Path) -> None:
     old_lock = json.loads(ethpm_lock.read_text())
     new_lock = dissoc(old_lock, package_name)
+    write_ethpm_lock(new_lock, ethpm_lock)
+
+
+def write_ethpm_lock(lock: Dict[str, Any], ethpm_lock: Path) -> None:
     with atomic_replace(ethpm_lock) as ethpm_lock_file:
-        ethpm_lock_file.write(json.dumps(new_lock, sort_keys=True, indent=4))
+        ethpm_lock_file.write(json.dumps(lock, sort_keys=True, indent=4))
         ethpm_lock_file.write("\n")
@@ -9,7 +9,7 @@ from eth_utils import to_dict, to_text
 from ethpm._utils.ipfs import extract_ipfs_path_from_uri
 from ethpm.backends.http import GithubOverHTTPSBackend
 from ethpm.backends.ipfs import BaseIPFSBackend
-from ethpm.backends.registry import RegistryURIBackend, parse_registry_uri
+from ethpm.backends.registry import parse_registry_uri
 from ethpm.validation.manifest import (
     validate_manifest_against_schema,
     validate_manifest_deployments,
@@ -17,6 +17,7 @@ from ethpm.validation.manifest import (
 )
 
 from ethpm_cli.commands.etherscan import EtherscanURIBackend
+from ethpm_cli.commands.registry_cache import CachedRegistryURIBackend
 from ethpm_cli.exceptions import UriNotSupportedError
 
 
@@ -58,6 +59,7 @@ class InstalledPackage(NamedTuple):
     resolved_package_name: str
     resolved_version: str
     resolved_uri: str
+    dedupe: bool = False
 
 
 ResolvedInstallURI = namedtuple(
@@ -85,7 +87,7 @@ def resolve_manifest_uri(uri: URI, ipfs: BaseIPFSBackend) -> ResolvedManifestURI
 
 
 def resolve_install_uri(args: Namespace) -> ResolvedInstallURI:
-    registry_backend = RegistryURIBackend()
+    registry_backend = CachedRegistryURIBackend()
     etherscan_backend = EtherscanURIBackend()
     if etherscan_backend.can_translate_uri(args.uri):
         manifest_uri = etherscan_backend.fetch_uri_contents(
@@ -1,17 +1,17 @@
 import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, NamedTuple, Optional, Tuple
+from typing import Any, Dict, Iterable, NamedTuple, Optional, Sequence, Tuple
 
 from eth_typing import URI
 from eth_utils import to_int, to_tuple
 from eth_utils.toolz import assoc, assoc_in, dissoc
 from ethpm.backends.registry import is_valid_registry_uri, parse_registry_uri
 from ethpm.constants import SUPPORTED_CHAIN_IDS
-from web3 import Web3
 
 from ethpm_cli._utils.filesystem import atomic_replace
 from ethpm_cli._utils.logger import cli_logger
 from ethpm_cli._utils.shellart import bold_blue, bold_green, bold_white
+from ethpm_cli.commands.registry_cache import get_registry_cache
 from ethpm_cli.config import Config, setup_w3
 from ethpm_cli.constants import REGISTRY_STORE
 from ethpm_cli.exceptions import AmbigiousFileSystem, AuthorizationError, InstallError
@@ -125,8 +125,17 @@ def explore_registry(uri_or_alias: str, config: Config) -> None:
     cli_logger.info(
         f"Registry controlled by: {registry_w3.pm.registry.registry.caller.owner()}\n"
     )
-    package_names = registry_w3.pm.get_all_package_names()
-    display_packages(package_names, registry_w3)
+    registry_cache = get_registry_cache()
+    registry_address = parsed_registry_uri.address
+    chain_id = to_int(text=parsed_registry_uri.chain_id)
+    package_names = registry_cache.get_package_names(
+        registry_w3, registry_address, chain_id
+    )
+    # Read the releases of every package together, rather than package by package
+    all_package_releases = registry_cache.get_all_package_releases(
+        registry_w3, registry_address, chain_id, package_names
+    )
+    display_packages(package_names, all_package_releases)
 
 
 def resolve_uri_or_alias(uri_or_alias: str, store_path: Path) -> StoredRegistry:
@@ -227,12 +236,20 @@ def generate_registry_store_data(
     }
 
 
-def display_packages(all_package_names: Iterable[str], w3: Web3) -> None:
-    cli_logger.info(f"Packages in the registry: {w3.pm.get_package_count()}\n")
+def display_packages(
+    all_package_names: Sequence[str],
+    all_package_releases: Dict[str, Tuple[Tuple[str, URI], ...]],
+) -> None:
+    cli_logger.info(f"Packages in the registry: {len(all_package_names)}\n")
     for package_name in all_package_names:
-        cli_logger.info(f"Retrieving all releases for {bold_blue(package_name)}: \n")
-        all_releases = w3.pm.get_all_package_releases(package_name)
-        for version, manifest_uri in all_releases:
-            cli_logger.info(f"{bold_green(version)} --- ({bold_white(manifest_uri)})")
+        display_package_releases(package_name, all_package_releases[package_name])
+
+
+def display_package_releases(
+    package_name: str, all_releases: Tuple[Tuple[str, URI], ...]
+) -> None:
+    cli_logger.info(f"Retrieving all releases for {bold_blue(package_name)}: \n")
+    for version, manifest_uri in all_releases:
+        cli_logger.info(f"{bold_green(version)} --- ({bold_white(manifest_uri)})")
 
-        cli_logger.info(f"Total releases: {len(all_releases)}\n")
+    cli_logger.info(f"Total releases: {len(all_releases)}\n")
@@ -0,0 +1,313 @@
+import json
+from pathlib import Path
+import threading
+from typing import Any, Dict, List, Sequence, Tuple
+
+from eth_typing import URI, ChecksumAddress
+from eth_utils import to_checksum_address
+from ethpm.backends.registry import RegistryURIBackend, parse_registry_uri
+from ethpm.exceptions import CannotHandleURI
+from web3 import Web3
+
+from ethpm_cli._utils.batch import batch_call
+from ethpm_cli._utils.filesystem import atomic_replace
+from ethpm_cli._utils.release_logs import get_block_version_release_logs
+from ethpm_cli._utils.xdg import get_xdg_ethpmcli_root
+from ethpm_cli.constants import CONFIRMATIONS, REGISTRY_CACHE_DIR
+
+# Package / release ids read per getAllPackageIds / getAllReleaseIds call
+PAGE_SIZE = 100
+
+
+class RegistryCache:
+    """
+    Local cache of the package names, versions and manifest URIs released on
+    registries, keyed by registry URI.
+    - Every cached registry is tagged with the block it was last read at, less
+      CONFIRMATIONS blocks that may still be reorged
+    - A cached registry is refreshed (once per process) from the VersionRelease
+      logs it emitted after that block, rather than re-reading all its state
+    - The releases of a package are only read from the registry on first use
+    - Registry state is read with batched calls (see read_package_releases)
+
+    The w3 passed to any lookup must have its package manager connected to
+    the registry being looked up.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self._registries: Dict[URI, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_package_names(
+        self, w3: Web3, registry_address: ChecksumAddress, chain_id: int
+    ) -> Tuple[str, ...]:
+        with self._lock:
+            cached_registry = self._get_cached_registry(w3, registry_address, chain_id)
+            return tuple(cached_registry["package_names"])
+
+    def get_package_releases(
+        self,
+        w3: Web3,
+        registry_address: ChecksumAddress,
+        chain_id: int,
+        package_name: str,
+    ) -> Tuple[Tuple[str, URI], ...]:
+        """
+        Returns (version, manifest_uri) for every release of a package, in the
+        order they were released, like w3.pm.get_all_package_releases.
+        """
+        all_package_releases = self.get_all_package_releases(
+            w3, registry_address, chain_id, [package_name]
+        )
+        return all_package_releases[package_name]
+
+    def get_all_package_releases(
+        self,
+        w3: Web3,
+        registry_address: ChecksumAddress,
+        chain_id: int,
+        package_names: Sequence[str],
+    ) -> Dict[str, Tuple[Tuple[str, URI], ...]]:
+        """
+        Returns the releases of every given package, keyed by package name. The
+        releases of all uncached packages are read from the registry together.
+        """
+        with self._lock:
+            cached_registry = self._get_cached_registry(w3, registry_address, chain_id)
+            uncached_package_names = [
+                package_name
+                for package_name in dict.fromkeys(package_names)
+                if package_name not in cached_registry["releases"]
+            ]
+
+        if uncached_package_names:
+            registry_releases = read_package_releases(w3, uncached_package_names)
+            with self._lock:
+                for package_name, all_release_data in registry_releases.items():
+                    cached_registry["releases"].setdefault(package_name, [])
+                    for version, manifest_uri in all_release_data:
+                        add_release(
+                            cached_registry, package_name, version, manifest_uri
+                        )
+                self._save(registry_address, chain_id, cached_registry)
+
+        with self._lock:
+            return {
+                package_name: format_cached_releases(cached_registry, package_name)
+                for package_name in package_names
+            }
+
+    def get_manifest_uri(
+        self,
+        w3: Web3,
+        registry_address: ChecksumAddress,
+        chain_id: int,
+        package_name: str,
+        version: str,
+    ) -> URI:
+        all_release_data = self.get_package_releases(
+            w3, registry_address, chain_id, package_name
+        )
+        for release_version, manifest_uri in all_release_data:
+            if release_version == version:
+                return manifest_uri
+        # Not released, let the registry raise the appropriate error
+        _, _, manifest_uri = w3.pm.get_release_data(package_name, version)
+        return URI(manifest_uri)
+
+    def _get_cached_registry(
+        self, w3: Web3, registry_address: ChecksumAddress, chain_id: int
+    ) -> Dict[str, Any]:
+        registry_uri = URI(
+            f"erc1319://{to_checksum_address(registry_address)}:{chain_id}"
+        )
+        if registry_uri not in self._registries:
+            cache_path = self._get_cache_path(registry_address, chain_id)
+            if cache_path.is_file():
+                cached_registry = json.loads(cache_path.read_text())
+                refresh_cached_registry(w3, registry_address, cached_registry)
+            else:
+                cached_registry = read_registry(w3)
+            self._save(registry_address, chain_id, cached_registry)
+            self._registries[registry_uri] = cached_registry
+        return self._registries[registry_uri]
+
+    def _get_cache_path(self, registry_address: ChecksumAddress, chain_id: int) -> Path:
+        cache_name = f"{to_checksum_address(registry_address)}.json"
+        return self.cache_dir / str(chain_id) / cache_name
+
+    def _save(
+        self,
+        registry_address: ChecksumAddress,
+        chain_id: int,
+        cached_registry: Dict[str, Any],
+    ) -> None:
+        cache_path = self._get_cache_path(registry_address, chain_id)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with atomic_replace(cache_path) as cache_file:
+            cache_file.write(json.dumps(cached_registry, indent=4))
+            cache_file.write("\n")
+
+
+def read_registry(w3: Web3) -> Dict[str, Any]:
+    # The block is read first, so releases made while reading are found by a refresh
+    block_number = get_confirmed_block_number(w3.eth.blockNumber)
+    return {
+        "block_number": block_number,
+        "package_names": read_package_names(w3),
+        "releases": {},
+    }
+
+
+def read_package_names(w3: Web3) -> List[str]:
+    """
+    Returns every package name on the connected registry, in the same order as
+    w3.pm.get_all_package_names, in three round trips.
+    """
+    registry_functions = w3.pm.registry.registry.functions
+    num_packages = registry_functions.numPackageIds().call()
+    package_id_pages = batch_call(
+        w3,
+        [
+            registry_functions.getAllPackageIds(offset, PAGE_SIZE)
+            for offset in range(0, num_packages, PAGE_SIZE)
+        ],
+    )
+    # The registry returns each page of ids in reverse
+    package_ids = [
+        package_id
+        for package_ids, _ in package_id_pages
+        for package_id in reversed(package_ids)
+    ]
+    return batch_call(
+        w3,
+        [registry_functions.getPackageName(package_id) for package_id in package_ids],
+    )
+
+
+def read_package_releases(
+    w3: Web3, package_names: Sequence[str]
+) -> Dict[str, List[Tuple[str, URI]]]:
+    """
+    Returns (version, manifest_uri) for every release of the given packages on
+    the connected registry, in the same order as w3.pm.get_all_package_releases,
+    in three round trips however many packages are read.
+    """
+    registry_functions = w3.pm.registry.registry.functions
+    release_counts = batch_call(
+        w3,
+        [
+            registry_functions.numReleaseIds(package_name)
+            for package_name in package_names
+        ],
+    )
+    release_id_pages = [
+        (package_name, offset)
+        for package_name, release_count in zip(package_names, release_counts)
+        for offset in range(0, release_count, PAGE_SIZE)
+    ]
+    release_id_results = batch_call(
+        w3,
+        [
+            registry_functions.getAllReleaseIds(package_name, offset, PAGE_SIZE)
+            for package_name, offset in release_id_pages
+        ],
+    )
+    # The registry returns each page of ids in reverse
+    release_ids = [
+        release_id
+        for release_ids, _ in release_id_results
+        for release_id in reversed(release_ids)
+    ]
+    all_release_data = batch_call(
+        w3,
+        [registry_functions.getReleaseData(release_id) for release_id in release_ids],
+    )
+    package_releases: Dict[str, List[Tuple[str, URI]]] = {
+        package_name: [] for package_name in package_names
+    }
+    for package_name, version, manifest_uri in all_release_data:
+        package_releases[package_name].append((version, URI(manifest_uri)))
+    return package_releases
+
+
+def refresh_cached_registry(
+    w3: Web3, registry_address: ChecksumAddress, cached_registry: Dict[str, Any]
+) -> None:
+    """
+    Adds the releases logged since the cached block. The last CONFIRMATIONS
+    blocks are read again on the next refresh, so releases that are reorged
+    in are still found.
+    """
+    latest_block = w3.eth.blockNumber
+    if latest_block <= cached_registry["block_number"]:
+        return
+
+    version_release_logs = get_block_version_release_logs(
+        w3, cached_registry["block_number"] + 1, latest_block, address=registry_address
+    )
+    for log in version_release_logs:
+        add_release(
+            cached_registry,
+            log["args"]["packageName"],
+            log["args"]["version"],
+            log["args"]["manifestURI"],
+        )
+    cached_registry["block_number"] = max(
+        get_confirmed_block_number(latest_block), cached_registry["block_number"]
+    )
+
+
+def get_confirmed_block_number(latest_block: int) -> int:
+    return max(latest_block - CONFIRMATIONS, 0)
+
+
+def add_release(
+    cached_registry: Dict[str, Any], package_name: str, version: str, manifest_uri: URI,
+) -> None:
+    """
+    Adds a release to a cached registry, unless it's already cached. Releases of
+    a package are only tracked once the package's releases have been read.
+    """
+    if package_name not in cached_registry["package_names"]:
+        cached_registry["package_names"].append(package_name)
+    if package_name in cached_registry["releases"]:
+        cached_releases = cached_registry["releases"][package_name]
+        if version not in (cached_version for cached_version, _ in cached_releases):
+            cached_releases.append([version, manifest_uri])
+
+
+def format_cached_releases(
+    cached_registry: Dict[str, Any], package_name: str
+) -> Tuple[Tuple[str, URI], ...]:
+    return tuple(
+        (version, URI(manifest_uri))
+        for version, manifest_uri in cached_registry["releases"][package_name]
+    )
+
+
+def get_registry_cache() -> RegistryCache:
+    return RegistryCache(get_xdg_ethpmcli_root() / REGISTRY_CACHE_DIR)
+
+
+class CachedRegistryURIBackend(RegistryURIBackend):
+    """
+    RegistryURIBackend that resolves registry URIs through the registry cache.
+    """
+
+    def __init__(self, registry_cache: RegistryCache = None) -> None:
+        super().__init__()
+        if registry_cache is None:
+            registry_cache = get_registry_cache()
+        self.registry_cache = registry_cache
+
+    def fetch_uri_contents(self, uri: str) -> URI:
+        address, chain_id, pkg_name, pkg_version, _, _ = parse_registry_uri(uri)
+        if chain_id != "1":
+            raise CannotHandleURI("Currently only mainnet registry uris are supported.")
+        self.w3.enable_unstable_package_management_api()
+        self.w3.pm.set_registry(address)
+        return self.registry_cache.get_manifest_uri(
+            self.w3, address, int(chain_id), pkg_name, pkg_version
+        )
@@ -1,38 +1,96 @@
-from datetime import datetime
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 import itertools
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Set, Tuple  # noqa: F401
-
-from eth_typing import URI, Address, BlockNumber
-from eth_utils import to_dict, to_list
+import time
+from typing import (
+    Any,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from eth_typing import URI, BlockNumber, ChecksumAddress, Hash32
+from eth_utils import encode_hex, to_list
 from eth_utils.toolz import assoc
-from ethpm._utils.ipfs import extract_ipfs_path_from_uri, is_ipfs_uri
+from ethpm._utils.ipfs import is_ipfs_uri
 from ethpm.uri import is_supported_content_addressed_uri, resolve_uri_contents
 from web3 import Web3
-
-from ethpm_cli._utils.various import flatten
-from ethpm_cli.config import write_updated_chain_data
-from ethpm_cli.constants import VERSION_RELEASE_ABI
+from web3.exceptions import BlockNotFound
+
+from ethpm_cli._utils.ipfs import IPFSMirror
+from ethpm_cli._utils.ranges import BlockRangeSet
+from ethpm_cli._utils.release_index import Release, ReleaseIndex
+from ethpm_cli._utils.release_logs import (
+    AdaptiveBatchSize,
+    get_block_version_release_logs,
+)
+from ethpm_cli._utils.timestamps import BlockTimestampIndex
+from ethpm_cli.config import get_chain_data_store, write_updated_chain_data
+from ethpm_cli.constants import (
+    BLOCK_TIMESTAMPS_DIR,
+    CONFIRMATIONS,
+    DEFAULT_FETCH_JOBS,
+    IPFS_CHAIN_DATA,
+    MAX_BATCH_SIZE,
+    MIN_BATCH_SIZE,
+    POLL_INTERVAL,
+)
 from ethpm_cli.exceptions import BlockNotFoundError
+from ethpm_cli.validation import (
+    validate_batch_size_bounds,
+    validate_confirmations,
+    validate_fetch_jobs,
+)
 
 logger = logging.getLogger("ethpm_cli.scraper.Scraper")
 
 # https://github.com/ethereum/EIPs/commit/123b7267b6270914a822001c119d11607e695517
 VERSION_RELEASE_TIMESTAMP = 1_552_564_800  # March 14, 2019
 
-BATCH_SIZE = 5000
+# Number of checkpointed block ranges logged before they're merged into chain_data.json
+COMPACTION_INTERVAL = 100
+
+# from_block, to_block and the future resolving the work for that block range
+ScrapingBlockRange = Tuple[int, int, Future]
 
 
-def scrape(w3: Web3, ethpm_dir: Path, start_block: int = 0) -> BlockNumber:
+def scrape(
+    w3: Web3,
+    ethpm_dir: Path,
+    start_block: int = 0,
+    jobs: int = DEFAULT_FETCH_JOBS,
+    min_batch_size: int = MIN_BATCH_SIZE,
+    max_batch_size: int = MAX_BATCH_SIZE,
+    release_index: ReleaseIndex = None,
+    chain_data_path: Path = None,
+    manifest_graph: "ManifestGraph" = None,
+) -> BlockNumber:
     """
     Scrapes VersionRelease event data starting from start_block.
 
     If start_block is not 0, scraping begins from start_block.
     Otherwise the scraping begins from the ethpm birth block.
+
+    Each block range spans max_batch_size blocks, which log workers fetch in
+    windows sized between min_batch_size and max_batch_size.
+
+    If a release_index is given, every release found is recorded in it.
+    Progress is tracked in chain_data_path (defaults to chain_data.json).
     """
-    chain_data_path = ethpm_dir / "chain_data.json"
+    validate_fetch_jobs(jobs)
+    validate_batch_size_bounds(min_batch_size, max_batch_size)
+    if chain_data_path is None:
+        chain_data_path = ethpm_dir / IPFS_CHAIN_DATA
     latest_block = BlockNumber(w3.eth.blockNumber)
 
     if start_block >= latest_block:
@@ -43,139 +101,524 @@ def scrape(w3: Web3, ethpm_dir: Path, start_block: int = 0) -> BlockNumber:
 
     logger.info("Looking up start block for scraping VersionRelease events...")
     if start_block == 0:
+        block_index = BlockTimestampIndex(
+            ethpm_dir / BLOCK_TIMESTAMPS_DIR / f"{w3.eth.chainId}.json"
+        )
         active_block = get_ethpm_birth_block(
-            w3, 0, latest_block, VERSION_RELEASE_TIMESTAMP
+            w3, 0, latest_block, VERSION_RELEASE_TIMESTAMP, block_index
         )
     else:
         active_block = start_block
 
     logger.info("Scraping from block %d.", active_block)
-    for from_block in range(active_block, latest_block, BATCH_SIZE):
-        if (from_block + BATCH_SIZE) > latest_block:
-            to_block = int(latest_block)
-        else:
-            to_block = from_block + BATCH_SIZE
+    block_ranges = get_block_ranges_to_scrape(
+        active_block, latest_block, chain_data_path, max_batch_size
+    )
+    batch_size = AdaptiveBatchSize(min_batch_size, max_batch_size)
+    scrape_block_ranges(
+        w3,
+        ethpm_dir,
+        chain_data_path,
+        block_ranges,
+        jobs,
+        batch_size,
+        release_index,
+        manifest_graph,
+    )
+    ScrapeCheckpointLog(chain_data_path).compact()
+    return latest_block
+
+
+def scrape_chains(
+    w3s: Dict[int, Web3],
+    ethpm_dir: Path,
+    start_block: int = 0,
+    jobs: int = DEFAULT_FETCH_JOBS,
+    min_batch_size: int = MIN_BATCH_SIZE,
+    max_batch_size: int = MAX_BATCH_SIZE,
+    release_index: ReleaseIndex = None,
+) -> Dict[int, BlockNumber]:
+    """
+    Scrapes the chain behind each w3 (by chain ID) concurrently, each like
+    scrape, and returns the latest block scraped on each chain.
 
-        if block_range_needs_scraping(from_block, to_block, chain_data_path):
-            scraped_manifests = scrape_block_range_for_manifests(
-                w3, from_block, to_block
+    Every chain tracks its progress in its own chain data store, while IPFS
+    assets are mirrored by a single shared pool, so an asset released on
+    more than one chain is only fetched once.
+    """
+    with IPFSMirror(ethpm_dir, jobs) as mirror, ThreadPoolExecutor(
+        max_workers=len(w3s)
+    ) as chain_executor:
+        manifest_graph = ManifestGraph(mirror)
+        scraping_chains = {
+            chain_id: chain_executor.submit(
+                scrape,
+                w3,
+                ethpm_dir,
+                start_block,
+                jobs,
+                min_batch_size,
+                max_batch_size,
+                release_index,
+                get_chain_data_store(ethpm_dir, chain_id),
+                manifest_graph,
             )
-            update_chain_data(chain_data_path, from_block, to_block, scraped_manifests)
-            write_ipfs_uris_to_disk(ethpm_dir, scraped_manifests)
-        else:
+            for chain_id, w3 in w3s.items()
+        }
+        return {
+            chain_id: scraping_chain.result()
+            for chain_id, scraping_chain in scraping_chains.items()
+        }
+
+
+def follow(
+    w3: Web3,
+    ethpm_dir: Path,
+    start_block: int = 0,
+    jobs: int = DEFAULT_FETCH_JOBS,
+    min_batch_size: int = MIN_BATCH_SIZE,
+    max_batch_size: int = MAX_BATCH_SIZE,
+    release_index: ReleaseIndex = None,
+    confirmations: int = CONFIRMATIONS,
+    poll_interval: float = POLL_INTERVAL,
+    chain_data_path: Path = None,
+) -> Iterator[BlockNumber]:
+    """
+    Scrapes VersionRelease event data like scrape, then polls for new blocks
+    every poll_interval seconds and scrapes them as they are mined. Yields the
+    latest scraped block after every step. Blocks scraped while polling are
+    checkpointed to the append-only log, which is compacted once following stops.
+
+    Every poll, the heads scraped within the last `confirmations` blocks are
+    checked for reorgs. If any were orphaned, scraping resumes from the most
+    recent head still on the canonical chain.
+    """
+    validate_confirmations(confirmations)
+    if chain_data_path is None:
+        chain_data_path = ethpm_dir / IPFS_CHAIN_DATA
+    scraped_block = scrape(
+        w3,
+        ethpm_dir,
+        start_block,
+        jobs,
+        min_batch_size,
+        max_batch_size,
+        release_index,
+        chain_data_path,
+    )
+    scraped_heads = ScrapedHeads(confirmations)
+    scraped_heads.record(scraped_block, get_block_hash(w3, scraped_block))
+    yield scraped_block
+
+    batch_size = AdaptiveBatchSize(min_batch_size, max_batch_size)
+    try:
+        while True:
+            time.sleep(poll_interval)
+            fork_block = scraped_heads.find_fork_block(w3)
+            if fork_block is not None:
+                logger.warning(
+                    "Chain reorg detected, re-scraping from block %d.", fork_block
+                )
+                if release_index is not None:
+                    release_index.remove_releases(w3.eth.chainId, fork_block)
+                scraped_block = BlockNumber(fork_block)
+
+            head = w3.eth.getBlock("latest")
+            if head["number"] > scraped_block:
+                block_ranges = split_block_range(
+                    scraped_block, head["number"], max_batch_size
+                )
+                scrape_block_ranges(
+                    w3,
+                    ethpm_dir,
+                    chain_data_path,
+                    block_ranges,
+                    jobs,
+                    batch_size,
+                    release_index,
+                )
+                scraped_block = head["number"]
+                scraped_heads.record(scraped_block, Hash32(head["hash"]))
+                yield scraped_block
+    finally:
+        # Polls only append to the checkpoint log, which is merged once following stops
+        ScrapeCheckpointLog(chain_data_path).compact()
+
+
+def scrape_block_ranges(
+    w3: Web3,
+    ethpm_dir: Path,
+    chain_data_path: Path,
+    block_ranges: Iterable[Tuple[int, int]],
+    jobs: int,
+    batch_size: AdaptiveBatchSize,
+    release_index: ReleaseIndex = None,
+    manifest_graph: "ManifestGraph" = None,
+) -> None:
+    """
+    Block ranges are scraped by a pool of log workers running ahead of a pool
+    of IPFS workers, while progress is checkpointed in block order. Log workers
+    fetch each block range in windows sized by batch_size. Pass a shared
+    manifest graph to mirror IPFS assets alongside other scrapes.
+    """
+    if manifest_graph is None:
+        with IPFSMirror(ethpm_dir, jobs) as mirror:
+            scrape_block_ranges(
+                w3,
+                ethpm_dir,
+                chain_data_path,
+                block_ranges,
+                jobs,
+                batch_size,
+                release_index,
+                ManifestGraph(mirror),
+            )
+        return
+
+    checkpoint_log = ScrapeCheckpointLog(chain_data_path)
+    if release_index is not None:
+        chain_id = w3.eth.chainId
+    block_ranges = iter(block_ranges)
+    with ThreadPoolExecutor(max_workers=jobs) as log_executor, ThreadPoolExecutor(
+        max_workers=jobs
+    ) as asset_executor:
+
+        def submit_block_range(block_range: Tuple[int, int]) -> ScrapingBlockRange:
+            from_block, to_block = block_range
+            log_future = log_executor.submit(
+                scrape_block_range_for_manifests, w3, from_block, to_block, batch_size
+            )
+            return from_block, to_block, log_future
+
+        # Keep a bounded number of block ranges in flight ahead of the checkpoint
+        scraping = deque(
+            map(submit_block_range, itertools.islice(block_ranges, jobs * 2))
+        )
+        mirroring: Deque[ScrapingBlockRange] = deque()
+        while scraping:
+            from_block, to_block, log_future = scraping.popleft()
+            scraped_manifests = log_future.result()
+            if release_index is not None:
+                release_index.add_releases(chain_id, scraped_manifests)
+            scraping.extend(map(submit_block_range, itertools.islice(block_ranges, 1)))
+            asset_future = asset_executor.submit(
+                write_ipfs_uris_to_disk, ethpm_dir, scraped_manifests, manifest_graph
+            )
+            mirroring.append((from_block, to_block, asset_future))
+            checkpoint_scraped_blocks(checkpoint_log, mirroring, wait=False)
+        checkpoint_scraped_blocks(checkpoint_log, mirroring, wait=True)
+
+
+@to_list
+def get_block_ranges_to_scrape(
+    active_block: int, latest_block: int, chain_data_path: Path, range_size: int
+) -> Iterable[Tuple[int, int]]:
+    all_scraped_blocks = get_scraped_blocks(chain_data_path)
+    for from_block, to_block in split_block_range(
+        active_block, latest_block, range_size
+    ):
+        if all_scraped_blocks.covers(from_block, to_block - 1):
             logger.info("Block range: %d - %d already scraped.", from_block, to_block)
+        else:
+            yield from_block, to_block
 
-    return latest_block
+
+@to_list
+def split_block_range(
+    from_block: int, to_block: int, range_size: int
+) -> Iterable[Tuple[int, int]]:
+    for range_start in range(from_block, to_block, range_size):
+        yield range_start, min(range_start + range_size, to_block)
+
+
+def checkpoint_scraped_blocks(
+    checkpoint_log: "ScrapeCheckpointLog",
+    mirroring: Deque[ScrapingBlockRange],
+    wait: bool,
+) -> None:
+    """
+    Records block ranges as scraped once their IPFS assets are written to disk.
+    Ranges are only recorded in block order, so an interrupted scrape never
+    skips a range whose assets are missing when it is resumed.
+    """
+    while mirroring and (wait or mirroring[0][2].done()):
+        from_block, to_block, asset_future = mirroring.popleft()
+        asset_future.result()
+        checkpoint_log.record(from_block, to_block)
 
 
 def get_ethpm_birth_block(
-    w3: Web3, from_block: int, to_block: int, target_timestamp: int
+    w3: Web3,
+    from_block: int,
+    to_block: int,
+    target_timestamp: int,
+    block_index: BlockTimestampIndex = None,
 ) -> int:
     """
     Returns the closest block found before the target_timestamp
+
+    The search interpolates between known block timestamps, seeded by any
+    timestamps already recorded in block_index. Once found, the block is cached
+    as an anchor in block_index, so later lookups need no RPC calls at all.
     """
-    version_release_date = datetime.fromtimestamp(target_timestamp)
-
-    while from_block < to_block:
-        mid = BlockNumber((from_block + to_block) // 2)
-        target = datetime.fromtimestamp(w3.eth.getBlock(mid)["timestamp"])
-        if target > version_release_date:
-            to_block = mid
-        elif target < version_release_date:
-            from_block = mid + 1
-        else:
-            return mid - 1
+    if block_index is None:
+        block_index = BlockTimestampIndex()
 
-    raise BlockNotFoundError(
-        f"Cannot find closest block to timestamp: {target_timestamp} "
-        f"in range given {from_block} - {to_block}."
-    )
+    anchor = block_index.anchors.get(target_timestamp)
+    if anchor is not None and from_block <= anchor + 1 < to_block:
+        return anchor
 
+    try:
+        birth_block = search_block_by_timestamp(
+            w3, from_block, to_block, target_timestamp, block_index
+        )
+    finally:
+        block_index.save()
 
-def block_range_needs_scraping(
-    from_block: int, to_block: int, chain_data_path: Path
-) -> bool:
-    all_scraped_blocks = get_scraped_blocks(chain_data_path)
-    if any(block not in all_scraped_blocks for block in range(from_block, to_block)):
-        return True
-    return False
+    if birth_block is None:
+        raise BlockNotFoundError(
+            f"Cannot find closest block to timestamp: {target_timestamp} "
+            f"in range given {from_block} - {to_block}."
+        )
+    block_index.anchors[target_timestamp] = birth_block
+    block_index.save()
+    return birth_block
 
 
-def update_chain_data(
-    chain_data_path: Path,
+def search_block_by_timestamp(
+    w3: Web3,
     from_block: int,
     to_block: int,
-    manifests: Dict[Address, Dict[str, str]],
-) -> None:
-    chain_data = json.loads(chain_data_path.read_text())
-
-    old_scraped_blocks = get_scraped_blocks(chain_data_path)
-    new_scraped_blocks = list(range(from_block, to_block))
-    updated_blocks = blocks_to_ranges(set(old_scraped_blocks + new_scraped_blocks))
+    target_timestamp: int,
+    block_index: BlockTimestampIndex,
+) -> Optional[int]:
+    """
+    Interpolation search for a block from from_block up to (not including)
+    to_block mined at target_timestamp. Returns the block before it if found.
+    """
+    if from_block >= to_block:
+        return None
+
+    # Blocks lo - 1 and hi bound the search: lo - 1 was mined before the target
+    # timestamp and hi was not. Narrow them down with all known timestamps first.
+    lo, hi = from_block, to_block
+    for block_number in block_index.get_indexed_blocks(from_block, to_block):
+        timestamp = block_index.timestamps[block_number]
+        if timestamp < target_timestamp:
+            lo = block_number + 1
+        elif timestamp > target_timestamp:
+            hi = block_number
+            break
+        else:
+            return block_number - 1
+
+    # Look up the bounds themselves, so the first estimate can interpolate
+    if lo == from_block:
+        from_timestamp = block_index.get_timestamp(w3, from_block)
+        if from_timestamp == target_timestamp:
+            return from_block - 1
+        elif from_timestamp > target_timestamp:
+            return None
+        lo = from_block + 1
+    if hi == to_block and block_index.get_timestamp(w3, hi) <= target_timestamp:
+        # Every block in range was mined before the target timestamp
+        return None
+
+    bisect_only = False
+    while lo < hi:
+        span = hi - lo
+        lo_timestamp = block_index.get_known_timestamp(lo - 1)
+        hi_timestamp = block_index.get_known_timestamp(hi)
+        if (
+            bisect_only
+            or lo_timestamp is None  # noqa: W503
+            or hi_timestamp is None  # noqa: W503
+            or lo_timestamp == hi_timestamp  # noqa: W503
+        ):
+            mid = (lo + hi) // 2
+        else:
+            estimate = (lo - 1) + (target_timestamp - lo_timestamp) * (hi - lo + 1) // (
+                hi_timestamp - lo_timestamp
+            )
+            mid = min(max(estimate, lo), hi - 1)
 
-    chain_data_with_updated_blocks = assoc(chain_data, "scraped_blocks", updated_blocks)
-    write_updated_chain_data(chain_data_path, chain_data_with_updated_blocks)
+        timestamp = block_index.get_timestamp(w3, mid)
+        if timestamp > target_timestamp:
+            hi = mid
+        elif timestamp < target_timestamp:
+            lo = mid + 1
+        else:
+            return mid - 1
+        # Block times vary, so bisect whenever an estimate failed to halve the range
+        bisect_only = hi - lo > span // 2
+    return None
 
 
-@to_list
-def blocks_to_ranges(blocks_list: List[int]) -> Iterable[Dict[str, str]]:
+class ScrapeCheckpointLog:
     """
-    Takes a list of block numbers, and returns them grouped into min/max ranges.
-    :blocks_list: [0, 1, 2, 4, 6, 9]
-    -> [{"min": "0", "max": "2"}, {"min": "4", "max": "4"}, {"min": "6", "max": "9"}]
+    Append-only log of the block ranges scraped since chain_data.json was last written.
+    - Recording a range appends a single line, however much history was scraped
+    - Every compaction_interval ranges, the log is merged into chain_data.json
+    - A log left behind by an interrupted scrape is replayed on the next read
     """
-    for a, b in itertools.groupby(enumerate(blocks_list), lambda x: x[0] - x[1]):
-        c = list(b)
-        yield {"min": str(c[0][1]), "max": str(c[-1][1])}
+
+    def __init__(
+        self, chain_data_path: Path, compaction_interval: int = COMPACTION_INTERVAL
+    ) -> None:
+        self.chain_data_path = chain_data_path
+        self.log_path = get_checkpoint_log_path(chain_data_path)
+        self.compaction_interval = compaction_interval
+        self.pending = len(read_checkpoint_log(self.log_path))
+
+    def record(self, from_block: int, to_block: int) -> None:
+        checkpoint = {"min": str(from_block), "max": str(to_block - 1)}
+        with self.log_path.open("a") as log_file:
+            log_file.write(json.dumps(checkpoint) + "\n")
+            log_file.flush()
+            os.fsync(log_file.fileno())
+        self.pending += 1
+        if self.pending >= self.compaction_interval:
+            self.compact()
+
+    def compact(self) -> None:
+        if not self.log_path.exists():
+            return
+        chain_data = json.loads(self.chain_data_path.read_text())
+        scraped_blocks = get_scraped_blocks(self.chain_data_path)
+        chain_data_with_updated_blocks = assoc(
+            chain_data, "scraped_blocks", scraped_blocks.to_chain_data()
+        )
+        write_updated_chain_data(self.chain_data_path, chain_data_with_updated_blocks)
+        self.log_path.unlink()
+        self.pending = 0
+
+
+def get_checkpoint_log_path(chain_data_path: Path) -> Path:
+    return chain_data_path.with_suffix(".log")
 
 
-def get_scraped_blocks(chain_data_path: Path) -> List[int]:
+@to_list
+def read_checkpoint_log(log_path: Path) -> Iterable[Dict[str, str]]:
+    if not log_path.exists():
+        return
+    for line in log_path.read_text().splitlines():
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            # Only the last line can be torn, by a crash while it was written
+            logger.debug("Ignoring incomplete checkpoint: %s.", line)
+
+
+def get_scraped_blocks(chain_data_path: Path) -> BlockRangeSet:
     scraped_blocks = json.loads(chain_data_path.read_text())["scraped_blocks"]
-    scraped_ranges = [
-        list(range(int(blocks["min"]), int(blocks["max"]) + 1))
-        for blocks in scraped_blocks
-    ]
-    return flatten(scraped_ranges)
+    checkpoints = read_checkpoint_log(get_checkpoint_log_path(chain_data_path))
+    return BlockRangeSet.from_chain_data(scraped_blocks + checkpoints)
 
 
 def write_ipfs_uris_to_disk(
-    ethpm_dir: Path, manifests: Dict[Address, Dict[str, str]]
+    ethpm_dir: Path,
+    manifests: Dict[ChecksumAddress, List[Release]],
+    manifest_graph: "ManifestGraph" = None,
 ) -> None:
+    """
+    Writes every released manifest, and the IPFS assets it references, to the
+    sharded store under ethpm_dir. Pass a shared manifest graph to avoid
+    re-walking manifests already mirrored by earlier calls.
+    """
+    if manifest_graph is None:
+        with IPFSMirror(ethpm_dir, DEFAULT_FETCH_JOBS) as mirror:
+            write_ipfs_uris_to_disk(ethpm_dir, manifests, ManifestGraph(mirror))
+        return
+
     all_manifest_uris = [
-        version_release_data["manifestURI"]
-        for version_release_data in manifests.values()
-        if is_supported_content_addressed_uri(version_release_data["manifestURI"])
+        release.manifest_uri
+        for releases in manifests.values()
+        for release in releases
+        if is_supported_content_addressed_uri(release.manifest_uri)
     ]
-    base_ipfs_uris = [uri for uri in all_manifest_uris if is_ipfs_uri(uri)]
-    nested_ipfs_uris = [pluck_ipfs_uris_from_manifest(uri) for uri in all_manifest_uris]
-    all_ipfs_uris = set(flatten(nested_ipfs_uris) + base_ipfs_uris)
-    # ex.
-    # ipfs uri: QmdvZEW3AaUntDfFkcbdnYzeLAAeD4YFeixQsdmHF88T6Q
-    # dir store: ethpmcli/Qm/dv/ZE/QmdvZEW3AaUntDfFkcbdnYzeLAAeD4YFeixQsdmHF88T6Q
-    for uri in all_ipfs_uris:
-        ipfs_hash = extract_ipfs_path_from_uri(uri)
-        first_two_bytes_dir = ethpm_dir / ipfs_hash[0:2]
-        second_two_bytes_dir = first_two_bytes_dir / ipfs_hash[2:4]
-        third_two_bytes_dir = second_two_bytes_dir / ipfs_hash[4:6]
-        asset_dest_path = third_two_bytes_dir / ipfs_hash
-
-        if not asset_dest_path.is_file():
-            if not first_two_bytes_dir.is_dir():
-                first_two_bytes_dir.mkdir()
-            if not second_two_bytes_dir.is_dir():
-                second_two_bytes_dir.mkdir()
-            if not third_two_bytes_dir.is_dir():
-                third_two_bytes_dir.mkdir()
-
-            asset_dest_path.touch()
-            asset_dest_path.write_bytes(resolve_uri_contents(uri))
-            logger.info("%s written to\n %s.\n", uri, asset_dest_path)
+    manifest_graph.mirror.mirror(manifest_graph.get_ipfs_uris(all_manifest_uris))
+
+
+class ManifestGraph:
+    """
+    Walks the buildDependencies graph of released manifests.
+    - Each manifest is fetched and parsed once, memoized by its URI
+    - Dependency cycles are logged and not followed
+    """
+
+    def __init__(self, mirror: IPFSMirror) -> None:
+        self.mirror = mirror
+        self._manifests: Dict[URI, Tuple[FrozenSet[URI], Tuple[URI, ...]]] = {}
+        self._closures: Dict[URI, FrozenSet[URI]] = {}
+
+    def get_ipfs_uris(self, root_uris: Iterable[URI]) -> Set[URI]:
+        """
+        Returns the IPFS URIs of the root manifests and every asset found in
+        them or any of their (transitive) build dependencies.
+        """
+        all_ipfs_uris: Set[URI] = set()
+        for uri in root_uris:
+            closure, _ = self.get_closure(uri, ())
+            all_ipfs_uris.update(closure)
+        return all_ipfs_uris
+
+    def get_closure(
+        self, uri: URI, dependents: Tuple[URI, ...]
+    ) -> Tuple[FrozenSet[URI], bool]:
+        """
+        Returns the IPFS URIs reachable from ``uri``, and whether that set is
+        complete. A set is incomplete if a dependency cycle was cut while walking
+        it, so only complete sets are memoized.
+        """
+        if uri in self._closures:
+            return self._closures[uri], True
+        if uri in dependents:
+            logger.warning(
+                "Dependency cycle found in manifests: %s.",
+                " -> ".join(dependents + (uri,)),
+            )
+            return frozenset(), False
+
+        manifest_ipfs_uris, dependency_uris = self.get_manifest(uri)
+        ipfs_uris = set(manifest_ipfs_uris)
+        is_complete = True
+        for dependency_uri in dependency_uris:
+            closure, is_closure_complete = self.get_closure(
+                dependency_uri, dependents + (uri,)
+            )
+            ipfs_uris.update(closure)
+            is_complete = is_complete and is_closure_complete
+
+        closure = frozenset(ipfs_uris)
+        if is_complete:
+            self._closures[uri] = closure
+        return closure, is_complete
+
+    def get_manifest(self, uri: URI) -> Tuple[FrozenSet[URI], Tuple[URI, ...]]:
+        """
+        Returns the IPFS URIs found in the manifest at ``uri`` and the URIs of its
+        build dependencies.
+        """
+        if uri not in self._manifests:
+            if is_ipfs_uri(uri):
+                # Manifests are mirrored while they are read, so they're only fetched once
+                manifest = json.loads(self.mirror.fetch(uri))
+                ipfs_uris = {uri}
+            else:
+                manifest = json.loads(resolve_uri_contents(uri))
+                ipfs_uris = set()
+            ipfs_uris.update(pluck_ipfs_uris(manifest))
+            dependency_uris = tuple(manifest.get("buildDependencies", {}).values())
+            self._manifests[uri] = (frozenset(ipfs_uris), dependency_uris)
+        return self._manifests[uri]
 
 
 def scrape_block_range_for_manifests(
-    w3: Web3, from_block: int, to_block: int
-) -> Dict[Address, Dict[str, str]]:
-    version_release_logs = get_block_version_release_logs(w3, from_block, to_block)
+    w3: Web3, from_block: int, to_block: int, batch_size: AdaptiveBatchSize = None
+) -> Dict[ChecksumAddress, List[Release]]:
+    version_release_logs = get_block_version_release_logs(
+        w3, from_block, to_block, batch_size
+    )
     logger.info(
         "Blocks %d-%d scraped. %d VersionRelease events found.",
         from_block,
@@ -189,17 +632,7 @@ def scrape_block_range_for_manifests(
 
 
 @to_list
-def pluck_ipfs_uris_from_manifest(uri: URI) -> Iterable[List[Any]]:
-    manifest_contents = json.loads(resolve_uri_contents(uri))
-    yield pluck_ipfs_uris(manifest_contents)
-
-    if "buildDependencies" in manifest_contents:
-        for dependency_uri in manifest_contents["buildDependencies"].values():
-            yield pluck_ipfs_uris_from_manifest(dependency_uri)
-
-
-@to_list
-def pluck_ipfs_uris(manifest: Dict[str, Any]) -> Iterable[List[str]]:
+def pluck_ipfs_uris(manifest: Dict[str, Any]) -> Iterable[URI]:
     if "sources" in manifest:
         for source_object in manifest["sources"].values():
             for url in source_object["urls"]:
@@ -218,39 +651,78 @@ def pluck_ipfs_uris(manifest: Dict[str, Any]) -> Iterable[List[str]]:
                 yield source
 
 
-@to_dict
 def format_version_release_logs(
-    all_entries: Dict[Any, Any]
-) -> Iterable[Tuple[Address, Any]]:
-    all_addresses = set(entry["address"] for entry in all_entries)
-    for address in all_addresses:
-        all_releases_by_address = process_entries(address, all_entries)
-        yield address, all_releases_by_address
-
-
-@to_dict
-def process_entries(
-    address: Address, all_entries: Dict[Any, Any]
-) -> Iterable[Tuple[str, str]]:
+    all_entries: Iterable[Dict[str, Any]]
+) -> Dict[ChecksumAddress, List[Release]]:
+    """
+    Groups VersionRelease logs by the registry that emitted them, in a single
+    pass that keeps every release in the order it was logged.
+    """
+    releases_by_address: Dict[ChecksumAddress, List[Release]] = {}
     for entry in all_entries:
-        if entry["address"] == address:
-            logger.info(
-                "<Package %s==%s> released on registry @ %s.\n" "Manifest URI: %s\n",
-                entry["args"]["packageName"],
-                entry["args"]["version"],
-                address,
-                entry["args"]["manifestURI"],
+        release = Release(
+            entry["args"]["packageName"],
+            entry["args"]["version"],
+            entry["args"]["manifestURI"],
+            entry["blockNumber"],
+            encode_hex(entry["transactionHash"]),
+            entry["logIndex"],
+        )
+        logger.info(
+            "<Package %s==%s> released on registry @ %s.\n" "Manifest URI: %s\n",
+            release.package_name,
+            release.version,
+            entry["address"],
+            release.manifest_uri,
+        )
+        releases_by_address.setdefault(entry["address"], []).append(release)
+    return releases_by_address
+
+
+class ScrapedHeads:
+    """
+    Hashes of the chain heads scraped up to in follow mode.
+    - Checked against the canonical chain to detect reorgs
+    - Heads older than the confirmation depth are considered final and dropped
+    """
+
+    def __init__(self, confirmations: int) -> None:
+        self.confirmations = confirmations
+        self.hashes: Dict[int, Optional[Hash32]] = {}
+
+    def record(self, block_number: int, block_hash: Optional[Hash32]) -> None:
+        self.hashes[block_number] = block_hash
+        for final_block in [
+            recorded_block
+            for recorded_block in self.hashes
+            if recorded_block < block_number - self.confirmations
+        ]:
+            del self.hashes[final_block]
+
+    def find_fork_block(self, w3: Web3) -> Optional[int]:
+        """
+        Returns the most recent head still on the canonical chain if a reorg
+        orphaned any later head, else None. Orphaned heads are dropped.
+        """
+        recorded_blocks = sorted(self.hashes, reverse=True)
+        for depth, block_number in enumerate(recorded_blocks):
+            if get_block_hash(w3, block_number) == self.hashes[block_number]:
+                break
+        else:
+            if not recorded_blocks:
+                return None
+            logger.warning(
+                "Chain reorg deeper than %d confirmations detected.", self.confirmations
             )
-            yield "manifestURI", entry["args"]["manifestURI"]
-            yield "packageName", entry["args"]["packageName"]
-            yield "version", entry["args"]["version"]
+            depth, block_number = len(recorded_blocks), recorded_blocks[-1]
 
+        for orphaned_block in recorded_blocks[:depth]:
+            del self.hashes[orphaned_block]
+        return block_number if depth else None
 
-def get_block_version_release_logs(
-    w3: Web3, from_block: int, to_block: int
-) -> Dict[str, Any]:
-    log_contract = w3.eth.contract(abi=VERSION_RELEASE_ABI)
-    log_filter = log_contract.events.VersionRelease.createFilter(
-        fromBlock=from_block, toBlock=to_block
-    )
-    return log_filter.get_all_entries()
+
+def get_block_hash(w3: Web3, block_number: int) -> Optional[Hash32]:
+    try:
+        return Hash32(w3.eth.getBlock(block_number)["hash"])
+    except BlockNotFound:
+        return None
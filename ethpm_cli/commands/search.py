@@ -0,0 +1,37 @@
+from eth_typing import ChecksumAddress
+
+from ethpm_cli._utils.logger import cli_logger
+from ethpm_cli._utils.release_index import ReleaseIndex
+from ethpm_cli._utils.shellart import bold_blue, bold_green, bold_white
+from ethpm_cli._utils.xdg import get_xdg_ethpmcli_root
+from ethpm_cli.constants import RELEASE_INDEX_NAME
+from ethpm_cli.exceptions import ValidationError
+
+
+def search_releases(
+    package_name: str = None,
+    version: str = None,
+    registry_address: ChecksumAddress = None,
+    chain_id: int = None,
+) -> None:
+    index_path = get_xdg_ethpmcli_root() / RELEASE_INDEX_NAME
+    if not index_path.is_file():
+        raise ValidationError(
+            f"No release index found @ {index_path}. "
+            "Run `ethpm scrape` to build the release index."
+        )
+    release_index = ReleaseIndex(index_path)
+    try:
+        indexed_releases = release_index.search(
+            package_name, version, registry_address, chain_id
+        )
+    finally:
+        release_index.close()
+
+    for indexed in indexed_releases:
+        release = indexed.release
+        cli_logger.info(
+            f"{bold_blue(release.package_name)} {bold_green(release.version)} "
+            f"--- ({bold_white(release.manifest_uri)}) @ {indexed.registry_uri}"
+        )
+    cli_logger.info(f"Releases found: {len(indexed_releases)}")
@@ -2,13 +2,13 @@ from argparse import Namespace
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from eth_account import Account
 from eth_utils import to_checksum_address
+from ethpm.backends.ipfs import BaseIPFSBackend
 from ethpm.constants import SUPPORTED_CHAIN_IDS
 from web3 import Web3
-from web3.auto.infura.endpoints import build_http_headers, build_infura_url
 from web3.middleware import construct_sign_and_send_raw_middleware
 from web3.providers.auto import load_provider_from_uri
 
@@ -18,6 +18,7 @@ from ethpm_cli._utils.logger import cli_logger
 from ethpm_cli._utils.xdg import get_xdg_ethpmcli_root
 from ethpm_cli.commands.auth import get_authorized_private_key, import_keyfile
 from ethpm_cli.constants import (
+    CHAIN_DATA_DIR,
     ETHPM_DIR_ENV_VAR,
     ETHPM_PACKAGES_DIR,
     IPFS_CHAIN_DATA,
@@ -35,16 +36,16 @@ class Config:
     - Validate / Initialize ethpm packages dir
     - Setup w3
     - Projects dir
-    """
 
-    private_key = None
+    The xdg ethpm dir, IPFS backend, w3 and private key are only set up on first
+    access, so commands that never use them don't touch the network or keyfile.
+    """
 
     def __init__(self, args: Namespace) -> None:
-        # Setup IPFS backend
-        if "local_ipfs" in args and args.local_ipfs:
-            self.ipfs_backend = get_ipfs_backend(args.local_ipfs)
-        else:
-            self.ipfs_backend = get_ipfs_backend()
+        # IPFS backend
+        self._local_ipfs = bool("local_ipfs" in args and args.local_ipfs)
+        self._offline = bool("offline" in args and args.offline)
+        self._ipfs_backend: Optional[BaseIPFSBackend] = None
 
         # Setup _ethpm_packages dir
         if "ethpm_dir" in args and args.ethpm_dir:
@@ -57,22 +58,26 @@ class Config:
                 self.ethpm_dir.mkdir()
         validate_ethpm_dir(self.ethpm_dir)
 
-        # Setup w3
+        # w3
         if "chain_id" in args and args.chain_id:
-            chain_id = args.chain_id
+            self.chain_id = args.chain_id
         else:
-            chain_id = 1
+            self.chain_id = 1
+        self._w3: Optional[Web3] = None
+
+        # xdg ethpm dir
+        self._xdg_ethpmcli_root: Optional[Path] = None
 
         if "keyfile_path" in args and args.keyfile_path:
+            # Keyfiles are imported into the xdg ethpm dir
+            self.setup_xdg_ethpmcli_root()
             import_keyfile(args.keyfile_path)
 
         if "keyfile_password" in args and args.keyfile_password:
-            self.private_key = get_authorized_private_key(args.keyfile_password)
-        self.w3 = setup_w3(chain_id, self.private_key)
-
-        # Setup xdg ethpm dir
-        self.xdg_ethpmcli_root = get_xdg_ethpmcli_root()
-        setup_xdg_ethpm_dir(self.xdg_ethpmcli_root, self.w3)
+            self._keyfile_password: Optional[str] = args.keyfile_password
+        else:
+            self._keyfile_password = None
+        self._private_key: Optional[str] = None
 
         # Setup projects dir
         if "project_dir" in args and args.project_dir:
@@ -90,6 +95,40 @@ class Config:
         else:
             self.manifest_path = None
 
+    @property
+    def ipfs_backend(self) -> BaseIPFSBackend:
+        if self._ipfs_backend is None:
+            self._ipfs_backend = get_ipfs_backend(self._local_ipfs, self._offline)
+        return self._ipfs_backend
+
+    @property
+    def private_key(self) -> Optional[str]:
+        if self._private_key is None and self._keyfile_password:
+            self._private_key = get_authorized_private_key(self._keyfile_password)
+        return self._private_key
+
+    @property
+    def w3(self) -> Web3:
+        if self._w3 is None:
+            self._w3 = setup_w3(self.chain_id, self.private_key)
+        return self._w3
+
+    @property
+    def xdg_ethpmcli_root(self) -> Path:
+        if self._xdg_ethpmcli_root is None:
+            return self.setup_xdg_ethpmcli_root()
+        return self._xdg_ethpmcli_root
+
+    def setup_xdg_ethpmcli_root(self) -> Path:
+        """
+        Validates / Initializes the xdg ethpm dir, once per Config.
+        """
+        if self._xdg_ethpmcli_root is None:
+            xdg_ethpmcli_root = get_xdg_ethpmcli_root()
+            setup_xdg_ethpm_dir(xdg_ethpmcli_root, self.chain_id)
+            self._xdg_ethpmcli_root = xdg_ethpmcli_root
+        return self._xdg_ethpmcli_root
+
 
 def setup_w3(chain_id: int, private_key: str = None) -> Web3:
     if chain_id not in SUPPORTED_CHAIN_IDS.keys():
@@ -97,6 +136,9 @@ def setup_w3(chain_id: int, private_key: str = None) -> Web3:
             f"Chain ID: {chain_id} is invalid. Currently supported chain ids "
             f"include: {list(SUPPORTED_CHAIN_IDS.keys())}."
         )
+    # Imported here, since importing it fails if no Infura project id is set
+    from web3.auto.infura.endpoints import build_http_headers, build_infura_url
+
     infura_url = f"{SUPPORTED_CHAIN_IDS[chain_id]}.infura.io"
     headers = build_http_headers()
     infura_url = build_infura_url(infura_url)
@@ -115,33 +157,55 @@ def setup_w3(chain_id: int, private_key: str = None) -> Web3:
     return w3
 
 
-def setup_xdg_ethpm_dir(xdg_ethpmcli_root: Path, w3: Web3) -> None:
-    if not xdg_ethpmcli_root.is_dir():
-        initialize_xdg_ethpm_dir(xdg_ethpmcli_root, w3)
+def setup_xdg_ethpm_dir(xdg_ethpmcli_root: Path, chain_id: int) -> None:
+    chain_data_path = xdg_ethpmcli_root / IPFS_CHAIN_DATA
+    keyfile_path = xdg_ethpmcli_root / KEYFILE_PATH
+    # The dir may already exist without either file, if a cache was written to it first
+    if not chain_data_path.is_file() and not keyfile_path.is_file():
+        initialize_xdg_ethpm_dir(xdg_ethpmcli_root, chain_id)
 
-    if not (xdg_ethpmcli_root / IPFS_CHAIN_DATA).is_file():
+    if not chain_data_path.is_file():
         raise ValidationError(
             f"Invalid xdg ethpm dir found @ {xdg_ethpmcli_root}. No IPFS chain data file found."
         )
 
-    if not (xdg_ethpmcli_root / KEYFILE_PATH).is_file():
+    if not keyfile_path.is_file():
         raise ValidationError(
             f"Invalid xdg ethpm dir found @ {xdg_ethpmcli_root}. No keyfile found."
         )
 
 
-def initialize_xdg_ethpm_dir(xdg_ethpmcli_root: Path, w3: Web3) -> None:
-    xdg_ethpmcli_root.mkdir()
+def initialize_xdg_ethpm_dir(xdg_ethpmcli_root: Path, chain_id: int) -> None:
+    xdg_ethpmcli_root.mkdir(parents=True, exist_ok=True)
     os.environ["XDG_ETHPMCLI_ROOT"] = str(xdg_ethpmcli_root)
-    xdg_chain_data = xdg_ethpmcli_root / IPFS_CHAIN_DATA
-    xdg_chain_data.touch()
+    initialize_chain_data(xdg_ethpmcli_root / IPFS_CHAIN_DATA, chain_id)
+    xdg_keyfile = xdg_ethpmcli_root / KEYFILE_PATH
+    xdg_keyfile.touch()
+
+
+def initialize_chain_data(chain_data_path: Path, chain_id: int) -> None:
     init_chain_data = {
-        "chain_id": w3.eth.chainId,
+        "chain_id": chain_id,
         "scraped_blocks": [{"min": "0", "max": "0"}],
     }
-    write_updated_chain_data(xdg_chain_data, init_chain_data)
-    xdg_keyfile = xdg_ethpmcli_root / KEYFILE_PATH
-    xdg_keyfile.touch()
+    write_updated_chain_data(chain_data_path, init_chain_data)
+
+
+def get_chain_data_store(xdg_ethpmcli_root: Path, chain_id: int) -> Path:
+    """
+    Returns the path to the scraper's progress store for chain_id.
+    IPFS_CHAIN_DATA tracks the chain the xdg ethpm dir was initialized with,
+    while every other chain is tracked in its own store, created on first use.
+    """
+    xdg_chain_data = xdg_ethpmcli_root / IPFS_CHAIN_DATA
+    if json.loads(xdg_chain_data.read_text())["chain_id"] == chain_id:
+        return xdg_chain_data
+
+    chain_data_path = xdg_ethpmcli_root / CHAIN_DATA_DIR / f"{chain_id}.json"
+    if not chain_data_path.is_file():
+        chain_data_path.parent.mkdir(exist_ok=True)
+        initialize_chain_data(chain_data_path, chain_id)
+    return chain_data_path
 
 
 def write_updated_chain_data(
@@ -1,24 +1,38 @@
 import json
 
-import pkg_resources
-
 from ethpm_cli import CLI_ASSETS_DIR
 
+BLOB_CACHE_DIR = "blob_cache"
+BLOB_CACHE_SIZE_ENV_VAR = "ETHPM_CLI_BLOB_CACHE_SIZE"
+BLOCK_TIMESTAMPS_DIR = "block_timestamps"
+CHAIN_DATA_DIR = "chain_data"
+CONFIRMATIONS = 12  # default depth (in blocks) checked for reorgs in scrape --follow
+DEFAULT_BLOB_CACHE_SIZE = 256 * 1024 * 1024  # 256 MiB
+DEFAULT_FETCH_JOBS = 8
+DEPENDENCY_STORE_DIR = "_store"
 ETHPM_DIR_ENV_VAR = "ETHPM_CLI_PACKAGES_DIR"
 ETHPM_PACKAGES_DIR = "_ethpm_packages"
 IPFS_ASSETS_DIR = "ipfs"
 IPFS_CHAIN_DATA = "chain_data.json"
+IPFS_CHUNK_SIZE = 262144  # largest blob IPFS stores as a single, unchunked block
+JOURNAL_NAME = "ethpm.journal"
 KEYFILE_PATH = "_ethpm_keyfile.json"
+LATEST_VERSION = "latest"
 LOCKFILE_NAME = "ethpm.lock"
+MAX_BATCH_SIZE = 100_000  # upper bound (in blocks) of the scraper's eth_getLogs window
+MIN_BATCH_SIZE = 100  # lower bound (in blocks) of the scraper's eth_getLogs window
+POLL_INTERVAL = 5.0  # default seconds between polls for new blocks in scrape --follow
+RELEASE_INDEX_NAME = "releases.db"
+REGISTRY_CACHE_DIR = "registry_cache"
 REGISTRY_STORE = "_ethpm_registries.json"
 SOLC_INPUT = "solc_input.json"
 SOLC_OUTPUT = "solc_output.json"
 SOLC_PATH = "ETHPM_CLI_SOLC_PATH"
 SRC_DIR_NAME = "_src"
+STAGING_DIR = "_staging"
 
 VERSION_RELEASE_ABI = json.loads((CLI_ASSETS_DIR / "v3.json").read_text())[
     "contractTypes"
 ]["Log"]["abi"]
 INFURA_HTTP_URI = "https://mainnet.infura.io/v3/4f1a358967c7474aae6f8f4a7698aefc"
-ETHPM_CLI_VERSION = pkg_resources.require("ethpm-cli")[0].version
 ETHERSCAN_KEY_ENV_VAR = "ETHPM_CLI_ETHERSCAN_API_KEY"
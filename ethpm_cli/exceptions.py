@@ -84,3 +84,11 @@ class CompilationError(BaseEthpmCliError):
     """
 
     pass
+
+
+class OfflineError(BaseEthpmCliError):
+    """
+    Raised when an asset is required from the network in offline mode.
+    """
+
+    pass
@@ -1,6 +1,5 @@
 from ethpm_cli._utils.logger import cli_logger
 from ethpm_cli._utils.shellart import bold_green, bold_white
-from ethpm_cli.constants import ETHPM_CLI_VERSION
 from ethpm_cli.parser import parser
 
 ENTRY_DESCRIPTION = "A command line tool for the Ethereum Package Manager. "
@@ -8,7 +7,7 @@ ENTRY_DESCRIPTION = "A command line tool for the Ethereum Package Manager. "
 
 def main() -> None:
     cli_logger.info(
-        f"\n{bold_white('ethPM CLI')}: {ENTRY_DESCRIPTION}v{bold_green(ETHPM_CLI_VERSION)}\n"
+        f"\n{bold_white('ethPM CLI')}: {ENTRY_DESCRIPTION}v{bold_green(get_ethpm_cli_version())}\n"
     )
     args = parser.parse_args()
 
@@ -19,3 +18,14 @@ def main() -> None:
             "%s is an invalid command. Use `ethpm --help` to "
             "see the list of available commands." % args.command
         )
+
+
+def get_ethpm_cli_version() -> str:
+    try:
+        # Much faster to import than pkg_resources, but only available on python3.8+
+        from importlib.metadata import version  # type: ignore
+    except ImportError:
+        import pkg_resources
+
+        return pkg_resources.get_distribution("ethpm-cli").version
+    return version("ethpm-cli")
@@ -1,51 +1,26 @@
 import argparse
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING, List, Union
 
-from eth_typing import Hash32
-from eth_utils import humanize_hash
-from ethpm.constants import SUPPORTED_CHAIN_IDS
-
-from ethpm_cli._utils.ipfs import pin_local_manifest
 from ethpm_cli._utils.logger import cli_logger
-from ethpm_cli._utils.solc import compile_contracts, generate_solc_input
-from ethpm_cli._utils.xdg import get_xdg_ethpmcli_root
-from ethpm_cli.commands.activate import activate_package
-from ethpm_cli.commands.auth import get_authorized_address
-from ethpm_cli.commands.get import get_manifest
-from ethpm_cli.commands.install import (
-    install_package,
-    list_installed_packages,
-    uninstall_package,
-    update_package,
-)
-from ethpm_cli.commands.manifest import (
-    amend_manifest,
-    cat_manifest,
-    generate_basic_manifest,
-    generate_custom_manifest,
-)
-from ethpm_cli.commands.package import Package
-from ethpm_cli.commands.registry import (
-    activate_registry,
-    add_registry,
-    deploy_registry,
-    explore_registry,
-    get_active_registry,
-    list_registries,
-    remove_registry,
-)
-from ethpm_cli.commands.release import release_package
-from ethpm_cli.commands.scraper import scrape
-from ethpm_cli.config import Config, validate_config_has_project_dir_attr
-from ethpm_cli.constants import IPFS_CHAIN_DATA, REGISTRY_STORE, SOLC_OUTPUT
-from ethpm_cli.exceptions import AuthorizationError, ConfigurationError, ValidationError
-from ethpm_cli.validation import (
-    validate_chain_data_store,
-    validate_install_cli_args,
-    validate_solc_output,
-    validate_uninstall_cli_args,
+from ethpm_cli.constants import (
+    CONFIRMATIONS,
+    DEFAULT_FETCH_JOBS,
+    LATEST_VERSION,
+    MAX_BATCH_SIZE,
+    MIN_BATCH_SIZE,
+    POLL_INTERVAL,
+    REGISTRY_STORE,
+    RELEASE_INDEX_NAME,
+    SOLC_OUTPUT,
 )
+from ethpm_cli.exceptions import AuthorizationError, ConfigurationError, ValidationError
+
+if TYPE_CHECKING:
+    from web3 import Web3
+
+# Each command's action imports the modules it needs, so that running a command
+# only loads its own dependencies (e.g. web3, IPython), rather than every command's.
 
 #
 # Shared args
@@ -102,6 +77,27 @@ def add_keyfile_path_arg_to_parser(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def add_jobs_arg_to_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs",
+        dest="jobs",
+        action="store",
+        type=int,
+        default=DEFAULT_FETCH_JOBS,
+        help=f"Number of assets to fetch concurrently (Defaults to {DEFAULT_FETCH_JOBS}).",
+    )
+
+
+def add_offline_arg_to_parser(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--offline",
+        dest="offline",
+        action="store_true",
+        help="Only read IPFS assets mirrored by `ethpm scrape` or cached locally, "
+        "and fail on any asset that would have to be fetched from the network.",
+    )
+
+
 def add_alias_arg_to_parser(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "--alias",
@@ -165,6 +161,11 @@ ethpm_parser = parser.add_subparsers(help="CLI commands", dest="command")
 
 
 def release_cmd(args: argparse.Namespace) -> None:
+    from ethpm_cli._utils.ipfs import pin_local_manifest
+    from ethpm_cli.commands.registry import get_active_registry
+    from ethpm_cli.commands.release import release_package
+    from ethpm_cli.config import Config
+
     config = Config(args)
 
     if args.manifest_path:
@@ -221,6 +222,9 @@ release_parser.set_defaults(func=release_cmd)
 
 
 def auth_action(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.auth import get_authorized_address
+    from ethpm_cli.config import Config
+
     Config(args)
     try:
         authorized_address = get_authorized_address()
@@ -245,11 +249,17 @@ auth_parser.set_defaults(func=auth_action)
 
 
 def registry_list_cmd(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.registry import list_registries
+    from ethpm_cli.config import Config
+
     config = Config(args)
     list_registries(config)
 
 
 def registry_add_cmd(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.registry import add_registry
+    from ethpm_cli.config import Config
+
     config = Config(args)
     add_registry(args.uri, args.alias, config)
     if args.alias:
@@ -262,12 +272,20 @@ def registry_add_cmd(args: argparse.Namespace) -> None:
 
 
 def registry_activate_cmd(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.registry import activate_registry
+    from ethpm_cli.config import Config
+
     config = Config(args)
     activate_registry(args.uri_or_alias, config)
     cli_logger.info(f"Registry @ {args.uri_or_alias} activated.")
 
 
 def registry_deploy_cmd(args: argparse.Namespace) -> None:
+    from ethpm.constants import SUPPORTED_CHAIN_IDS
+
+    from ethpm_cli.commands.registry import deploy_registry
+    from ethpm_cli.config import Config
+
     config = Config(args)
     registry_address = deploy_registry(config, args.alias)
     chain_name = SUPPORTED_CHAIN_IDS[config.w3.eth.chainId]
@@ -281,12 +299,18 @@ def registry_deploy_cmd(args: argparse.Namespace) -> None:
 
 
 def registry_remove_cmd(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.registry import remove_registry
+    from ethpm_cli.config import Config
+
     config = Config(args)
     remove_registry(args.uri_or_alias, config)
     cli_logger.info(f"Registry: {args.uri_or_alias} removed from registry store.")
 
 
 def registry_explore_cmd(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.registry import explore_registry
+    from ethpm_cli.config import Config
+
     config = Config(args)
     cli_logger.info(f"Looking for packages @ {args.uri_or_alias}: \n")
     explore_registry(args.uri_or_alias, config)
@@ -355,12 +379,19 @@ registry_explore_parser.set_defaults(func=registry_explore_cmd)
 
 
 def create_solc_input_cmd(args: argparse.Namespace) -> None:
+    from ethpm_cli._utils.solc import generate_solc_input
+    from ethpm_cli.config import Config, validate_config_has_project_dir_attr
+
     config = Config(args)
     validate_config_has_project_dir_attr(config)
     generate_solc_input(args.project_dir / "contracts")
 
 
 def create_wizard_cmd(args: argparse.Namespace) -> None:
+    from ethpm_cli._utils.solc import compile_contracts
+    from ethpm_cli.commands.manifest import amend_manifest, generate_custom_manifest
+    from ethpm_cli.config import Config
+
     config = Config(args)
     if config.project_dir and not config.manifest_path:
         if not (config.project_dir / SOLC_OUTPUT).exists():
@@ -377,6 +408,10 @@ def create_wizard_cmd(args: argparse.Namespace) -> None:
 
 
 def create_basic_cmd(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.manifest import generate_basic_manifest
+    from ethpm_cli.config import Config, validate_config_has_project_dir_attr
+    from ethpm_cli.validation import validate_solc_output
+
     config = Config(args)
     validate_config_has_project_dir_attr(config)
     validate_solc_output(args.project_dir)
@@ -441,15 +476,76 @@ create_wizard_parser.set_defaults(func=create_wizard_cmd)
 #
 
 
+def parse_chain_ids(chain_ids: str) -> List[int]:
+    return [int(chain_id) for chain_id in chain_ids.split(",")]
+
+
 def scrape_action(args: argparse.Namespace) -> None:
+    from ethpm_cli._utils.release_index import ReleaseIndex
+    from ethpm_cli.commands.scraper import follow, scrape, scrape_chains
+    from ethpm_cli.config import Config, get_chain_data_store, setup_w3
+    from ethpm_cli.validation import validate_chain_data_store, validate_scrape_cli_args
+
+    validate_scrape_cli_args(args)
     config = Config(args)
-    xdg_ethpmcli_root = get_xdg_ethpmcli_root()
-    chain_data_path = xdg_ethpmcli_root / IPFS_CHAIN_DATA
-    validate_chain_data_store(chain_data_path, config.w3)
+    xdg_ethpmcli_root = config.xdg_ethpmcli_root
     cli_logger.info("Loading IPFS scraper...")
     start_block = args.start_block if args.start_block else 0
-    last_scraped_block = scrape(config.w3, xdg_ethpmcli_root, start_block)
-    last_scraped_block_hash = Hash32(config.w3.eth.getBlock(last_scraped_block)["hash"])
+    release_index = ReleaseIndex(xdg_ethpmcli_root / RELEASE_INDEX_NAME)
+    try:
+        if args.chain_ids:
+            w3s = {chain_id: setup_w3(chain_id) for chain_id in args.chain_ids}
+            last_scraped_blocks = scrape_chains(
+                w3s,
+                xdg_ethpmcli_root,
+                start_block,
+                args.jobs,
+                args.min_batch_size,
+                args.max_batch_size,
+                release_index,
+            )
+            for chain_id, last_scraped_block in last_scraped_blocks.items():
+                cli_logger.info("Chain ID: %d.", chain_id)
+                log_last_scraped_block(w3s[chain_id], last_scraped_block)
+            return
+
+        chain_data_path = get_chain_data_store(xdg_ethpmcli_root, config.w3.eth.chainId)
+        validate_chain_data_store(chain_data_path, config.w3)
+        if args.follow:
+            for last_scraped_block in follow(
+                config.w3,
+                xdg_ethpmcli_root,
+                start_block,
+                args.jobs,
+                args.min_batch_size,
+                args.max_batch_size,
+                release_index,
+                args.confirmations,
+                args.poll_interval,
+                chain_data_path,
+            ):
+                log_last_scraped_block(config.w3, last_scraped_block)
+        else:
+            last_scraped_block = scrape(
+                config.w3,
+                xdg_ethpmcli_root,
+                start_block,
+                args.jobs,
+                args.min_batch_size,
+                args.max_batch_size,
+                release_index,
+                chain_data_path,
+            )
+            log_last_scraped_block(config.w3, last_scraped_block)
+    finally:
+        release_index.close()
+
+
+def log_last_scraped_block(w3: "Web3", last_scraped_block: int) -> None:
+    from eth_typing import Hash32
+    from eth_utils import humanize_hash
+
+    last_scraped_block_hash = Hash32(w3.eth.getBlock(last_scraped_block)["hash"])
     cli_logger.info(
         "All blocks scraped up to # %d: %s.",
         last_scraped_block,
@@ -481,20 +577,125 @@ scrape_parser.add_argument(
     type=int,
     help="Block number to begin scraping from (defaults to blocks from ~ March 14, 2019).",
 )
+scrape_parser.add_argument(
+    "--min-batch-size",
+    dest="min_batch_size",
+    action="store",
+    type=int,
+    default=MIN_BATCH_SIZE,
+    help=f"Minimum number of blocks to request logs for at once (Defaults to {MIN_BATCH_SIZE}).",
+)
+scrape_parser.add_argument(
+    "--max-batch-size",
+    dest="max_batch_size",
+    action="store",
+    type=int,
+    default=MAX_BATCH_SIZE,
+    help=f"Maximum number of blocks to request logs for at once (Defaults to {MAX_BATCH_SIZE}).",
+)
+scrape_parser.add_argument(
+    "--follow",
+    dest="follow",
+    action="store_true",
+    help="Keep polling for new blocks and scrape them as they are mined.",
+)
+scrape_parser.add_argument(
+    "--confirmations",
+    dest="confirmations",
+    action="store",
+    type=int,
+    default=CONFIRMATIONS,
+    help="Number of recent blocks to check for reorgs in follow mode "
+    f"(Defaults to {CONFIRMATIONS}).",
+)
+scrape_parser.add_argument(
+    "--poll-interval",
+    dest="poll_interval",
+    action="store",
+    type=float,
+    default=POLL_INTERVAL,
+    help="Seconds to wait between polls for new blocks in follow mode "
+    f"(Defaults to {POLL_INTERVAL}).",
+)
+scrape_parser.add_argument(
+    "--chains",
+    dest="chain_ids",
+    action="store",
+    type=parse_chain_ids,
+    help="Comma separated chain IDs to scrape concurrently (e.g. 1,3,5).",
+)
 add_chain_id_arg_to_parser(scrape_parser)
+add_jobs_arg_to_parser(scrape_parser)
 scrape_parser.set_defaults(func=scrape_action)
 
 
+#
+# ethpm search
+#
+
+
+def search_action(args: argparse.Namespace) -> None:
+    from eth_utils import to_checksum_address
+
+    from ethpm_cli.commands.search import search_releases
+
+    registry_address = (
+        to_checksum_address(args.registry_address) if args.registry_address else None
+    )
+    search_releases(
+        args.package_name, args.package_version, registry_address, args.chain_id
+    )
+
+
+search_parser = ethpm_parser.add_parser(
+    "search", help="Search the local index of releases found by `ethpm scrape`.",
+)
+search_parser.add_argument(
+    "package_name",
+    action="store",
+    type=str,
+    nargs="?",
+    help="Package name (or part of a package name) to search for.",
+)
+search_parser.add_argument(
+    "--version",
+    dest="package_version",
+    action="store",
+    type=str,
+    help="Only display releases of this version.",
+)
+search_parser.add_argument(
+    "--registry",
+    dest="registry_address",
+    action="store",
+    type=str,
+    help="Only display releases from the registry at this address.",
+)
+search_parser.add_argument(
+    "--chain-id",
+    dest="chain_id",
+    action="store",
+    type=int,
+    help="Only display releases from this chain ID.",
+)
+search_parser.set_defaults(func=search_action)
+
+
 #
 # ethpm install
 #
 
 
 def install_action(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.install import install_package
+    from ethpm_cli.commands.package import Package
+    from ethpm_cli.config import Config
+    from ethpm_cli.validation import validate_install_cli_args
+
     validate_install_cli_args(args)
     config = Config(args)
     package = Package(args, config.ipfs_backend)
-    install_package(package, config)
+    install_package(package, config, args.jobs, args.dedupe)
     cli_logger.info(
         "%s package sourced from %s installed to %s.",
         package.alias,
@@ -522,9 +723,18 @@ add_package_version_to_parser(
 )
 add_alias_arg_to_parser(install_parser)
 add_ethpm_dir_arg_to_parser(install_parser)
+add_jobs_arg_to_parser(install_parser)
+install_parser.add_argument(
+    "--dedupe",
+    dest="dedupe",
+    action="store_true",
+    help="Store each unique build dependency once in a shared store, "
+    "and link nested dependencies to it rather than writing full copies.",
+)
 add_uri_to_parser(
     install_parser, "IPFS / Github / Etherscan / Registry URI of target package."
 )
+add_offline_arg_to_parser(install_parser)
 install_parser.set_defaults(func=install_action)
 
 #
@@ -533,8 +743,16 @@ install_parser.set_defaults(func=install_action)
 
 
 def update_action(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.install import update_all_packages, update_package
+    from ethpm_cli.config import Config
+    from ethpm_cli.validation import validate_update_cli_args
+
+    validate_update_cli_args(args)
     config = Config(args)
-    update_package(args, config)
+    if args.all:
+        update_all_packages(args, config)
+    else:
+        update_package(args, config)
 
 
 update_parser = ethpm_parser.add_parser(
@@ -545,9 +763,28 @@ update_parser.add_argument(
     "package",
     action="store",
     type=str,
+    nargs="?",
     help="Package name / alias of target package to update.",
 )
+update_parser.add_argument(
+    "--to",
+    dest="target_version",
+    action="store",
+    type=str,
+    help=(
+        f"Version to update to, or '{LATEST_VERSION}' for the most recent release. "
+        "If omitted, you will be prompted for a version."
+    ),
+)
+update_parser.add_argument(
+    "--all",
+    dest="all",
+    action="store_true",
+    help="Update every package installed in the ethpm dir. Requires --to.",
+)
 add_ethpm_dir_arg_to_parser(update_parser)
+add_jobs_arg_to_parser(update_parser)
+add_offline_arg_to_parser(update_parser)
 update_parser.set_defaults(func=update_action)
 
 
@@ -557,6 +794,10 @@ update_parser.set_defaults(func=update_action)
 
 
 def uninstall_action(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.install import uninstall_package
+    from ethpm_cli.config import Config
+    from ethpm_cli.validation import validate_uninstall_cli_args
+
     validate_uninstall_cli_args(args)
     config = Config(args)
     uninstall_package(args.package, config)
@@ -582,6 +823,9 @@ uninstall_parser.set_defaults(func=uninstall_action)
 
 
 def list_action(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.install import list_installed_packages
+    from ethpm_cli.config import Config
+
     config = Config(args)
     list_installed_packages(config)
 
@@ -599,6 +843,9 @@ list_parser.set_defaults(func=list_action)
 
 
 def cat_action(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.manifest import cat_manifest
+    from ethpm_cli.config import Config
+
     config = Config(args)
     cat_manifest(config.manifest_path)
 
@@ -622,6 +869,9 @@ cat_parser.set_defaults(func=cat_action)
 
 
 def get_action(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.get import get_manifest
+    from ethpm_cli.config import Config
+
     config = Config(args)
     get_manifest(args, config)
 
@@ -650,6 +900,7 @@ get_group.add_argument(
     action="store_true",
     help="Pretty print the resolved manifest JSON.",
 )
+add_offline_arg_to_parser(get_parser)
 get_parser.set_defaults(func=get_action, pretty=False)
 
 
@@ -659,6 +910,9 @@ get_parser.set_defaults(func=get_action, pretty=False)
 
 
 def activate_action(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.activate import activate_package
+    from ethpm_cli.config import Config
+
     config = Config(args)
     activate_package(args, config)
 
@@ -674,4 +928,49 @@ activate_parser.add_argument(
 )
 add_ethpm_dir_arg_to_parser(activate_parser)
 add_keyfile_password_arg_to_parser(activate_parser)
+add_offline_arg_to_parser(activate_parser)
 activate_parser.set_defaults(func=activate_action, pretty=False)
+
+
+#
+# ethpm cache
+#
+
+
+def cache_stats_cmd(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.cache import display_cache_stats
+
+    display_cache_stats()
+
+
+def cache_prune_cmd(args: argparse.Namespace) -> None:
+    from ethpm_cli.commands.cache import prune_cache
+
+    prune_cache(args.max_size)
+
+
+cache_parser = ethpm_parser.add_parser(
+    "cache", help="Manage the local cache of fetched IPFS assets."
+)
+cache_subparsers = cache_parser.add_subparsers(dest="cache")
+
+# ethpm cache stats
+cache_stats_parser = cache_subparsers.add_parser(
+    "stats", help="Display the number and total size of cached IPFS assets."
+)
+cache_stats_parser.set_defaults(func=cache_stats_cmd)
+
+# ethpm cache prune
+cache_prune_parser = cache_subparsers.add_parser(
+    "prune",
+    help="Evict least recently used IPFS assets until the cache fits within its size limit.",
+)
+cache_prune_parser.add_argument(
+    "--max-size",
+    dest="max_size",
+    action="store",
+    type=int,
+    help="Size in bytes to prune the cache down to (defaults to the configured limit). "
+    "Use 0 to clear the cache.",
+)
+cache_prune_parser.set_defaults(func=cache_prune_cmd)
@@ -84,12 +84,63 @@ def validate_install_cli_args(args: Namespace) -> None:
             )
 
 
+def validate_fetch_jobs(jobs: int) -> None:
+    if jobs < 1:
+        raise ValidationError(
+            f"Invalid number of jobs: {jobs}. At least one job is required to fetch assets."
+        )
+
+
+def validate_confirmations(confirmations: int) -> None:
+    if confirmations < 1:
+        raise ValidationError(
+            f"Invalid number of confirmations: {confirmations}. "
+            "At least one confirmation is required to detect reorgs."
+        )
+
+
+def validate_batch_size_bounds(min_batch_size: int, max_batch_size: int) -> None:
+    if min_batch_size < 1 or max_batch_size < min_batch_size:
+        raise ValidationError(
+            f"Invalid batch size bounds: {min_batch_size} - {max_batch_size}. "
+            "The minimum batch size must be at least 1 and no larger than the maximum."
+        )
+
+
 def validate_uninstall_cli_args(args: Namespace) -> None:
     validate_package_name(args.package)
     if args.ethpm_dir:
         validate_ethpm_dir(args.ethpm_dir)
 
 
+def validate_scrape_cli_args(args: Namespace) -> None:
+    if args.chain_ids and args.chain_id:
+        raise ValidationError("Cannot use both --chains and --chain-id.")
+    if args.chain_ids and args.follow:
+        raise ValidationError("--follow can only be used to scrape a single chain.")
+
+
+def validate_update_cli_args(args: Namespace) -> None:
+    if args.all:
+        if args.package:
+            raise ValidationError(
+                "Cannot update a single package and all packages at the same time."
+            )
+        if not args.target_version:
+            raise ValidationError(
+                "Updating all packages requires a target version, use --to to set one."
+            )
+    else:
+        if not args.package:
+            raise ValidationError(
+                "Please provide a package to update, or use --all to update every package."
+            )
+        validate_package_name(args.package)
+
+    if args.ethpm_dir:
+        validate_ethpm_dir(args.ethpm_dir)
+
+
 def validate_etherscan_key_available() -> None:
     if ETHERSCAN_KEY_ENV_VAR not in os.environ:
         raise EtherscanKeyNotFound(
@@ -53,8 +53,9 @@ def test_unsupported_command():
     child.expect("\r\n")
     child.expect(
         "ethpm: error: argument command: invalid choice: 'invalid' "
-        r"\(choose from 'release', 'auth', 'registry', 'create', 'scrape', "
-        r"'install', 'update', 'uninstall', 'list', 'cat', 'get', 'activate'\)\r\n"
+        r"\(choose from 'release', 'auth', 'registry', 'create', 'scrape', 'search', "
+        r"'install', 'update', 'uninstall', 'list', 'cat', 'get', 'activate', "
+        r"'cache'\)\r\n"
     )
 
 
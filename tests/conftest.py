@@ -36,7 +36,11 @@ def config(tmpdir, monkeypatch):
     namespace.install_uri = None
     namespace.alias = None
     namespace.ethpm_dir = ethpm_dir
-    return Config(namespace)
+    config = Config(namespace)
+
+    # Initialize tmp xdg dir
+    config.setup_xdg_ethpmcli_root()
+    return config
 
 
 @pytest.fixture
@@ -0,0 +1,64 @@
+import pytest
+from web3 import Web3
+
+from ethpm_cli._utils import batch
+from ethpm_cli._utils.batch import batch_call
+
+
+@pytest.fixture
+def registry(w3):
+    w3.enable_unstable_package_management_api()
+    w3.eth.defaultAccount = w3.eth.accounts[0]
+    w3.pm.deploy_and_set_registry()
+    return w3.pm.registry.registry
+
+
+@pytest.fixture
+def w3():
+    return Web3(Web3.EthereumTesterProvider())
+
+
+def test_batch_call_without_batch_support(w3, registry):
+    assert batch_call(w3, [registry.functions.numPackageIds()]) == [0]
+
+
+def test_batch_call_splits_large_batches(w3, registry, monkeypatch):
+    sent_batches = []
+
+    def send_batch_request(provider, requests):
+        sent_batches.append(requests)
+        return [
+            {
+                "id": request["id"],
+                "result": w3.manager.request_blocking(
+                    request["method"], request["params"]
+                ).hex(),
+            }
+            for request in reversed(requests)
+        ]
+
+    monkeypatch.setattr(batch, "MAX_BATCH_SIZE", 2)
+    monkeypatch.setattr(batch, "supports_batch_requests", lambda provider: True)
+    monkeypatch.setattr(batch, "send_batch_request", send_batch_request)
+    contract_functions = [
+        registry.functions.owner(),
+        registry.functions.numPackageIds(),
+        registry.functions.getAllPackageIds(0, 10),
+    ]
+    assert batch_call(w3, contract_functions) == [
+        registry.functions.owner().call(),
+        0,
+        [[], 0],
+    ]
+    assert [len(requests) for requests in sent_batches] == [2, 1]
+
+
+def test_batch_call_raises_on_error_response(w3, registry, monkeypatch):
+    monkeypatch.setattr(batch, "supports_batch_requests", lambda provider: True)
+    monkeypatch.setattr(
+        batch,
+        "send_batch_request",
+        lambda provider, requests: [{"id": 0, "error": {"message": "reverted"}}],
+    )
+    with pytest.raises(ValueError, match="reverted"):
+        batch_call(w3, [registry.functions.numPackageIds()])
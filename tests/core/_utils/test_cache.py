@@ -0,0 +1,121 @@
+import os
+
+from ethpm._utils.ipfs import generate_file_hash
+from ethpm.backends.ipfs import BaseIPFSBackend
+import pytest
+
+from ethpm_cli._utils.cache import BlobCache, CachedIPFSBackend
+from ethpm_cli.constants import IPFS_CHUNK_SIZE
+
+BLOB = b"pragma solidity ^0.6.8;\n"
+BLOB_HASH = generate_file_hash(BLOB)
+
+
+class CountingIPFSBackend(BaseIPFSBackend):
+    def __init__(self, blobs):
+        self.blobs = blobs
+        self.fetch_count = 0
+
+    def fetch_uri_contents(self, uri):
+        self.fetch_count += 1
+        return self.blobs[uri.replace("ipfs://", "")]
+
+    def pin_assets(self, file_or_dir_path):
+        raise NotImplementedError
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return BlobCache(tmp_path / "blob_cache", 1024)
+
+
+def test_blob_cache_roundtrip(cache):
+    assert cache.get(BLOB_HASH) is None
+    cache.put(BLOB_HASH, BLOB)
+    assert cache.get(BLOB_HASH) == BLOB
+    assert cache.stats().blob_count == 1
+    assert cache.stats().total_size == len(BLOB)
+
+
+def test_blob_cache_drops_corrupted_blobs(cache):
+    cache.put(BLOB_HASH, BLOB)
+    cache.blob_path(BLOB_HASH).write_bytes(b"corrupted")
+
+    assert cache.get(BLOB_HASH) is None
+    assert not cache.blob_path(BLOB_HASH).exists()
+
+
+def test_blob_cache_serves_chunked_blobs(tmp_path):
+    # IPFS hashes of blobs over IPFS_CHUNK_SIZE can't be regenerated locally
+    blob = b"0" * (IPFS_CHUNK_SIZE + 1)
+    blob_hash = "QmcxvhkJJVpbxEAa6cgW3B6XwPJb79w9GpNUv2P2THUzZR"
+    cache = BlobCache(tmp_path / "blob_cache", 2 * IPFS_CHUNK_SIZE)
+    cache.put(blob_hash, blob)
+
+    assert cache.get(blob_hash) == blob
+    assert cache.blob_path(blob_hash).is_file()
+
+
+def test_blob_cache_only_reads_total_size_once(tmp_path, monkeypatch):
+    cache = BlobCache(tmp_path / "blob_cache", 1000)
+    cache.put(BLOB_HASH, BLOB)
+    get_blobs = cache.get_blobs
+    blob_reads = []
+
+    def count_blob_reads():
+        blob_reads.append(True)
+        return get_blobs()
+
+    monkeypatch.setattr(cache, "get_blobs", count_blob_reads)
+    blobs = [bytes([index]) * 500 for index in range(2)]
+    cache.put(generate_file_hash(blobs[0]), blobs[0])
+    assert blob_reads == []
+
+    # Only going over the size limit walks the cache, to evict blobs
+    cache.put(generate_file_hash(blobs[1]), blobs[1])
+    assert len(blob_reads) == 1
+    assert cache.stats().total_size <= 1000
+
+
+def test_blob_cache_evicts_least_recently_used(tmp_path):
+    blobs = [bytes([index]) * 400 for index in range(3)]
+    hashes = [generate_file_hash(blob) for blob in blobs]
+    cache = BlobCache(tmp_path / "blob_cache", 1000)
+
+    cache.put(hashes[0], blobs[0])
+    cache.put(hashes[1], blobs[1])
+    # Age the first two blobs, then touch the first so the second is evicted.
+    for blob_hash, age in ((hashes[0], 200), (hashes[1], 100)):
+        old_time = cache.blob_path(blob_hash).stat().st_mtime - age
+        os.utime(cache.blob_path(blob_hash), (old_time, old_time))
+    assert cache.get(hashes[0]) == blobs[0]
+    cache.put(hashes[2], blobs[2])
+
+    assert cache.get(hashes[0]) == blobs[0]
+    assert cache.get(hashes[1]) is None
+    assert cache.get(hashes[2]) == blobs[2]
+
+
+def test_blob_cache_prune(cache):
+    cache.put(BLOB_HASH, BLOB)
+    assert cache.prune(0) == (1, len(BLOB))
+    assert cache.stats().blob_count == 0
+
+
+def test_cached_ipfs_backend_only_fetches_once(cache):
+    upstream = CountingIPFSBackend({BLOB_HASH: BLOB})
+    backend = CachedIPFSBackend(lambda: upstream, cache)
+
+    assert backend.fetch_uri_contents(f"ipfs://{BLOB_HASH}") == BLOB
+    assert backend.fetch_uri_contents(f"ipfs://{BLOB_HASH}") == BLOB
+    assert upstream.fetch_count == 1
+
+
+def test_cached_ipfs_backend_does_not_build_upstream_on_hit(cache):
+    cache.put(BLOB_HASH, BLOB)
+
+    def upstream_factory():
+        raise AssertionError("Upstream IPFS backend should not be built.")
+
+    backend = CachedIPFSBackend(upstream_factory, cache)
+    assert backend.fetch_uri_contents(f"ipfs://{BLOB_HASH}") == BLOB
@@ -1,8 +1,24 @@
+from argparse import Namespace
 import json
 
 from ethpm import get_ethpm_spec_dir
+from ethpm.backends.ipfs import BaseIPFSBackend
+import pytest
 
-from ethpm_cli._utils.ipfs import pin_local_manifest
+from ethpm_cli._utils import ipfs
+from ethpm_cli._utils.ipfs import (
+    IPFSMirror,
+    ScrapedIPFSBackend,
+    get_ipfs_asset_path,
+    get_ipfs_backend,
+    pin_local_manifest,
+)
+from ethpm_cli._utils.xdg import get_xdg_ethpmcli_root
+from ethpm_cli.commands.package import Package
+from ethpm_cli.constants import IPFS_CHUNK_SIZE
+from ethpm_cli.exceptions import OfflineError
+
+OWNED_MANIFEST_HASH = "QmcxvhkJJVpbxEAa6cgW3B6XwPJb79w9GpNUv2P2THUzZR"
 
 
 def test_pin_local_manifest(test_assets_dir):
@@ -15,3 +31,104 @@ def test_pin_local_manifest(test_assets_dir):
     assert package_name == expected_manifest["name"]
     assert package_version == expected_manifest["version"]
     assert manifest_uri == "ipfs://QmcxvhkJJVpbxEAa6cgW3B6XwPJb79w9GpNUv2P2THUzZR"
+
+
+def test_ipfs_mirror_fetches_each_asset_once(tmp_path, monkeypatch):
+    fetched_uris = []
+
+    def resolve_uri_contents(uri):
+        fetched_uris.append(uri)
+        return b"contents"
+
+    monkeypatch.setattr(ipfs, "resolve_uri_contents", resolve_uri_contents)
+    uri = f"ipfs://{OWNED_MANIFEST_HASH}"
+    with IPFSMirror(tmp_path, 4) as mirror:
+        mirror.mirror([uri] * 10)
+        assert mirror.fetch(uri) == b"contents"
+
+    assert fetched_uris == [uri]
+    asset_path = get_ipfs_asset_path(tmp_path, OWNED_MANIFEST_HASH)
+    assert asset_path == tmp_path / "Qm" / "cx" / "vh" / OWNED_MANIFEST_HASH
+    assert asset_path.read_bytes() == b"contents"
+
+
+def test_ipfs_mirror_skips_assets_already_on_disk(tmp_path, monkeypatch):
+    def resolve_uri_contents(uri):
+        raise AssertionError("Mirrored assets should not be fetched again.")
+
+    monkeypatch.setattr(ipfs, "resolve_uri_contents", resolve_uri_contents)
+    asset_path = get_ipfs_asset_path(tmp_path, OWNED_MANIFEST_HASH)
+    asset_path.parent.mkdir(parents=True)
+    asset_path.write_bytes(b"contents")
+
+    with IPFSMirror(tmp_path, 4) as mirror:
+        assert mirror.fetch(f"ipfs://{OWNED_MANIFEST_HASH}") == b"contents"
+
+
+class FallbackIPFSBackend(BaseIPFSBackend):
+    def __init__(self):
+        self.fetched_uris = []
+
+    def fetch_uri_contents(self, uri):
+        self.fetched_uris.append(uri)
+        return b"fallback"
+
+    def pin_assets(self, file_or_dir_path):
+        raise NotImplementedError
+
+
+def write_scraped_asset(ipfs_dir, ipfs_hash, contents):
+    asset_path = get_ipfs_asset_path(ipfs_dir, ipfs_hash)
+    asset_path.parent.mkdir(parents=True, exist_ok=True)
+    asset_path.write_bytes(contents)
+
+
+def test_scraped_ipfs_backend_serves_scraped_assets(tmp_path, owned_pkg_data):
+    write_scraped_asset(
+        tmp_path, OWNED_MANIFEST_HASH, owned_pkg_data["raw_manifest"],
+    )
+    fallback = FallbackIPFSBackend()
+    backend = ScrapedIPFSBackend(tmp_path, fallback)
+
+    assert (
+        backend.fetch_uri_contents(owned_pkg_data["ipfs_uri"])
+        == owned_pkg_data["raw_manifest"]  # noqa: W503
+    )
+    assert fallback.fetched_uris == []
+
+
+def test_scraped_ipfs_backend_falls_back_on_missing_or_corrupted_assets(tmp_path):
+    fallback = FallbackIPFSBackend()
+    backend = ScrapedIPFSBackend(tmp_path, fallback)
+    uri = f"ipfs://{OWNED_MANIFEST_HASH}"
+    assert backend.fetch_uri_contents(uri) == b"fallback"
+
+    write_scraped_asset(tmp_path, OWNED_MANIFEST_HASH, b"corrupted")
+    assert backend.fetch_uri_contents(uri) == b"fallback"
+    assert fallback.fetched_uris == [uri, uri]
+
+
+def test_offline_ipfs_backend_reads_scraped_assets(owned_pkg_data):
+    write_scraped_asset(
+        get_xdg_ethpmcli_root(), OWNED_MANIFEST_HASH, owned_pkg_data["raw_manifest"],
+    )
+    package = Package(
+        Namespace(uri=owned_pkg_data["ipfs_uri"], alias=None),
+        get_ipfs_backend(offline=True),
+    )
+    assert package.manifest == owned_pkg_data["manifest"]
+
+
+def test_offline_ipfs_backend_raises_on_missing_assets():
+    with pytest.raises(OfflineError, match="can't be fetched in offline mode"):
+        get_ipfs_backend(offline=True).fetch_uri_contents(
+            f"ipfs://{OWNED_MANIFEST_HASH}"
+        )
+
+
+def test_offline_ipfs_backend_reads_chunked_scraped_assets():
+    # IPFS hashes of assets over IPFS_CHUNK_SIZE can't be regenerated locally
+    contents = b"0" * (IPFS_CHUNK_SIZE + 1)
+    write_scraped_asset(get_xdg_ethpmcli_root(), OWNED_MANIFEST_HASH, contents)
+    backend = get_ipfs_backend(offline=True)
+    assert backend.fetch_uri_contents(f"ipfs://{OWNED_MANIFEST_HASH}") == contents
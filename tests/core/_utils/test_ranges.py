@@ -0,0 +1,50 @@
+import pytest
+
+from ethpm_cli._utils.ranges import BlockRangeSet
+from ethpm_cli.exceptions import ValidationError
+
+
+@pytest.mark.parametrize(
+    "ranges,expected",
+    (
+        ([(0, 2), (4, 4), (6, 9)], [(0, 2), (4, 4), (6, 9)]),
+        ([(6, 9), (0, 2), (4, 4)], [(0, 2), (4, 4), (6, 9)]),
+        ([(0, 2), (3, 5)], [(0, 5)]),
+        ([(0, 2), (4, 6), (1, 5)], [(0, 6)]),
+        ([(0, 10), (2, 3)], [(0, 10)]),
+        ([(4, 6), (0, 2), (8, 9), (3, 7)], [(0, 9)]),
+    ),
+)
+def test_block_range_set_merges_on_insert(ranges, expected):
+    assert list(BlockRangeSet(ranges)) == expected
+
+
+@pytest.mark.parametrize(
+    "start,end,expected",
+    (
+        (0, 2, True),
+        (1, 1, True),
+        (6, 9, True),
+        (2, 4, False),
+        (3, 3, False),
+        (9, 10, False),
+    ),
+)
+def test_block_range_set_covers(start, end, expected):
+    block_ranges = BlockRangeSet([(0, 2), (4, 4), (6, 9)])
+
+    assert block_ranges.covers(start, end) is expected
+
+
+def test_block_range_set_chain_data_roundtrip():
+    scraped_blocks = [{"min": "0", "max": "6"}, {"min": "9", "max": "14"}]
+    block_ranges = BlockRangeSet.from_chain_data(scraped_blocks)
+
+    assert 6 in block_ranges
+    assert 7 not in block_ranges
+    assert block_ranges.to_chain_data() == scraped_blocks
+
+
+def test_block_range_set_rejects_invalid_ranges():
+    with pytest.raises(ValidationError):
+        BlockRangeSet([(2, 1)])
@@ -0,0 +1,57 @@
+import pytest
+
+from ethpm_cli._utils.release_index import IndexedRelease, Release, ReleaseIndex
+
+REGISTRY = "0x" + "ab" * 20
+OTHER_REGISTRY = "0x" + "cd" * 20
+
+OWNED_1 = Release("owned", "1.0.0", "ipfs://Qm1", 3, "0x" + "01" * 32, 0)
+OWNED_2 = Release("owned", "2.0.0", "ipfs://Qm2", 7, "0x" + "02" * 32, 0)
+WALLET = Release("wallet", "1.0.0", "ipfs://Qm3", 7, "0x" + "02" * 32, 1)
+STANDARD_TOKEN = Release(
+    "standard-token", "1.0.0", "ipfs://Qm4", 9, "0x" + "03" * 32, 0
+)
+
+
+@pytest.fixture
+def release_index(tmp_path):
+    release_index = ReleaseIndex(tmp_path / "releases.db")
+    release_index.add_releases(1, {REGISTRY: [OWNED_1, OWNED_2, WALLET]})
+    release_index.add_releases(3, {OTHER_REGISTRY: [STANDARD_TOKEN]})
+    yield release_index
+    release_index.close()
+
+
+@pytest.mark.parametrize(
+    "filters,expected",
+    (
+        ({}, (OWNED_1, OWNED_2, WALLET, STANDARD_TOKEN)),
+        ({"package_name": "owned"}, (OWNED_1, OWNED_2)),
+        ({"package_name": "token"}, (STANDARD_TOKEN,)),
+        ({"version": "1.0.0"}, (OWNED_1, WALLET, STANDARD_TOKEN)),
+        ({"package_name": "owned", "version": "2.0.0"}, (OWNED_2,)),
+        ({"registry_address": OTHER_REGISTRY}, (STANDARD_TOKEN,)),
+        ({"chain_id": 1, "version": "1.0.0"}, (OWNED_1, WALLET)),
+        ({"package_name": "missing"}, ()),
+    ),
+)
+def test_release_index_search(release_index, filters, expected):
+    actual = release_index.search(**filters)
+    assert tuple(indexed.release for indexed in actual) == expected
+
+
+def test_release_index_search_returns_registry_uri(release_index):
+    (actual,) = release_index.search(package_name="standard-token")
+    assert actual == IndexedRelease(3, OTHER_REGISTRY, STANDARD_TOKEN)
+    assert actual.registry_uri == f"erc1319://{OTHER_REGISTRY}:3"
+
+
+def test_release_index_ignores_releases_already_indexed(release_index):
+    release_index.add_releases(1, {REGISTRY: [OWNED_1, WALLET]})
+    assert len(release_index.search(chain_id=1)) == 3
+
+
+def test_release_index_persists_to_disk(release_index, tmp_path):
+    reopened_index = ReleaseIndex(tmp_path / "releases.db")
+    assert reopened_index.search() == release_index.search()
+    reopened_index.close()
@@ -0,0 +1,118 @@
+import pytest
+
+from ethpm_cli._utils import release_logs
+
+
+def test_get_block_version_release_logs_splits_rejected_windows(monkeypatch):
+    requested_windows = []
+
+    def get_logs_in_window(w3, from_block, to_block, address):
+        requested_windows.append((from_block, to_block))
+        if to_block - from_block >= 25:
+            raise ValueError(
+                {"code": -32005, "message": "query returned more than 10000 results"}
+            )
+        return [{"blockNumber": block} for block in range(from_block, to_block + 1)]
+
+    monkeypatch.setattr(
+        release_logs, "get_version_release_logs_in_window", get_logs_in_window
+    )
+    batch_size = release_logs.AdaptiveBatchSize(1, 1000, 100)
+    logs = release_logs.get_block_version_release_logs(None, 0, 99, batch_size)
+
+    assert [log["blockNumber"] for log in logs] == list(range(100))
+    assert requested_windows == [
+        (0, 99),
+        (0, 49),
+        (0, 24),
+        (25, 49),
+        (50, 74),
+        (75, 99),
+    ]
+    assert batch_size.size == 25
+
+
+def test_get_block_version_release_logs_grows_on_empty_windows(monkeypatch):
+    requested_windows = []
+
+    def get_logs_in_window(w3, from_block, to_block, address):
+        requested_windows.append((from_block, to_block))
+        return []
+
+    monkeypatch.setattr(
+        release_logs, "get_version_release_logs_in_window", get_logs_in_window
+    )
+    batch_size = release_logs.AdaptiveBatchSize(1, 40, 10)
+    release_logs.get_block_version_release_logs(None, 0, 99, batch_size)
+
+    assert requested_windows == [(0, 9), (10, 29), (30, 69), (70, 99)]
+    assert batch_size.size == 40
+
+
+def test_get_block_version_release_logs_raises_unrelated_errors(monkeypatch):
+    def get_logs_in_window(w3, from_block, to_block, address):
+        raise ValueError({"code": -32601, "message": "method not found"})
+
+    monkeypatch.setattr(
+        release_logs, "get_version_release_logs_in_window", get_logs_in_window
+    )
+    with pytest.raises(ValueError, match="method not found"):
+        release_logs.get_block_version_release_logs(None, 0, 99)
+
+
+@pytest.mark.parametrize(
+    "message",
+    ("header not found in range", "daily request limit reached", "execution timeout"),
+)
+def test_get_block_version_release_logs_raises_similar_unrelated_errors(
+    message, monkeypatch
+):
+    def get_logs_in_window(w3, from_block, to_block, address):
+        raise ValueError({"code": -32000, "message": message})
+
+    monkeypatch.setattr(
+        release_logs, "get_version_release_logs_in_window", get_logs_in_window
+    )
+    with pytest.raises(ValueError, match=message):
+        release_logs.get_block_version_release_logs(None, 0, 99)
+
+
+def test_get_block_version_release_logs_backs_off_when_rate_limited(monkeypatch):
+    requested_windows = []
+    backoffs = []
+
+    def get_logs_in_window(w3, from_block, to_block, address):
+        requested_windows.append((from_block, to_block))
+        if len(requested_windows) <= 2:
+            raise ValueError({"code": 429, "message": "Rate limit exceeded"})
+        return []
+
+    monkeypatch.setattr(
+        release_logs, "get_version_release_logs_in_window", get_logs_in_window
+    )
+    monkeypatch.setattr(release_logs.time, "sleep", backoffs.append)
+    batch_size = release_logs.AdaptiveBatchSize(1, 100, 100)
+    release_logs.get_block_version_release_logs(None, 0, 99, batch_size)
+
+    assert requested_windows == [(0, 99), (0, 99), (0, 99)]
+    assert backoffs == [
+        release_logs.RATE_LIMIT_BACKOFF,
+        release_logs.RATE_LIMIT_BACKOFF * 2,
+    ]
+    assert batch_size.size == 100
+
+
+def test_get_block_version_release_logs_raises_when_rate_limited_too_often(
+    monkeypatch,
+):
+    def get_logs_in_window(w3, from_block, to_block, address):
+        raise ValueError({"code": 429, "message": "Too Many Requests"})
+
+    monkeypatch.setattr(
+        release_logs, "get_version_release_logs_in_window", get_logs_in_window
+    )
+    backoffs = []
+    monkeypatch.setattr(release_logs.time, "sleep", backoffs.append)
+    with pytest.raises(ValueError, match="Too Many Requests"):
+        release_logs.get_block_version_release_logs(None, 0, 99)
+    assert len(backoffs) == release_logs.RATE_LIMIT_RETRIES
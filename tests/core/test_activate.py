@@ -0,0 +1,55 @@
+import pytest
+from web3 import Web3
+
+from ethpm_cli.commands import activate
+from ethpm_cli.commands.activate import ConsoleNamespace, Web3Cache, get_matching_w3
+from ethpm_cli.exceptions import ValidationError
+
+MAINNET_BLOCK_URI = (
+    "blockchain://d4e56740f876aef8c010b86a40d5f56745a118d0906a34e69aec8c0db1cb8fa3"
+    "/block/752820c0ad7abc1200f9ad42c4adc6fbb4bd44b5bed4667990e64565102c1ba6"
+)
+
+
+@pytest.fixture
+def setup_chain_ids(monkeypatch):
+    setup_chain_ids = []
+
+    def setup_w3(chain_id, private_key=None):
+        setup_chain_ids.append(chain_id)
+        return Web3(Web3.EthereumTesterProvider())
+
+    monkeypatch.setattr(activate, "setup_w3", setup_w3)
+    return setup_chain_ids
+
+
+def test_console_namespace_sets_up_w3s_on_first_use(setup_chain_ids):
+    namespace = ConsoleNamespace(Web3Cache(), {"get_factory": activate.get_factory})
+    assert namespace["get_factory"] is activate.get_factory
+    assert setup_chain_ids == []
+
+    ropsten_w3 = namespace["ropsten_w3"]
+    assert isinstance(ropsten_w3, Web3)
+    assert namespace["ropsten_w3"] is ropsten_w3
+    assert setup_chain_ids == [3]
+
+    with pytest.raises(KeyError):
+        namespace["xdai_w3"]
+
+
+def test_web3_cache_gets_w3s_by_chain_name(setup_chain_ids):
+    w3_cache = Web3Cache()
+    ropsten_w3 = w3_cache.get_by_name("ropsten")
+    assert w3_cache.get(3) is ropsten_w3
+    assert setup_chain_ids == [3]
+
+    with pytest.raises(ValidationError, match="Chain: xdai is not supported."):
+        w3_cache.get_by_name("xdai")
+
+
+def test_deployments_share_w3s_with_console(setup_chain_ids):
+    w3_cache = Web3Cache()
+    w3, chain_name = get_matching_w3(MAINNET_BLOCK_URI, w3_cache)
+    assert chain_name == "mainnet"
+    assert ConsoleNamespace(w3_cache, {})["mainnet_w3"] is w3
+    assert setup_chain_ids == [1]
@@ -1,8 +1,12 @@
 from argparse import Namespace
+import json
 from pathlib import Path
 
+from ethpm._utils.ipfs import generate_file_hash
 import pytest
 
+from ethpm_cli import config as config_module
+from ethpm_cli._utils.cache import get_blob_cache
 from ethpm_cli._utils.xdg import get_xdg_ethpmcli_root
 from ethpm_cli.config import Config
 from ethpm_cli.constants import (
@@ -11,6 +15,10 @@ from ethpm_cli.constants import (
     IPFS_CHAIN_DATA,
     KEYFILE_PATH,
 )
+from ethpm_cli.exceptions import ValidationError
+
+BLOB = b"pragma solidity ^0.6.8;\n"
+BLOB_HASH = generate_file_hash(BLOB)
 
 
 @pytest.fixture
@@ -72,11 +80,60 @@ def test_config_initializes_with_correct_w3_instance(namespace, chain_id, expect
 
 def test_config_with_unsupported_chain_id_raises_exception(namespace):
     namespace.chain_id = 2
+    config = Config(namespace)
     with pytest.raises(Exception):
-        Config(namespace)
+        config.w3
 
 
 def test_config_initializes_xdg_dir(config):
     xdg_ethpm_dir = get_xdg_ethpmcli_root()
     assert (xdg_ethpm_dir / KEYFILE_PATH).is_file()
     assert (xdg_ethpm_dir / IPFS_CHAIN_DATA).is_file()
+
+
+def test_config_sets_up_lazily(tmpdir, namespace, monkeypatch):
+    def fail(*args):
+        raise AssertionError("Config set up eagerly.")
+
+    monkeypatch.setenv("XDG_ETHPMCLI_ROOT", str(Path(tmpdir) / "lazy_xdg_dir"))
+    monkeypatch.setattr(config_module, "setup_w3", fail)
+    monkeypatch.setattr(config_module, "get_ipfs_backend", fail)
+    monkeypatch.setattr(config_module, "get_authorized_private_key", fail)
+    namespace.ethpm_dir = None
+    namespace.keyfile_password = "password"
+    config = Config(namespace)
+    assert config.ethpm_dir.is_dir()
+    assert not get_xdg_ethpmcli_root().exists()
+
+    xdg_ethpm_dir = config.xdg_ethpmcli_root
+    assert xdg_ethpm_dir == get_xdg_ethpmcli_root()
+    chain_data = json.loads((xdg_ethpm_dir / IPFS_CHAIN_DATA).read_text())
+    assert chain_data["chain_id"] == 1
+
+
+def test_config_sets_up_xdg_dir_created_by_cache_writes(tmpdir, namespace, monkeypatch):
+    monkeypatch.setenv("XDG_ETHPMCLI_ROOT", str(Path(tmpdir) / "cached_xdg_dir"))
+    namespace.ethpm_dir = None
+    config = Config(namespace)
+    # e.g. an IPFS asset cached before anything reads config.xdg_ethpmcli_root
+    get_blob_cache().put(BLOB_HASH, BLOB)
+    assert get_xdg_ethpmcli_root().is_dir()
+    assert not (get_xdg_ethpmcli_root() / IPFS_CHAIN_DATA).exists()
+
+    xdg_ethpm_dir = config.xdg_ethpmcli_root
+    assert (xdg_ethpm_dir / KEYFILE_PATH).is_file()
+    assert (xdg_ethpm_dir / IPFS_CHAIN_DATA).is_file()
+    assert get_blob_cache().get(BLOB_HASH) == BLOB
+
+
+@pytest.mark.parametrize(
+    "missing_file,message",
+    (
+        (IPFS_CHAIN_DATA, "No IPFS chain data file found."),
+        (KEYFILE_PATH, "No keyfile found."),
+    ),
+)
+def test_config_rejects_invalid_xdg_dir(config, namespace, missing_file, message):
+    (get_xdg_ethpmcli_root() / missing_file).unlink()
+    with pytest.raises(ValidationError, match=message):
+        Config(namespace).setup_xdg_ethpmcli_root()
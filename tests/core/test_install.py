@@ -1,17 +1,34 @@
 from argparse import Namespace
+import json
 import logging
+import shutil
 
 import pytest
 
 from ethpm_cli._utils.filesystem import check_dir_trees_equal
+from ethpm_cli._utils.journal import write_journal
+from ethpm_cli.commands import install
 from ethpm_cli.commands.install import (
+    REPLACED_PACKAGE_DIR,
+    get_updatable_package_releases,
     install_package,
     list_installed_packages,
+    prefetch_package_assets,
+    recover_interrupted_operation,
+    replace_installed_package,
+    resolve_target_version,
     uninstall_package,
+    update_all_packages,
 )
-from ethpm_cli.commands.package import Package
-from ethpm_cli.constants import ETHPM_PACKAGES_DIR
-from ethpm_cli.exceptions import InstallError
+from ethpm_cli.commands.package import InstalledPackage, Package
+from ethpm_cli.commands.registry import StoredRegistry
+from ethpm_cli.constants import (
+    DEPENDENCY_STORE_DIR,
+    ETHPM_PACKAGES_DIR,
+    JOURNAL_NAME,
+    STAGING_DIR,
+)
+from ethpm_cli.exceptions import InstallError, ValidationError
 
 OWNED_MANIFEST_IPFS_URI = "ipfs://QmcxvhkJJVpbxEAa6cgW3B6XwPJb79w9GpNUv2P2THUzZR"
 WALLET_MANIFEST_IPFS_URI = "ipfs://QmRALeFkttSr6DLmPiNtAqLcMJYXu4BK3SjZGVgW8VASnm"
@@ -56,6 +73,96 @@ def test_install_package(args, pkg_name, install_type, config, test_assets_dir):
     assert check_dir_trees_equal(config.ethpm_dir, expected_package)
 
 
+@pytest.mark.parametrize("jobs", (1, 8))
+def test_install_package_is_deterministic_across_jobs(
+    jobs, config, wallet_pkg, test_assets_dir
+):
+    install_package(wallet_pkg, config, jobs)
+
+    expected_package = test_assets_dir / "wallet" / "ipfs_uri" / ETHPM_PACKAGES_DIR
+    assert check_dir_trees_equal(config.ethpm_dir, expected_package)
+
+
+def test_install_package_with_invalid_jobs_raises_exception(config, owned_pkg):
+    with pytest.raises(ValidationError, match="Invalid number of jobs"):
+        install_package(owned_pkg, config, 0)
+
+
+def test_prefetch_package_assets_fetches_each_asset_once(
+    config, wallet_pkg, monkeypatch
+):
+    fetched_uris = []
+    fetch_uri_contents = config.ipfs_backend.fetch_uri_contents
+
+    def recording_fetch_uri_contents(uri):
+        fetched_uris.append(uri)
+        return fetch_uri_contents(uri)
+
+    monkeypatch.setattr(
+        config.ipfs_backend, "fetch_uri_contents", recording_fetch_uri_contents
+    )
+    prefetched_backend = prefetch_package_assets(wallet_pkg, config.ipfs_backend, 4)
+
+    assert len(fetched_uris) == len(set(fetched_uris))
+    # build dependency manifests, sources and docs are all served from memory
+    assert "QmWnPsiS3Xb8GvCDEBFnnKs8Yk4HaAX6rCqJAaQXGbCoPk" in prefetched_backend.assets
+    assert OWNED_MANIFEST_IPFS_URI[7:] in prefetched_backend.assets
+
+
+def test_install_package_with_dedupe_links_build_dependencies(
+    config, owned_pkg, wallet_pkg, test_assets_dir
+):
+    install_package(owned_pkg, config, dedupe=True)
+    install_package(wallet_pkg, config, dedupe=True)
+
+    wallet_deps_dir = config.ethpm_dir / "wallet" / ETHPM_PACKAGES_DIR
+    store_dir = config.ethpm_dir / DEPENDENCY_STORE_DIR
+    assert (wallet_deps_dir / "owned").is_symlink()
+    assert (wallet_deps_dir / "safe-math-lib").is_symlink()
+    assert (wallet_deps_dir / "owned").resolve() == (
+        store_dir / OWNED_MANIFEST_IPFS_URI[7:]
+    ).resolve()
+    assert len(list(store_dir.iterdir())) == 2
+    # Resolved install tree matches a regular install
+    assert check_dir_trees_equal(
+        config.ethpm_dir / "wallet",
+        test_assets_dir / "multiple" / ETHPM_PACKAGES_DIR / "wallet",
+    )
+
+
+def test_uninstall_package_removes_unreferenced_store_entries(config, wallet_pkg):
+    install_package(wallet_pkg, config, dedupe=True)
+    aliased_wallet_pkg = Package(
+        Namespace(uri=WALLET_MANIFEST_IPFS_URI, alias="wallet-alias"),
+        config.ipfs_backend,
+    )
+    install_package(aliased_wallet_pkg, config, dedupe=True)
+    store_dir = config.ethpm_dir / DEPENDENCY_STORE_DIR
+
+    uninstall_package("wallet", config)
+    assert len(list(store_dir.iterdir())) == 2
+
+    uninstall_package("wallet-alias", config)
+    assert not store_dir.exists()
+
+
+def test_replace_installed_package_keeps_dedupe_mode(config, owned_pkg):
+    install_package(owned_pkg, config, dedupe=True)
+    updated_pkg = Package(
+        Namespace(uri=WALLET_MANIFEST_IPFS_URI, alias="owned"), config.ipfs_backend
+    )
+
+    replace_installed_package("owned", updated_pkg, config, 1)
+
+    lockfile = json.loads((config.ethpm_dir / "ethpm.lock").read_text())
+    assert lockfile["owned"]["dedupe"] is True
+    assert (config.ethpm_dir / "owned" / ETHPM_PACKAGES_DIR / "owned").is_symlink()
+    assert len(list((config.ethpm_dir / DEPENDENCY_STORE_DIR).iterdir())) == 2
+
+    replace_installed_package("owned", owned_pkg, config, 1)
+    assert not (config.ethpm_dir / DEPENDENCY_STORE_DIR).exists()
+
+
 def test_install_package_with_ens_in_registry_uri(config):
     uri = Namespace(
         uri="erc1319://0x3F0ED4f69f21ca9d8748c860Ecd0aB6da44BA75a:1/ens@1.0.0"
@@ -125,6 +232,81 @@ def test_uninstall_packages(
     )
 
 
+def test_recover_rolls_forward_interrupted_uninstall(
+    config, test_assets_dir, owned_pkg, wallet_pkg
+):
+    install_package(owned_pkg, config)
+    install_package(wallet_pkg, config)
+    # Simulate an uninstall interrupted after staging the package dir
+    write_journal(config.ethpm_dir, {"operation": "uninstall", "package": "owned"})
+    (config.ethpm_dir / STAGING_DIR).mkdir()
+    (config.ethpm_dir / "owned").replace(config.ethpm_dir / STAGING_DIR / "owned")
+
+    recover_interrupted_operation(config)
+
+    assert not (config.ethpm_dir / JOURNAL_NAME).exists()
+    assert check_dir_trees_equal(
+        config.ethpm_dir, (test_assets_dir / "wallet" / "ipfs_uri" / ETHPM_PACKAGES_DIR)
+    )
+
+
+def test_recover_rolls_back_unstaged_uninstall(
+    config, test_assets_dir, owned_pkg, wallet_pkg
+):
+    install_package(owned_pkg, config)
+    install_package(wallet_pkg, config)
+    write_journal(config.ethpm_dir, {"operation": "uninstall", "package": "owned"})
+
+    recover_interrupted_operation(config)
+
+    assert not (config.ethpm_dir / JOURNAL_NAME).exists()
+    assert check_dir_trees_equal(
+        config.ethpm_dir, (test_assets_dir / "multiple" / ETHPM_PACKAGES_DIR)
+    )
+
+
+def test_replace_installed_package(config, owned_pkg, wallet_pkg):
+    install_package(owned_pkg, config)
+    install_package(wallet_pkg, config)
+    updated_pkg = Package(
+        Namespace(uri=WALLET_MANIFEST_IPFS_URI, alias="owned"), config.ipfs_backend
+    )
+
+    replace_installed_package("owned", updated_pkg, config, 1)
+
+    lockfile = json.loads((config.ethpm_dir / "ethpm.lock").read_text())
+    assert lockfile["owned"] == updated_pkg.generate_ethpm_lock()
+    assert not (config.ethpm_dir / STAGING_DIR).exists()
+    assert check_dir_trees_equal(
+        config.ethpm_dir / "owned", config.ethpm_dir / "wallet"
+    )
+
+
+def test_recover_rolls_back_interrupted_update(
+    config, test_assets_dir, owned_pkg, wallet_pkg
+):
+    install_package(owned_pkg, config)
+    install_package(wallet_pkg, config)
+    lockfile = json.loads((config.ethpm_dir / "ethpm.lock").read_text())
+    # Simulate an update interrupted after swapping in the new package dir
+    write_journal(
+        config.ethpm_dir,
+        {"operation": "update", "package": "owned", "lock": lockfile["owned"]},
+    )
+    (config.ethpm_dir / STAGING_DIR).mkdir()
+    (config.ethpm_dir / "owned").replace(
+        config.ethpm_dir / STAGING_DIR / REPLACED_PACKAGE_DIR
+    )
+    shutil.copytree(config.ethpm_dir / "wallet", config.ethpm_dir / "owned")
+
+    recover_interrupted_operation(config)
+
+    assert not (config.ethpm_dir / JOURNAL_NAME).exists()
+    assert check_dir_trees_equal(
+        config.ethpm_dir, (test_assets_dir / "multiple" / ETHPM_PACKAGES_DIR)
+    )
+
+
 def test_uninstall_package_warns_if_package_doesnt_exist(config):
     with pytest.raises(InstallError, match="No package with the name invalid"):
         uninstall_package("invalid", config)
@@ -149,3 +331,108 @@ def test_list(config, owned_pkg, wallet_pkg, caplog):
         assert (
             f"- owned==1.0.0 --- ({OWNED_MANIFEST_IPFS_URI})\n" in caplog.text
         )  # noqa: E501
+
+
+def test_get_updatable_package_releases_skips_packages_from_other_registries(
+    config, caplog
+):
+    installed_package = InstalledPackage(
+        alias="owned",
+        install_uri="erc1319://0x1230000000000000000000000000000000000000:1/owned@1.0.0",
+        registry_address="0x1230000000000000000000000000000000000000",
+        resolved_content_hash="QmcxvhkJJVpbxEAa6cgW3B6XwPJb79w9GpNUv2P2THUzZR",
+        resolved_package_name="owned",
+        resolved_version="1.0.0",
+        resolved_uri=OWNED_MANIFEST_IPFS_URI,
+    )
+    active_registry = StoredRegistry(
+        "erc1319://0xabc0000000000000000000000000000000000000:1", "mine", True
+    )
+    with caplog.at_level(logging.INFO):
+        release_data = get_updatable_package_releases(
+            installed_package, active_registry, None, config
+        )
+    assert release_data is None
+    assert "Skipping owned" in caplog.text
+
+
+OWNED_RELEASE_DATA = (
+    ("1.0.0", OWNED_MANIFEST_IPFS_URI),
+    ("2.0.0", WALLET_MANIFEST_IPFS_URI),
+)
+
+
+@pytest.mark.parametrize(
+    "target_version,expected", (("latest", "2.0.0"), ("1.0.0", "1.0.0"))
+)
+def test_resolve_target_version(owned_pkg, target_version, expected):
+    installed_package = InstalledPackage(**owned_pkg.generate_ethpm_lock())
+    actual = resolve_target_version(
+        target_version, installed_package, OWNED_RELEASE_DATA
+    )
+    assert actual == expected
+
+
+def test_resolve_target_version_rejects_missing_version(owned_pkg):
+    installed_package = InstalledPackage(**owned_pkg.generate_ethpm_lock())
+    with pytest.raises(InstallError, match="Version unavailable: owned@3.0.0."):
+        resolve_target_version("3.0.0", installed_package, OWNED_RELEASE_DATA)
+
+
+@pytest.fixture
+def registry_releases(monkeypatch):
+    """
+    Serves the release data of installed packages as if read from the active registry.
+    """
+    all_release_data = {
+        "owned": OWNED_RELEASE_DATA,
+        "wallet": (("1.0.0", WALLET_MANIFEST_IPFS_URI),),
+    }
+
+    def get_installed_package_releases(installed_package, *args):
+        return all_release_data[installed_package.resolved_package_name]
+
+    monkeypatch.setattr(install, "connect_to_active_registry", lambda config: None)
+    monkeypatch.setattr(
+        install, "prefetch_installed_package_releases", lambda *args: None
+    )
+    monkeypatch.setattr(
+        install, "get_installed_package_releases", get_installed_package_releases
+    )
+
+
+def test_update_all_packages_to_latest(
+    config, owned_pkg, wallet_pkg, registry_releases, caplog
+):
+    install_package(owned_pkg, config)
+    install_package(wallet_pkg, config)
+    args = Namespace(target_version="latest", jobs=1)
+
+    with caplog.at_level(logging.INFO):
+        update_all_packages(args, config)
+
+    lockfile = json.loads((config.ethpm_dir / "ethpm.lock").read_text())
+    assert lockfile["owned"]["resolved_uri"] == WALLET_MANIFEST_IPFS_URI
+    assert lockfile["wallet"]["resolved_uri"] == WALLET_MANIFEST_IPFS_URI
+    assert check_dir_trees_equal(
+        config.ethpm_dir / "owned", config.ethpm_dir / "wallet"
+    )
+    assert "owned successfully updated to version 2.0.0." in caplog.text
+    assert "wallet already at version: 1.0.0." in caplog.text
+
+
+def test_update_all_packages_skips_packages_without_target_version(
+    config, owned_pkg, wallet_pkg, registry_releases, caplog
+):
+    install_package(wallet_pkg, config)
+    install_package(owned_pkg, config)
+    args = Namespace(target_version="2.0.0", jobs=1)
+
+    with caplog.at_level(logging.INFO):
+        update_all_packages(args, config)
+
+    lockfile = json.loads((config.ethpm_dir / "ethpm.lock").read_text())
+    assert lockfile["owned"]["resolved_uri"] == WALLET_MANIFEST_IPFS_URI
+    assert lockfile["wallet"]["resolved_uri"] == WALLET_MANIFEST_IPFS_URI
+    assert "Skipping wallet: Version unavailable: wallet@2.0.0." in caplog.text
+    assert "owned successfully updated to version 2.0.0." in caplog.text
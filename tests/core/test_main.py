@@ -0,0 +1,49 @@
+import json
+import subprocess
+import sys
+
+# Modules only needed by some commands, which shouldn't be loaded by the entry point
+COMMAND_DEPENDENCIES = (
+    "IPython",
+    "eth_account",
+    "eth_keyfile",
+    "ethpm",
+    "pkg_resources",
+    "requests",
+    "web3",
+)
+
+# Budget (in microseconds) for importing the entry point, i.e. every command's parser
+IMPORT_TIME_BUDGET = 250_000
+
+
+def test_entry_point_does_not_import_command_dependencies():
+    output = subprocess.check_output(
+        [
+            sys.executable,
+            "-c",
+            "import json, sys, ethpm_cli.main; print(json.dumps(sorted(sys.modules)))",
+        ]
+    )
+    imported_packages = {module.split(".")[0] for module in json.loads(output)}
+    assert imported_packages.isdisjoint(COMMAND_DEPENDENCIES)
+
+
+def test_entry_point_import_time_budget():
+    import_times = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import ethpm_cli.main"],
+        stderr=subprocess.PIPE,
+        check=True,
+    ).stderr.decode()
+    # Each line reads "import time: <self us> | <cumulative us> | <module>",
+    # after a header line
+    import_time_lines = [
+        line.split("|")
+        for line in import_times.splitlines()
+        if line.startswith("import time:")
+    ]
+    cumulative_import_times = {
+        module.strip(): int(cumulative)
+        for _, cumulative, module in import_time_lines[1:]
+    }
+    assert cumulative_import_times["ethpm_cli"] < IMPORT_TIME_BUDGET
@@ -1,10 +1,12 @@
 import json
+import logging
 
 import pytest
 
 from ethpm_cli.commands.registry import (
     activate_registry,
     add_registry,
+    display_packages,
     generate_registry_store_data,
     remove_registry,
     resolve_uri_or_alias,
@@ -184,3 +186,24 @@ def test_resolve_uri_or_alias_raises_install_error(config, uri, alias):
         resolve_uri_or_alias("other", store_path)
     with pytest.raises(InstallError):
         resolve_uri_or_alias("foo://", store_path)
+
+
+def test_display_packages_in_order(caplog):
+    all_releases = {
+        "owned": (("1.0.0", "ipfs://Qm1"), ("2.0.0", "ipfs://Qm2")),
+        "wallet": (("1.0.0", "ipfs://Qm3"),),
+        "standard-token": (("1.0.0", "ipfs://Qm4"),),
+    }
+
+    with caplog.at_level(logging.INFO):
+        display_packages(tuple(all_releases), all_releases)
+
+    displayed_packages = [
+        record.getMessage()
+        for record in caplog.records
+        if "Retrieving all releases" in record.getMessage()
+    ]
+    assert len(displayed_packages) == 3
+    for package_name, displayed in zip(all_releases, displayed_packages):
+        assert package_name in displayed
+    assert "ipfs://Qm2" in caplog.text
@@ -0,0 +1,190 @@
+import json
+
+import pytest
+from web3 import Web3
+
+from ethpm_cli._utils import batch
+from ethpm_cli.commands import registry_cache as registry_cache_module
+from ethpm_cli.commands.registry_cache import (
+    RegistryCache,
+    read_package_names,
+    read_package_releases,
+)
+from ethpm_cli.constants import CONFIRMATIONS
+
+
+@pytest.fixture
+def w3():
+    w3 = Web3(Web3.EthereumTesterProvider())
+    w3.enable_unstable_package_management_api()
+    w3.eth.defaultAccount = w3.eth.accounts[0]
+    w3.pm.deploy_and_set_registry()
+    return w3
+
+
+def release(w3, package_name, version, manifest_uri):
+    tx_hash = w3.pm.registry.registry.functions.release(
+        package_name, version, manifest_uri
+    ).transact()
+    w3.eth.waitForTransactionReceipt(tx_hash)
+
+
+def disable_registry_reads(w3, monkeypatch):
+    def fail(*args):
+        raise AssertionError("Registry state read despite cached releases.")
+
+    monkeypatch.setattr(w3.pm, "get_all_package_names", fail)
+    monkeypatch.setattr(w3.pm, "get_all_package_releases", fail)
+    monkeypatch.setattr(registry_cache_module, "batch_call", fail)
+
+
+def test_registry_cache_reads_registry_once(w3, tmp_path, monkeypatch):
+    registry_address = w3.pm.registry.address
+    release(w3, "owned", "1.0.0", "ipfs://Qm1")
+    release(w3, "wallet", "1.0.0", "ipfs://Qm2")
+    registry_cache = RegistryCache(tmp_path)
+    assert registry_cache.get_package_names(w3, registry_address, 1) == (
+        "owned",
+        "wallet",
+    )
+    assert registry_cache.get_package_releases(w3, registry_address, 1, "owned") == (
+        ("1.0.0", "ipfs://Qm1"),
+    )
+
+    disable_registry_reads(w3, monkeypatch)
+    reloaded_cache = RegistryCache(tmp_path)
+    assert reloaded_cache.get_package_releases(w3, registry_address, 1, "owned") == (
+        ("1.0.0", "ipfs://Qm1"),
+    )
+    manifest_uri = reloaded_cache.get_manifest_uri(
+        w3, registry_address, 1, "owned", "1.0.0"
+    )
+    assert manifest_uri == "ipfs://Qm1"
+
+
+def test_registry_cache_refreshes_from_version_release_logs(w3, tmp_path, monkeypatch):
+    registry_address = w3.pm.registry.address
+    release(w3, "owned", "1.0.0", "ipfs://Qm1")
+    RegistryCache(tmp_path).get_package_releases(w3, registry_address, 1, "owned")
+
+    release(w3, "owned", "2.0.0", "ipfs://Qm2")
+    release(w3, "wallet", "1.0.0", "ipfs://Qm3")
+    disable_registry_reads(w3, monkeypatch)
+    registry_cache = RegistryCache(tmp_path)
+    assert registry_cache.get_package_names(w3, registry_address, 1) == (
+        "owned",
+        "wallet",
+    )
+    assert registry_cache.get_package_releases(w3, registry_address, 1, "owned") == (
+        ("1.0.0", "ipfs://Qm1"),
+        ("2.0.0", "ipfs://Qm2"),
+    )
+
+
+def test_registry_cache_rereads_unconfirmed_blocks(w3, tmp_path, monkeypatch):
+    registry_address = w3.pm.registry.address
+    w3.testing.mine(CONFIRMATIONS * 2)
+    release(w3, "owned", "1.0.0", "ipfs://Qm1")
+    RegistryCache(tmp_path).get_package_names(w3, registry_address, 1)
+    cache_path = tmp_path / "1" / f"{registry_address}.json"
+    cached_block = json.loads(cache_path.read_text())["block_number"]
+    assert cached_block == w3.eth.blockNumber - CONFIRMATIONS
+
+    requested_logs = []
+
+    def get_block_version_release_logs(w3, from_block, to_block, address):
+        requested_logs.append((from_block, to_block, address))
+        return []
+
+    monkeypatch.setattr(
+        registry_cache_module,
+        "get_block_version_release_logs",
+        get_block_version_release_logs,
+    )
+    w3.testing.mine(1)
+    RegistryCache(tmp_path).get_package_names(w3, registry_address, 1)
+    assert requested_logs == [(cached_block + 1, w3.eth.blockNumber, registry_address)]
+    refreshed_block = json.loads(cache_path.read_text())["block_number"]
+    assert refreshed_block == w3.eth.blockNumber - CONFIRMATIONS
+
+
+def test_registry_cache_refreshes_from_its_own_registry_logs(w3, tmp_path):
+    registry_address = w3.pm.registry.address
+    release(w3, "owned", "1.0.0", "ipfs://Qm1")
+    RegistryCache(tmp_path).get_package_names(w3, registry_address, 1)
+
+    w3.pm.deploy_and_set_registry()
+    release(w3, "wallet", "1.0.0", "ipfs://Qm2")
+    assert RegistryCache(tmp_path).get_package_names(w3, registry_address, 1) == (
+        "owned",
+    )
+
+
+@pytest.fixture
+def batch_requests(w3, monkeypatch):
+    """
+    Routes batched calls through eth-tester as if it were an HTTP node, and
+    records every batch request sent.
+    """
+    sent_batches = []
+
+    def send_batch_request(provider, requests):
+        sent_batches.append(requests)
+        return [
+            {
+                "id": request["id"],
+                "result": w3.manager.request_blocking(
+                    request["method"], request["params"]
+                ).hex(),
+            }
+            for request in requests
+        ]
+
+    monkeypatch.setattr(batch, "supports_batch_requests", lambda provider: True)
+    monkeypatch.setattr(batch, "send_batch_request", send_batch_request)
+    return sent_batches
+
+
+def test_registry_reads_are_batched(w3, batch_requests, monkeypatch):
+    monkeypatch.setattr(registry_cache_module, "PAGE_SIZE", 2)
+    package_names = ["owned", "wallet", "standard-token", "safe-math", "escrow"]
+    for package_name in package_names:
+        for version in ("1.0.0", "2.0.0", "3.0.0"):
+            release(w3, package_name, version, f"ipfs://Qm{package_name}{version}")
+
+    assert read_package_names(w3) == list(w3.pm.get_all_package_names())
+    assert len(batch_requests) == 2
+
+    all_package_releases = read_package_releases(w3, package_names)
+    assert all_package_releases == {
+        package_name: list(w3.pm.get_all_package_releases(package_name))
+        for package_name in package_names
+    }
+    # one batch each for release counts, release ids and release data
+    assert len(batch_requests) == 5
+
+
+def test_registry_cache_reads_all_package_releases_together(
+    w3, tmp_path, batch_requests
+):
+    registry_address = w3.pm.registry.address
+    release(w3, "owned", "1.0.0", "ipfs://Qm1")
+    release(w3, "wallet", "1.0.0", "ipfs://Qm2")
+    release(w3, "wallet", "2.0.0", "ipfs://Qm3")
+    registry_cache = RegistryCache(tmp_path)
+    package_names = registry_cache.get_package_names(w3, registry_address, 1)
+    sent_batches = len(batch_requests)
+
+    all_package_releases = registry_cache.get_all_package_releases(
+        w3, registry_address, 1, package_names
+    )
+    assert all_package_releases == {
+        "owned": (("1.0.0", "ipfs://Qm1"),),
+        "wallet": (("1.0.0", "ipfs://Qm2"), ("2.0.0", "ipfs://Qm3")),
+    }
+    assert len(batch_requests) == sent_batches + 3
+    assert registry_cache.get_package_releases(w3, registry_address, 1, "wallet") == (
+        ("1.0.0", "ipfs://Qm2"),
+        ("2.0.0", "ipfs://Qm3"),
+    )
+    assert len(batch_requests) == sent_batches + 3
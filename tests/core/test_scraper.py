@@ -7,9 +7,19 @@ from web3 import Web3
 from web3.tools.pytest_ethereum.deployer import Deployer
 
 from ethpm_cli import CLI_ASSETS_DIR
+from ethpm_cli._utils import ipfs, release_logs
 from ethpm_cli._utils.filesystem import check_dir_trees_equal
+from ethpm_cli._utils.release_index import ReleaseIndex
+from ethpm_cli._utils.timestamps import BlockTimestampIndex
 from ethpm_cli._utils.xdg import get_xdg_ethpmcli_root
-from ethpm_cli.commands.scraper import get_ethpm_birth_block, scrape
+from ethpm_cli.commands import scraper
+from ethpm_cli.commands.scraper import (
+    ScrapeCheckpointLog,
+    follow,
+    get_ethpm_birth_block,
+    scrape,
+    scrape_chains,
+)
 from ethpm_cli.exceptions import BlockNotFoundError
 
 
@@ -126,6 +136,103 @@ def test_scraper_writes_to_disk(log, log_2, test_assets_dir, w3):
     assert check_dir_trees_equal(ethpmcli_dir, (test_assets_dir.parent / "ipfs"))
 
 
+def test_scraper_populates_release_index(log, log_2, w3, tmp_path, monkeypatch):
+    release(log, w3, "owned", "1.0.0", "ipfs://Qm1")
+    release(log_2, w3, "owned-dupe", "1.0.0", "ipfs://Qm1")
+    release(log, w3, "owned", "2.0.0", "ipfs://Qm2")
+    w3.testing.mine(3)
+    release_index = ReleaseIndex(tmp_path / "releases.db")
+    # Releases point at placeholder URIs, so skip fetching their assets
+    monkeypatch.setattr(scraper, "write_ipfs_uris_to_disk", lambda *args: None)
+    scrape(w3, get_xdg_ethpmcli_root(), 1, release_index=release_index)
+
+    actual = release_index.search()
+    assert [(indexed.registry_address, indexed.release[:3]) for indexed in actual] == [
+        (log.address, ("owned", "1.0.0", "ipfs://Qm1")),
+        (log_2.address, ("owned-dupe", "1.0.0", "ipfs://Qm1")),
+        (log.address, ("owned", "2.0.0", "ipfs://Qm2")),
+    ]
+    release_index.close()
+
+
+def test_follow_scrapes_new_blocks_and_rescrapes_reorgs(log, w3, tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, "write_ipfs_uris_to_disk", lambda *args: None)
+    release_index = ReleaseIndex(tmp_path / "releases.db")
+    ethpmcli_dir = get_xdg_ethpmcli_root()
+    release(log, w3, "owned", "1.0.0", "ipfs://Qm1")
+    w3.testing.mine(3)
+    following = follow(
+        w3, ethpmcli_dir, 1, release_index=release_index, poll_interval=0
+    )
+    assert next(following) == w3.eth.blockNumber
+
+    snapshot = w3.testing.snapshot()
+    release(log, w3, "owned", "2.0.0", "ipfs://Qm2")
+    w3.testing.mine(1)
+    assert next(following) == w3.eth.blockNumber
+    assert [indexed.release.version for indexed in release_index.search()] == [
+        "1.0.0",
+        "2.0.0",
+    ]
+
+    # Replace the blocks holding owned==2.0.0 with a longer fork
+    w3.testing.revert(snapshot)
+    release(log, w3, "wallet", "1.0.0", "ipfs://Qm3")
+    w3.testing.mine(3)
+    assert next(following) == w3.eth.blockNumber
+    actual = [indexed.release[:2] for indexed in release_index.search()]
+    assert actual == [("owned", "1.0.0"), ("wallet", "1.0.0")]
+    chain_data_path = ethpmcli_dir / "chain_data.json"
+    assert list(scraper.get_scraped_blocks(chain_data_path)) == [
+        (0, w3.eth.blockNumber - 1)
+    ]
+    # Polls only append to the checkpoint log
+    assert scraper.get_checkpoint_log_path(chain_data_path).exists()
+
+    following.close()
+    expected_chain_data = {
+        "chain_id": 1,
+        "scraped_blocks": [{"min": "0", "max": str(w3.eth.blockNumber - 1)}],
+    }
+    assert json.loads(chain_data_path.read_text()) == expected_chain_data
+    assert not scraper.get_checkpoint_log_path(chain_data_path).exists()
+    release_index.close()
+
+
+def test_scrape_chains_tracks_each_chain_and_shares_ipfs_assets(log, w3, monkeypatch):
+    w3_2 = Web3(Web3.EthereumTesterProvider())
+    log_2 = (
+        Deployer(Package(json.loads((CLI_ASSETS_DIR / "v3.json").read_text()), w3_2))
+        .deploy("Log")
+        .deployments.get_instance("Log")
+    )
+    owned_uri = "ipfs://QmcxvhkJJVpbxEAa6cgW3B6XwPJb79w9GpNUv2P2THUzZR"
+    release(log, w3, "owned", "1.0.0", owned_uri)
+    w3.testing.mine(3)
+    release(log_2, w3_2, "owned", "1.0.0", owned_uri)
+    w3_2.testing.mine(5)
+
+    resolved_uris = []
+    resolve_uri_contents = ipfs.resolve_uri_contents
+
+    def resolve_and_record_uri_contents(uri):
+        resolved_uris.append(uri)
+        return resolve_uri_contents(uri)
+
+    monkeypatch.setattr(ipfs, "resolve_uri_contents", resolve_and_record_uri_contents)
+    ethpmcli_dir = get_xdg_ethpmcli_root()
+    actual = scrape_chains({3: w3, 5: w3_2}, ethpmcli_dir, 1)
+
+    assert actual == {3: w3.eth.blockNumber, 5: w3_2.eth.blockNumber}
+    for chain_id, latest_block in actual.items():
+        chain_data_path = ethpmcli_dir / "chain_data" / f"{chain_id}.json"
+        assert json.loads(chain_data_path.read_text()) == {
+            "chain_id": chain_id,
+            "scraped_blocks": [{"min": "0", "max": str(latest_block - 1)}],
+        }
+    assert resolved_uris.count(owned_uri) == 1
+
+
 def test_scraper_imports_existing_ethpmcli_dir(log, log_2, test_assets_dir, w3):
     release(
         log,
@@ -161,6 +268,183 @@ def test_scraper_imports_existing_ethpmcli_dir(log, log_2, test_assets_dir, w3):
     assert check_dir_trees_equal(ethpmcli_dir, (test_assets_dir.parent / "ipfs"))
 
 
+@pytest.mark.parametrize("jobs", (1, 4))
+def test_scraper_pipeline_checkpoints_block_ranges_in_order(
+    log, log_2, test_assets_dir, w3, jobs
+):
+    release(
+        log,
+        w3,
+        "owned",
+        "1.0.0",
+        "ipfs://QmcxvhkJJVpbxEAa6cgW3B6XwPJb79w9GpNUv2P2THUzZR",
+    )
+
+    w3.testing.mine(3)
+    release(
+        log_2,
+        w3,
+        "wallet",
+        "1.0.0",
+        "ipfs://QmRALeFkttSr6DLmPiNtAqLcMJYXu4BK3SjZGVgW8VASnm",
+    )
+
+    w3.testing.mine(7)
+    ethpmcli_dir = get_xdg_ethpmcli_root()
+    scrape(w3, ethpmcli_dir, 1, jobs, min_batch_size=1, max_batch_size=2)
+
+    assert check_dir_trees_equal(ethpmcli_dir, (test_assets_dir.parent / "ipfs"))
+
+
+@pytest.fixture
+def chain_data_path(tmp_path):
+    chain_data_path = tmp_path / "chain_data.json"
+    chain_data = {"chain_id": 1, "scraped_blocks": [{"min": "0", "max": "9"}]}
+    chain_data_path.write_text(json.dumps(chain_data))
+    return chain_data_path
+
+
+def test_checkpoint_log_appends_until_compacted(chain_data_path):
+    checkpoint_log = ScrapeCheckpointLog(chain_data_path, compaction_interval=3)
+    checkpoint_log.record(10, 20)
+    checkpoint_log.record(30, 40)
+    assert json.loads(chain_data_path.read_text())["scraped_blocks"] == [
+        {"min": "0", "max": "9"}
+    ]
+    assert list(scraper.get_scraped_blocks(chain_data_path)) == [(0, 19), (30, 39)]
+
+    checkpoint_log.record(20, 30)
+    assert not checkpoint_log.log_path.exists()
+    assert json.loads(chain_data_path.read_text()) == {
+        "chain_id": 1,
+        "scraped_blocks": [{"min": "0", "max": "39"}],
+    }
+
+
+def test_checkpoint_log_replays_interrupted_scrape(chain_data_path):
+    ScrapeCheckpointLog(chain_data_path).record(10, 20)
+    # Crash while appending a checkpoint
+    with (chain_data_path.parent / "chain_data.log").open("a") as log_file:
+        log_file.write('{"min": "20", "ma')
+
+    assert list(scraper.get_scraped_blocks(chain_data_path)) == [(0, 19)]
+    checkpoint_log = ScrapeCheckpointLog(chain_data_path)
+    checkpoint_log.compact()
+    assert json.loads(chain_data_path.read_text())["scraped_blocks"] == [
+        {"min": "0", "max": "19"}
+    ]
+
+
+def test_get_block_version_release_logs_decodes_version_releases(log, w3):
+    release(
+        log,
+        w3,
+        "owned",
+        "1.0.0",
+        "ipfs://QmcxvhkJJVpbxEAa6cgW3B6XwPJb79w9GpNUv2P2THUzZR",
+    )
+    w3.testing.mine(3)
+
+    logs = release_logs.get_block_version_release_logs(w3, 0, w3.eth.blockNumber)
+
+    assert len(logs) == 1
+    assert logs[0]["address"] == log.address
+    assert dict(logs[0]["args"]) == {
+        "packageName": "owned",
+        "version": "1.0.0",
+        "manifestURI": "ipfs://QmcxvhkJJVpbxEAa6cgW3B6XwPJb79w9GpNUv2P2THUzZR",
+    }
+
+
+def test_format_version_release_logs_keeps_every_release():
+    def log_entry(address, name, version, block_number):
+        return {
+            "address": address,
+            "blockNumber": block_number,
+            "transactionHash": bytes([block_number]) * 32,
+            "logIndex": 0,
+            "args": {
+                "packageName": name,
+                "version": version,
+                "manifestURI": f"ipfs://Qm{name}{version}",
+            },
+        }
+
+    entries = [
+        log_entry("0xA", "owned", "1.0.0", 1),
+        log_entry("0xB", "wallet", "1.0.0", 2),
+        log_entry("0xA", "owned", "2.0.0", 3),
+    ]
+
+    assert scraper.format_version_release_logs(entries) == {
+        "0xA": [
+            scraper.Release(
+                "owned", "1.0.0", "ipfs://Qmowned1.0.0", 1, "0x" + "01" * 32, 0
+            ),
+            scraper.Release(
+                "owned", "2.0.0", "ipfs://Qmowned2.0.0", 3, "0x" + "03" * 32, 0
+            ),
+        ],
+        "0xB": [
+            scraper.Release(
+                "wallet", "1.0.0", "ipfs://Qmwallet1.0.0", 2, "0x" + "02" * 32, 0
+            )
+        ],
+    }
+
+
+class FakeMirror:
+    def __init__(self, manifests):
+        self.manifests = manifests
+        self.fetched_uris = []
+
+    def fetch(self, uri):
+        self.fetched_uris.append(uri)
+        return json.dumps(self.manifests[uri]).encode()
+
+
+def test_manifest_graph_fetches_each_manifest_once():
+    library = "ipfs://QmLibrary"
+    source = "ipfs://QmSource"
+    manifests = {
+        library: {"sources": {"Lib.sol": {"urls": [source]}}},
+        "ipfs://QmTokenA": {"buildDependencies": {"library": library}},
+        "ipfs://QmTokenB": {"buildDependencies": {"library": library}},
+    }
+    mirror = FakeMirror(manifests)
+    manifest_graph = scraper.ManifestGraph(mirror)
+
+    ipfs_uris = manifest_graph.get_ipfs_uris(["ipfs://QmTokenA", "ipfs://QmTokenB"])
+
+    assert ipfs_uris == {"ipfs://QmTokenA", "ipfs://QmTokenB", library, source}
+    assert sorted(mirror.fetched_uris) == sorted(manifests)
+
+
+def test_manifest_graph_does_not_follow_dependency_cycles():
+    manifests = {
+        "ipfs://QmA": {"buildDependencies": {"b": "ipfs://QmB"}},
+        "ipfs://QmB": {"buildDependencies": {"a": "ipfs://QmA"}},
+    }
+    mirror = FakeMirror(manifests)
+    manifest_graph = scraper.ManifestGraph(mirror)
+
+    assert manifest_graph.get_ipfs_uris(["ipfs://QmA"]) == {"ipfs://QmA", "ipfs://QmB"}
+    assert sorted(mirror.fetched_uris) == ["ipfs://QmA", "ipfs://QmB"]
+
+
+def test_manifest_graph_does_not_memoize_closures_cut_by_cycles():
+    manifests = {
+        "ipfs://QmA": {"buildDependencies": {"b": "ipfs://QmB"}},
+        "ipfs://QmB": {"buildDependencies": {"a": "ipfs://QmA"}},
+    }
+    mirror = FakeMirror(manifests)
+    manifest_graph = scraper.ManifestGraph(mirror)
+
+    assert manifest_graph.get_ipfs_uris(["ipfs://QmA"]) == {"ipfs://QmA", "ipfs://QmB"}
+    assert manifest_graph.get_ipfs_uris(["ipfs://QmB"]) == {"ipfs://QmA", "ipfs://QmB"}
+    assert sorted(mirror.fetched_uris) == ["ipfs://QmA", "ipfs://QmB"]
+
+
 @pytest.mark.parametrize("interval", (40, 400, 4000))
 def test_get_ethpm_birth_block(w3, interval):
     time_travel(w3, interval)
@@ -170,6 +454,55 @@ def test_get_ethpm_birth_block(w3, interval):
     assert actual == latest_block.number - 1
 
 
+class FakeChain:
+    def __init__(self, block_count, block_time=13):
+        self.timestamps = [
+            1_500_000_000 + block_time * block for block in range(block_count)
+        ]
+        self.requested_blocks = []
+        self.eth = self
+
+    def getBlock(self, block_number):
+        self.requested_blocks.append(block_number)
+        return {"timestamp": self.timestamps[block_number]}
+
+
+def test_get_ethpm_birth_block_interpolates_block_timestamps():
+    chain = FakeChain(1_000_000)
+    target_timestamp = chain.timestamps[777_777]
+
+    actual = get_ethpm_birth_block(chain, 0, 999_999, target_timestamp)
+
+    assert actual == 777_776
+    # A binary search would need ~20 lookups
+    assert len(chain.requested_blocks) < 10
+
+
+def test_get_ethpm_birth_block_reuses_block_index(tmp_path):
+    chain = FakeChain(1_000_000)
+    target_timestamp = chain.timestamps[777_777]
+    index_path = tmp_path / "block_timestamps" / "1.json"
+    get_ethpm_birth_block(
+        chain, 0, 999_999, target_timestamp, BlockTimestampIndex(index_path)
+    )
+    chain.requested_blocks.clear()
+
+    actual = get_ethpm_birth_block(
+        chain, 0, 999_999, target_timestamp, BlockTimestampIndex(index_path)
+    )
+
+    assert actual == 777_776
+    assert chain.requested_blocks == []
+
+
+@pytest.mark.parametrize("block_time", (0, 13))
+def test_get_ethpm_birth_block_target_after_last_block_raises_exception(block_time):
+    chain = FakeChain(1000, block_time)
+    target_timestamp = chain.timestamps[-1] + 100
+    with pytest.raises(BlockNotFoundError):
+        get_ethpm_birth_block(chain, 0, 999, target_timestamp)
+
+
 def test_get_ethpm_birth_block_equal_blocks_raises_exception(w3):
     latest_block = w3.eth.getBlock("latest")
     with pytest.raises(BlockNotFoundError):
@@ -5,7 +5,13 @@ import pytest
 
 from ethpm_cli.constants import ETHPM_PACKAGES_DIR
 from ethpm_cli.exceptions import InstallError, UriNotSupportedError, ValidationError
-from ethpm_cli.validation import validate_install_cli_args, validate_same_registry
+from ethpm_cli.validation import (
+    validate_batch_size_bounds,
+    validate_install_cli_args,
+    validate_same_registry,
+    validate_scrape_cli_args,
+    validate_update_cli_args,
+)
 
 
 @pytest.fixture
@@ -130,3 +136,50 @@ def test_validate_same_registry_validates_matching_registries(left, right):
 def test_validate_same_registry_invalidates_nonmatching_registries(left, right):
     with pytest.raises(ValidationError):
         validate_same_registry(left, right)
+
+
+@pytest.mark.parametrize(
+    "chain_ids,chain_id,follow", (([1, 3], 5, False), ([1, 3], None, True))
+)
+def test_validate_scrape_cli_args_rejects_invalid_args(chain_ids, chain_id, follow):
+    args = Namespace(chain_ids=chain_ids, chain_id=chain_id, follow=follow)
+
+    with pytest.raises(ValidationError):
+        validate_scrape_cli_args(args)
+
+
+@pytest.mark.parametrize(
+    "package,update_all,target_version",
+    (("owned", False, None), ("owned", False, "latest"), (None, True, "1.0.0")),
+)
+def test_validate_update_cli_args(package, update_all, target_version):
+    args = Namespace(
+        package=package, all=update_all, target_version=target_version, ethpm_dir=None,
+    )
+
+    assert validate_update_cli_args(args) is None
+
+
+@pytest.mark.parametrize(
+    "package,update_all,target_version",
+    ((None, False, None), ("owned", True, "latest"), (None, True, None)),
+)
+def test_validate_update_cli_args_rejects_invalid_args(
+    package, update_all, target_version
+):
+    args = Namespace(
+        package=package, all=update_all, target_version=target_version, ethpm_dir=None,
+    )
+
+    with pytest.raises(ValidationError):
+        validate_update_cli_args(args)
+
+
+@pytest.mark.parametrize(
+    "min_batch_size,max_batch_size", ((0, 100), (-1, 100), (200, 100))
+)
+def test_validate_batch_size_bounds_rejects_invalid_bounds(
+    min_batch_size, max_batch_size
+):
+    with pytest.raises(ValidationError, match="Invalid batch size bounds"):
+        validate_batch_size_bounds(min_batch_size, max_batch_size)